@@ -4,6 +4,9 @@ mlte/backend/api/auth/authentication.py
 Authentication handling.
 """
 
+import asyncio
+
+from mlte.backend.state import state
 from mlte.store.user.store import UserStoreSession
 from mlte.user import passwords
 
@@ -24,3 +27,29 @@ def authenticate_user(
         return False
     else:
         return True
+
+
+async def authenticate_user_async(
+    username: str, password: str, user_store_session: UserStoreSession
+) -> bool:
+    """
+    Validates the credentials, verifying the password in the password pool
+    so that the event loop keeps serving other requests meanwhile.
+    """
+    try:
+        user = user_store_session.read_user(username)
+    except Exception:
+        # Assume any exception means we couldn't load user it.
+        return False
+    return await verify_password(password, user.hashed_password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verifies a password against a hash, in the password pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        state.password_pool,
+        passwords.verify_password,
+        plain_password,
+        hashed_password,
+    )
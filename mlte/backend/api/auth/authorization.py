@@ -4,18 +4,27 @@ mlte/backend/api/auth/authorization.py
 Setup of OAuth based authorization checks.
 """
 
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from typing_extensions import Annotated
 
+import mlte.store.error as errors
 from mlte.backend.api import codes, dependencies
 from mlte.backend.api.auth import jwt
 from mlte.backend.api.auth.http_auth_exception import HTTPAuthException
 from mlte.backend.api.endpoints.token import TOKEN_ENDPOINT_URL
 from mlte.backend.core.config import settings
 from mlte.backend.state import state
+from mlte.backend.util.logs import SamplingFilter
 from mlte.user.model import BasicUser
 
+logger = logging.getLogger(__name__)
+logger.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATE))
+
 # -----------------------------------------------------------------------------
 # Helper functions.
 # -----------------------------------------------------------------------------
@@ -29,7 +38,7 @@ async def get_resource(request: Request) -> str:
     # TODO: define better way to encapsulate this.
     resource_url = url.replace(settings.API_PREFIX, "")
     resource = f"{resource_url}-{method}"
-    print(f"Resource: {resource}")
+    logger.debug("Resource: %s", resource)
     return resource
 
 
@@ -40,6 +49,43 @@ def get_username_from_token(token: str, key: str) -> str:
     return decoded_token.username
 
 
+def get_cached_username_from_token(token: str, key: str) -> str:
+    """
+    Obtains a user from an encoded token, if the token is valid, reusing
+    the result of recent decodes of the same token.
+    """
+    username = state.token_cache.get(token)
+    if username is None:
+        decoded_token = jwt.decode_user_token(token, key)
+        username = decoded_token.username
+        # A token is never cached beyond its expiration.
+        remaining = decoded_token.expiration_time - datetime.now(timezone.utc)
+        state.token_cache.put(token, username, ttl=remaining.total_seconds())
+    return username
+
+
+def get_cached_user(username: str) -> Optional[BasicUser]:
+    """
+    Gets a user from the user store, reusing recent reads of the same user.
+    Entries are dropped when the user is written through the API sessions of
+    this process; see dependencies.user_store_session().
+    """
+    user = state.user_cache.get(username)
+    if user is None:
+        # A user written while it is read here is not cached stale.
+        generation = state.user_cache.generation()
+        try:
+            with dependencies.user_store_session() as handle:
+                stored_user = handle.read_user(username)
+        except errors.ErrorNotFound:
+            return None
+
+        # Convert to simple user version to avoid including hashed password.
+        user = BasicUser(**stored_user.model_dump())
+        state.user_cache.put(username, user, generation=generation)
+    return user
+
+
 def is_authorized(current_user: BasicUser, resource: str) -> bool:
     """Checks if the current user is authorized to access the current resource."""
     # TODO: define resource names/actions as enum or similar
@@ -48,8 +94,10 @@ def is_authorized(current_user: BasicUser, resource: str) -> bool:
     # TODO: define if roles will be used for this.
 
     # For now any authenticated user is authorized to everything.
-    print(
-        f"Checking authorization for user {current_user.username} to resource {resource}"
+    logger.debug(
+        "Checking authorization for user %s to resource %s",
+        current_user.username,
+        resource,
     )
     return True
 
@@ -78,7 +126,7 @@ async def get_authorized_user(
     """
     # Validate token and get username.
     try:
-        username = get_username_from_token(token, state.token_key)
+        username = get_cached_username_from_token(token, state.token_key)
     except Exception as ex:
         raise HTTPAuthException(
             error="invalid_token",
@@ -86,9 +134,7 @@ async def get_authorized_user(
         )
 
     # Check if user in token exists.
-    user = None
-    with dependencies.user_store_session() as handle:
-        user = handle.read_user(username)
+    user = get_cached_user(username)
     if user is None:
         raise HTTPAuthException(
             error="invalid_token",
@@ -108,9 +154,7 @@ async def get_authorized_user(
             detail="User is not authorized to access this resource.",
         )
 
-    # Convert to simple user version to avoid including hashed password.
-    basic_user = BasicUser(**user.model_dump())
-    return basic_user
+    return user
 
 
 AuthorizedUser = Annotated[BasicUser, Depends(get_authorized_user)]
@@ -0,0 +1,84 @@
+"""
+mlte/backend/api/caching.py
+
+Conditional GET support for API responses.
+
+Responses carry a weak ETag, the hash of their body, and requests that
+send back a matching If-None-Match get an empty 304 reply instead. The tag
+is weak as the compression middleware may send the body gzip or brotli
+encoded, and a strong tag must differ between content codings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+import mlte.backend.api.codes as codes
+
+JSON_MEDIA_TYPE = "application/json"
+"""The media type of JSON responses."""
+
+CACHE_CONTROL = "private, no-cache"
+"""Clients may keep responses, but must revalidate them before reuse."""
+
+
+def etag_for(content: bytes) -> str:
+    """
+    Compute the ETag of a response body.
+    :param content: The response body
+    :return: The weak ETag
+    """
+    return weak_etag(hashlib.sha256(content).hexdigest())
+
+
+def weak_etag(value: str) -> str:
+    """
+    Make a weak ETag.
+    :param value: The opaque value of the tag
+    :return: The weak ETag
+    """
+    return f'W/"{value}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check whether an If-None-Match header matches an ETag.
+
+    As per RFC 9110, If-None-Match uses weak comparison.
+    :param if_none_match: The value of the header, if sent
+    :param etag: The ETag of the current representation
+    :return: True if the client already has the current representation
+    """
+    if if_none_match is None:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or _opaque(etag) in [
+        _opaque(tag) for tag in candidates
+    ]
+
+
+def _opaque(etag: str) -> str:
+    """Strip the weakness indicator of an ETag, for weak comparison."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def conditional_response(
+    request: Request,
+    content: bytes,
+    media_type: str = JSON_MEDIA_TYPE,
+) -> Response:
+    """
+    Build a response that carries an ETag, or a 304 if the client has it.
+    :param request: The request being answered
+    :param content: The serialized response body
+    :param media_type: The media type of the body
+    :return: The response
+    """
+    etag = etag_for(content)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=codes.NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
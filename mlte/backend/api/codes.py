@@ -7,6 +7,9 @@ Status codes for MLTE artifact store.
 OK = 200
 """HTTP 'OK'"""
 
+NOT_MODIFIED = 304
+"""HTTP 'Not Modified'"""
+
 BAD_REQUEST = 400
 """HTTP 'Bad Request'"""
 
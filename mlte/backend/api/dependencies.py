@@ -13,11 +13,13 @@ solution that involves manual context management with a global state object.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator, Union
 
+from mlte.backend.api.metrics import instrument_session
 from mlte.backend.state import state
 from mlte.store.artifact.store import ArtifactStoreSession
 from mlte.store.user.store import UserStoreSession
+from mlte.user.model import BasicUser, User, UserCreate
 
 
 @contextmanager
@@ -28,7 +30,7 @@ def artifact_store_session() -> Generator[ArtifactStoreSession, None, None]:
     """
     session: ArtifactStoreSession = state.artifact_store.session()
     try:
-        yield session
+        yield instrument_session(session)
     finally:
         session.close()
 
@@ -41,6 +43,38 @@ def user_store_session() -> Generator[UserStoreSession, None, None]:
     """
     session: UserStoreSession = state.user_store.session()
     try:
-        yield session
+        yield _UserCacheSession(session)  # type: ignore[misc]
     finally:
         session.close()
+
+
+class _UserCacheSession:
+    """
+    A proxy that drops users from the authentication cache of this process
+    as they are written. Other worker processes keep their cached users
+    until these expire; see settings.AUTH_CACHE_TTL.
+    """
+
+    def __init__(self, session: UserStoreSession) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def create_user(self, user: UserCreate) -> User:
+        try:
+            return self._session.create_user(user)
+        finally:
+            state.user_cache.invalidate(user.username)
+
+    def edit_user(self, user: Union[UserCreate, BasicUser]) -> User:
+        try:
+            return self._session.edit_user(user)
+        finally:
+            state.user_cache.invalidate(user.username)
+
+    def delete_user(self, username: str) -> User:
+        try:
+            return self._session.delete_user(username)
+        finally:
+            state.user_cache.invalidate(username)
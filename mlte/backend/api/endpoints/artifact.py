@@ -6,10 +6,11 @@ API definition for MLTE artifacts.
 
 from __future__ import annotations
 
-import traceback
-from typing import List
+import logging
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
 from typing_extensions import Annotated
 
 import mlte.backend.api.codes as codes
@@ -17,13 +18,27 @@ import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.backend.api import dependencies
 from mlte.backend.api.auth.authorization import get_authorized_user
-from mlte.backend.api.model import WriteArtifactRequest, WriteArtifactResponse
+from mlte.backend.api.caching import conditional_response
+from mlte.backend.api.model import (
+    BatchArtifactsResponse,
+    BatchItemResult,
+    ReadArtifactsRequest,
+    WriteArtifactRequest,
+    WriteArtifactResponse,
+    WriteArtifactsRequest,
+)
 from mlte.store.artifact.query import Query
+from mlte.store.artifact.store import ArtifactResult
 from mlte.user.model import BasicUser
 
+logger = logging.getLogger(__name__)
+
 # The router exported by this submodule
 router = APIRouter()
 
+_ARTIFACT_LIST = TypeAdapter(List[ArtifactModel])
+"""Serializes lists of artifacts."""
+
 
 @router.post("")
 def write_artifact(
@@ -59,22 +74,90 @@ def write_artifact(
                 status_code=codes.ALREADY_EXISTS, detail=f"{e} already exists."
             )
         except Exception:
-            print(traceback.format_exc())
+            logger.exception("Failed to write artifact.")
+            raise HTTPException(
+                status_code=codes.INTERNAL_ERROR,
+                detail="Internal server error.",
+            )
+
+
+@router.post("/batch")
+def write_artifacts(
+    model_id: str,
+    version_id: str,
+    request: WriteArtifactsRequest,
+    current_user: Annotated[BasicUser, Depends(get_authorized_user)],
+) -> BatchArtifactsResponse:
+    """
+    Write a batch of artifacts, reporting the outcome of each one.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param request: The artifacts write request
+    :return: The result for each artifact, in request order
+    """
+    with dependencies.artifact_store_session() as artifact_store:
+        try:
+            results = artifact_store.write_artifacts_with_header(
+                model_id,
+                version_id,
+                request.artifacts,
+                force=request.force,
+                parents=request.parents,
+                user=current_user.username,
+            )
+        except Exception:
+            logger.exception("Failed to write artifacts.")
+            raise HTTPException(
+                status_code=codes.INTERNAL_ERROR,
+                detail="Internal server error.",
+            )
+        return BatchArtifactsResponse(
+            results=[_batch_item_result(result) for result in results]
+        )
+
+
+@router.post("/batch/read")
+def read_artifacts_by_ids(
+    model_id: str,
+    version_id: str,
+    request: ReadArtifactsRequest,
+    current_user: Annotated[BasicUser, Depends(get_authorized_user)],
+) -> BatchArtifactsResponse:
+    """
+    Read a batch of artifacts by identifier, reporting the outcome of each one.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param request: The artifacts read request
+    :return: The result for each identifier, in request order
+    """
+    with dependencies.artifact_store_session() as handle:
+        try:
+            results = handle.read_artifacts_by_ids(
+                model_id, version_id, request.artifact_ids
+            )
+        except Exception:
+            logger.exception("Failed to read artifacts.")
             raise HTTPException(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+        return BatchArtifactsResponse(
+            results=[_batch_item_result(result) for result in results]
+        )
 
 
-@router.get("/{artifact_id}")
+@router.get("/{artifact_id}", response_model=ArtifactModel)
 def read_artifact(
     model_id: str,
     version_id: str,
     artifact_id: str,
+    request: Request,
     current_user: Annotated[BasicUser, Depends(get_authorized_user)],
-) -> ArtifactModel:
+) -> Response:
     """
     Read an artifact by identifier.
+
+    The response carries an ETag, and is empty if the client has it.
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param artifact_id: The identifier for the artifact
@@ -82,7 +165,7 @@ def read_artifact(
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.read_artifact(model_id, version_id, artifact_id)
+            artifact = handle.read_artifact(model_id, version_id, artifact_id)
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -92,32 +175,47 @@ def read_artifact(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+    return conditional_response(
+        request, artifact.model_dump_json().encode("utf-8")
+    )
 
 
-@router.get("")
+@router.get("", response_model=List[ArtifactModel])
 def read_artifacts(
     model_id: str,
     version_id: str,
+    request: Request,
     current_user: Annotated[BasicUser, Depends(get_authorized_user)],
     limit: int = 100,
     offset: int = 0,
-) -> List[ArtifactModel]:
+    cursor: Optional[str] = None,
+) -> Response:
     """
-    Read artifacts with limit and offset.
+    Read artifacts with limit and offset, or with limit and cursor.
+
+    The response carries an ETag, and is empty if the client has it.
     :param model_id: The model identifier
     :param version_id: The version identifier
     :param limit: The limit on returned artifacts
     :param offset: The offset on returned artifacts
+    :param cursor: The identifier of the last artifact of the previous page
     :return: The read artifacts
     """
     with dependencies.artifact_store_session() as handle:
         try:
-            return handle.read_artifacts(model_id, version_id, limit, offset)
+            artifacts = handle.read_artifacts(
+                model_id, version_id, limit, offset, cursor
+            )
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
         except Exception:
             raise HTTPException(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+    return conditional_response(request, _ARTIFACT_LIST.dump_json(artifacts))
 
 
 @router.post("/search")
@@ -171,3 +269,25 @@ def delete_artifact(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+
+
+def _batch_item_result(result: ArtifactResult) -> BatchItemResult:
+    """
+    Convert the outcome of a batch item to its response.
+    :param result: The artifact, or the store error the item failed with
+    :return: The response for the item
+    """
+    if isinstance(result, errors.ErrorNotFound):
+        return BatchItemResult(
+            status_code=codes.NOT_FOUND, detail=f"{result} not found."
+        )
+    if isinstance(result, errors.ErrorAlreadyExists):
+        return BatchItemResult(
+            status_code=codes.ALREADY_EXISTS, detail=f"{result} already exists."
+        )
+    if isinstance(result, Exception):
+        logger.error("Failed to process a batch item.", exc_info=result)
+        return BatchItemResult(
+            status_code=codes.INTERNAL_ERROR, detail="Internal server error."
+        )
+    return BatchItemResult(artifact=result)
@@ -0,0 +1,156 @@
+"""
+mlte/store/api/endpoints/blob.py
+
+API definition for the content-addressed blobs that hold large value payloads.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import AsyncIterator, Iterator, Optional, Tuple
+
+import anyio.from_thread
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing_extensions import Annotated
+
+import mlte.backend.api.codes as codes
+import mlte.store.error as errors
+from mlte.backend.api import dependencies
+from mlte.backend.api.auth.authorization import get_authorized_user
+from mlte.backend.api.caching import etag_matches, weak_etag
+from mlte.backend.api.model import WriteBlobResponse
+from mlte.store.artifact.blob import check_digest
+from mlte.user.model import BasicUser
+
+logger = logging.getLogger(__name__)
+
+# The router exported by this submodule
+router = APIRouter()
+
+
+def _write_blob(digest: str, chunks: Iterator[bytes]) -> str:
+    """Write a blob to the artifact store, from its content in chunks."""
+    with dependencies.artifact_store_session() as handle:
+        return handle.write_blob_chunks(chunks, digest)
+
+
+def _read_blob(digest: str) -> Tuple[int, Iterator[bytes]]:
+    """
+    Open a blob in the artifact store, to be read in chunks; the store
+    session stays open until the chunks are read.
+    """
+    stack = contextlib.ExitStack()
+    handle = stack.enter_context(dependencies.artifact_store_session())
+    try:
+        size, chunks = handle.read_blob_chunks(digest)
+    except BaseException:
+        stack.close()
+        raise
+    return size, _closing(chunks, stack)
+
+
+def _closing(
+    chunks: Iterator[bytes], stack: contextlib.ExitStack
+) -> Iterator[bytes]:
+    """Pass chunks through, then close what they are read from."""
+    with stack:
+        yield from chunks
+
+
+def _request_chunks(request: Request) -> Iterator[bytes]:
+    """
+    Read the body of a request in chunks, from a worker thread.
+    :param request: The request
+    :return: The body, in chunks
+    """
+    stream: AsyncIterator[bytes] = request.stream()
+
+    async def receive() -> Optional[bytes]:
+        try:
+            return await stream.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    while True:
+        chunk = anyio.from_thread.run(receive)
+        if chunk is None:
+            return
+        if chunk:
+            yield chunk
+
+
+@router.put("/{digest}")
+async def write_blob(
+    digest: str,
+    request: Request,
+    current_user: Annotated[BasicUser, Depends(get_authorized_user)],
+) -> WriteBlobResponse:
+    """
+    Write a blob, streamed as the raw request body.
+    :param digest: The digest of the blob, which must match its content
+    :return: The digest of the written blob
+    """
+    try:
+        check_digest(digest)
+    except ValueError as e:
+        raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
+
+    # The body is written to the store as it arrives.
+    try:
+        return WriteBlobResponse(
+            digest=await run_in_threadpool(
+                _write_blob, digest, _request_chunks(request)
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
+    except Exception:
+        logger.exception("Failed to write blob.")
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
+
+
+@router.get("/{digest}")
+async def read_blob(
+    digest: str,
+    request: Request,
+    current_user: Annotated[BasicUser, Depends(get_authorized_user)],
+) -> Response:
+    """
+    Read a blob, streamed as the raw response body.
+    :param digest: The digest of the blob
+    :return: The blob content, or an empty response if the client has it
+    """
+    etag = weak_etag(digest)
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=codes.NOT_MODIFIED, headers={"ETag": etag})
+
+    try:
+        size, chunks = await run_in_threadpool(_read_blob, digest)
+    except ValueError as e:
+        raise HTTPException(status_code=codes.BAD_REQUEST, detail=f"{e}")
+    except errors.ErrorNotFound as e:
+        raise HTTPException(
+            status_code=codes.NOT_FOUND, detail=f"{e} not found."
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=codes.INTERNAL_ERROR,
+            detail="Internal server error.",
+        )
+
+    # Blobs are addressed by content, so they never change.
+    return StreamingResponse(
+        chunks,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Length": str(size),
+            "ETag": etag,
+            "Cache-Control": "private, max-age=31536000, immutable",
+        },
+    )
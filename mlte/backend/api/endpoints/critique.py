@@ -1,32 +1,87 @@
+import json
 import traceback
+from typing import Any, Dict
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from mlte.backend.dto.critique import CritiqueStats, SetCritiqueRequest, SetCritiqueResponse
+from mlte.backend.dto.critique import (
+    BulkCritiqueRequest, CritiqueJobResponse, CritiqueStats,
+    SetCritiqueRequest, SetCritiqueResponse)
 from mlte.backend.dto.requirement import GetVersionRequest
 from mlte.backend.services.critique_service import CritiqueService
 
-from mlte.backend.services.config import OPENAI_API_KEY
+from mlte.backend.services.config import (
+    CRITIQUE_JOB_TIMEOUT, CRITIQUE_JOB_WORKERS,
+    LLM_CACHE_MAX_ENTRIES, LLM_CACHE_TTL, LLM_CACHE_URL,
+    LLM_MAX_CONCURRENCY, OPENAI_API_KEY)
 
-from mlte.backend.db.session import get_db
+from mlte.backend.db.models import Artifact
+from mlte.backend.db.session import SessionLocal, get_db
+from mlte.backend.db.llm_cache import LLMResponseCache
 from mlte.backend.services.llm.llm_service import LLMService
 from mlte.backend.services.llm.openai_provider import OpenAIProvider
 from mlte.backend.services.requirement_service import RequirementService
 from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.job_service import CritiqueJobQueue, to_response
 router = APIRouter()
 
 openai_provider = OpenAIProvider(OPENAI_API_KEY)
-llm_service = LLMService(openai_provider)
+llm_cache = LLMResponseCache(LLM_CACHE_URL, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES) if LLM_CACHE_URL else None
+llm_service = LLMService(openai_provider, max_concurrency=LLM_MAX_CONCURRENCY, cache=llm_cache)
+job_queue = CritiqueJobQueue(SessionLocal, llm_service, workers=CRITIQUE_JOB_WORKERS, timeout=CRITIQUE_JOB_TIMEOUT)
+
+
+async def start_job_queue():
+    # The workers start with the app, picking up jobs left queued
+    job_queue.start()
+
+
+router.add_event_handler("startup", start_job_queue)
 
 @router.post("", response_model=CritiqueStats)
-async def critique_api(artifact_id: int, requirement_id: int, db: Session = Depends(get_db)):
+async def critique_api(artifact_id: int, requirement_id: int, use_cache: bool = True, db: Session = Depends(get_db)):
     requirement_service = RequirementService(db)
-    critique_service = CritiqueService(db, llm_service, requirement_service)
+    critique_service = CritiqueService(db, llm_service, requirement_service, use_cache=use_cache)
     try:
         return await critique_service.critique_requirement(artifact_id, requirement_id)
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk")
+async def critique_requirements_api(request: BulkCritiqueRequest, db: Session = Depends(get_db)):
+    """
+    Critique all requirements of an artifact, or those in the categories of
+    the filter, streaming the results as Server-Sent Events as they arrive.
+    """
+    if not db.query(Artifact).filter_by(artifact_id=request.artifact_id).first():
+        raise HTTPException(status_code=404, detail=f"Artifact with ID {request.artifact_id} not found.")
+
+    async def events():
+        # The stream outlives the request's session, so it has its own
+        stream_db = SessionLocal()
+        try:
+            critique_service = CritiqueService(
+                stream_db, llm_service, RequirementService(stream_db), use_cache=request.use_cache)
+            async for event in critique_service.critique_requirements(request.artifact_id, request.filter_criteria):
+                yield _server_sent_event(event)
+        except Exception as e:
+            traceback.print_exc()
+            yield _server_sent_event({"event": "error", "detail": str(e)})
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Compression middleware would hold events back until its buffer
+        # fills; it leaves responses with a content encoding alone.
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity", "X-Accel-Buffering": "no"},
+    )
+
+def _server_sent_event(event: Dict[str, Any]) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
 @router.post("/set-critique/version")
 def get_filter_requirement_version(request: GetVersionRequest, db: Session = Depends(get_db)):
     requirement_service = RequirementService(db)
@@ -40,7 +95,7 @@ async def critique_requirement_set(
     db: Session = Depends(get_db),
 ):
     requirement_service = RequirementService(db)
-    critique_service = CritiqueService(db, llm_service, requirement_service)
+    critique_service = CritiqueService(db, llm_service, requirement_service, use_cache=request.use_cache)
     try:
         stats = await critique_service.critique_requirement_set(
             request.artifact_id, 
@@ -50,4 +105,36 @@ async def critique_requirement_set(
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e)
-)
\ No newline at end of file
+)
+
+@router.post("/jobs", response_model=CritiqueJobResponse, status_code=202)
+async def submit_critique_job(request: SetCritiqueRequest, db: Session = Depends(get_db)):
+    """
+    Queue a set critique, to run in the background. If a job for the same
+    requirement set is already queued or running, that job is returned.
+    """
+    if not db.query(Artifact).filter_by(artifact_id=request.artifact_id).first():
+        raise HTTPException(status_code=404, detail=f"Artifact with ID {request.artifact_id} not found.")
+    job, created = job_queue.submit(db, request.artifact_id, request.filter_criteria, use_cache=request.use_cache)
+    return to_response(job, created)
+
+@router.get("/jobs/{job_id}", response_model=CritiqueJobResponse)
+async def get_critique_job(job_id: int, db: Session = Depends(get_db)):
+    job = job_queue.get(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found.")
+    return to_response(job)
+
+@router.delete("/jobs/{job_id}", response_model=CritiqueJobResponse)
+async def cancel_critique_job(job_id: int, db: Session = Depends(get_db)):
+    job = job_queue.cancel(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found.")
+    return to_response(job)
+
+@router.get("/cache")
+def get_cache_stats():
+    """The hits and misses of the LLM response cache, and its size."""
+    if llm_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **llm_cache.stats()}
@@ -6,9 +6,10 @@ Endpoints for artifact organization.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Iterator, List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 import mlte.backend.api.codes as codes
 import mlte.store.error as errors
@@ -16,6 +17,9 @@ from mlte.backend.api import dependencies
 from mlte.backend.api.auth.authorization import AuthorizedUser
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+"""The media type of newline-delimited JSON, one document per line."""
+
 # The router exported by this submodule
 router = APIRouter()
 
@@ -228,3 +232,51 @@ def delete_version(
                 status_code=codes.INTERNAL_ERROR,
                 detail="Internal server error.",
             )
+
+
+@router.get("/model/{model_id}/version/{version_id}/export")
+def export_version(
+    *,
+    model_id: str,
+    version_id: str,
+    current_user: AuthorizedUser,
+    batch_size: int = Query(100, gt=0),
+) -> StreamingResponse:
+    """
+    Export all artifacts in a MLTE version, streamed as NDJSON.
+
+    Artifacts are written one per line as they are read from the store,
+    so the export does not hold the version in memory.
+    :param model_id: The model identifier
+    :param version_id: The version identifier
+    :param batch_size: The number of artifacts read from the store at a time
+    :return: The artifacts, one JSON document per line
+    """
+    # Check the version exists, as errors cannot be reported once streaming.
+    with dependencies.artifact_store_session() as handle:
+        try:
+            handle.read_version(model_id, version_id)
+        except errors.ErrorNotFound as e:
+            raise HTTPException(
+                status_code=codes.NOT_FOUND, detail=f"{e} not found."
+            )
+        except Exception:
+            raise HTTPException(
+                status_code=codes.INTERNAL_ERROR,
+                detail="Internal server error.",
+            )
+
+    return StreamingResponse(
+        _export_lines(model_id, version_id, batch_size),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+def _export_lines(
+    model_id: str, version_id: str, batch_size: int
+) -> Iterator[bytes]:
+    """Read the artifacts in a version, and serialize them one per line."""
+    # The session lives as long as the response is being streamed.
+    with dependencies.artifact_store_session() as handle:
+        for artifact in handle.iter_artifacts(model_id, version_id, batch_size):
+            yield artifact.model_dump_json().encode("utf-8") + b"\n"
@@ -0,0 +1,18 @@
+"""
+mlte/backend/api/endpoints/metrics.py
+
+Metrics endpoint, for scraping by Prometheus.
+"""
+
+from fastapi import APIRouter, Response
+
+from mlte.backend.api.metrics import REGISTRY, TEXT_MEDIA_TYPE
+
+# The router exported by this submodule
+router = APIRouter()
+
+
+@router.get("/metrics")
+def read_metrics() -> Response:
+    """Get the request and store operation metrics of this process."""
+    return Response(content=REGISTRY.render(), media_type=TEXT_MEDIA_TYPE)
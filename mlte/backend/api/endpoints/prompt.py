@@ -4,13 +4,13 @@
 from fastapi import APIRouter, HTTPException
 from mlte.backend.dto.prompt import PromptChainRequest
 
-import openai
-
 
 router = APIRouter()
 
 @router.post("/prompt-chain")
 def prompt_chain(request: PromptChainRequest):
+    import openai
+
     try:
         response = ""
         for prompt in request.prompts:
@@ -61,7 +61,7 @@ async def login_for_access_token(
     if form_data.grant_type == GRANT_TYPE_PASSWORD:
         # Validate user and password from db.
         with dependencies.user_store_session() as user_store_session:
-            is_valid_user = authentication.authenticate_user(
+            is_valid_user = await authentication.authenticate_user_async(
                 form_data.username, form_data.password, user_store_session
             )
             if not is_valid_user:
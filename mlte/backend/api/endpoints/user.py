@@ -65,7 +65,8 @@ def edit_user(
     """
     with dependencies.user_store_session() as user_store:
         try:
-            return user_store.edit_user(user)
+            edited_user = user_store.edit_user(user)
+            return edited_user
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
@@ -158,7 +159,8 @@ def delete_user(
     """
     with dependencies.user_store_session() as user_store:
         try:
-            return user_store.delete_user(username)
+            deleted_user = user_store.delete_user(username)
+            return deleted_user
         except errors.ErrorNotFound as e:
             raise HTTPException(
                 status_code=codes.NOT_FOUND, detail=f"{e} not found."
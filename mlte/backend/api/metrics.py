@@ -0,0 +1,378 @@
+"""
+mlte/backend/api/metrics.py
+
+Request and store operation metrics, in the Prometheus text format.
+
+Every request is timed by a middleware, labelled with the route template it
+matched, and every call on an artifact store session is timed by a proxy
+around the session. Metrics are kept per process; with several workers,
+each worker reports its own.
+"""
+
+from __future__ import annotations
+
+import inspect
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import mlte.backend.api.codes as codes
+
+TEXT_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""The media type of the Prometheus text format."""
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""The upper bounds, in seconds, of the latency histogram buckets."""
+
+UNMATCHED_ROUTE = "unmatched"
+"""The route label of requests that did not match any route."""
+
+OK_OUTCOME = "ok"
+"""The outcome label of store operations that succeeded."""
+
+SessionType = TypeVar("SessionType")
+
+# -----------------------------------------------------------------------------
+# Metric types
+# -----------------------------------------------------------------------------
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label names and values as a Prometheus label set."""
+    if len(names) == 0:
+        return ""
+    pairs = [
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    ]
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    """A monotonically increasing count, for each combination of labels."""
+
+    def __init__(
+        self, name: str, documentation: str, labels: Sequence[str]
+    ) -> None:
+        self.name = name
+        """The metric name."""
+
+        self.documentation = documentation
+        """The help text of the metric."""
+
+        self.labels = tuple(labels)
+        """The label names."""
+
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        """
+        Increase the count for a combination of labels.
+        :param label_values: The label values, in the order of the names
+        :param amount: The amount to increase the count by
+        """
+        with self._lock:
+            self._values[label_values] = (
+                self._values.get(label_values, 0) + amount
+            )
+
+    def value(self, *label_values: str) -> float:
+        """Get the count for a combination of labels."""
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for label_values, value in values:
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """A distribution of observed values, for each combination of labels."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        """The metric name."""
+
+        self.documentation = documentation
+        """The help text of the metric."""
+
+        self.labels = tuple(labels)
+        """The label names."""
+
+        self.buckets = tuple(sorted(buckets))
+        """The upper bounds of the buckets."""
+
+        # Per combination of labels: the bucket counts, with a last bucket
+        # for values above all bounds, and the sum of the values.
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """
+        Record a value for a combination of labels.
+        :param value: The value
+        :param label_values: The label values, in the order of the names
+        """
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(label_values)
+            if entry is None:
+                entry = ([0] * (len(self.buckets) + 1), [0.0])
+                self._values[label_values] = entry
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, *label_values: str) -> int:
+        """Get the number of values recorded for a combination of labels."""
+        with self._lock:
+            entry = self._values.get(label_values)
+            return 0 if entry is None else sum(entry[0])
+
+    def render(self) -> List[str]:
+        """Render the metric in the Prometheus text format."""
+        with self._lock:
+            values = sorted(
+                (labels, (list(counts), total[0]))
+                for labels, (counts, total) in self._values.items()
+            )
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for label_values, (counts, total) in values:
+            cumulative = 0
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.labels + ("le",), label_values + (bound,)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """A collection of metrics, rendered together."""
+
+    def __init__(self) -> None:
+        self.metrics: List[Any] = []
+        """The registered metrics."""
+
+    def register(self, metric: Any) -> Any:
+        """
+        Add a metric to the registry.
+        :param metric: The metric
+        :return: The metric
+        """
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# -----------------------------------------------------------------------------
+# Backend metrics
+# -----------------------------------------------------------------------------
+
+REGISTRY = Registry()
+"""The metrics of the backend."""
+
+HTTP_REQUESTS: Counter = REGISTRY.register(
+    Counter(
+        "mlte_http_requests_total",
+        "Requests handled, by method, route and status code.",
+        ("method", "route", "status"),
+    )
+)
+
+HTTP_REQUEST_DURATION: Histogram = REGISTRY.register(
+    Histogram(
+        "mlte_http_request_duration_seconds",
+        "Time to handle requests, by method and route.",
+        ("method", "route"),
+    )
+)
+
+STORE_OPERATIONS: Counter = REGISTRY.register(
+    Counter(
+        "mlte_store_operations_total",
+        "Artifact store session calls, by operation and outcome.",
+        ("operation", "outcome"),
+    )
+)
+
+STORE_OPERATION_DURATION: Histogram = REGISTRY.register(
+    Histogram(
+        "mlte_store_operation_duration_seconds",
+        "Time spent in artifact store session calls, by operation.",
+        ("operation",),
+    )
+)
+
+# -----------------------------------------------------------------------------
+# Request instrumentation
+# -----------------------------------------------------------------------------
+
+
+class MetricsMiddleware:
+    """Records the count, status and latency of HTTP requests, per route."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = codes.INTERNAL_ERROR
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            # The router records the matched route in the scope; its path
+            # template keeps the number of label values bounded.
+            route = scope.get("route")
+            path = getattr(route, "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, path, str(status))
+            HTTP_REQUEST_DURATION.observe(duration, method, path)
+
+
+# -----------------------------------------------------------------------------
+# Store instrumentation
+# -----------------------------------------------------------------------------
+
+
+class _InstrumentedSession:
+    """A proxy that records the outcome and latency of session calls."""
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._session, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        timed = _timed(name, attribute)
+        # Later lookups find the wrapper without going through here.
+        setattr(self, name, timed)
+        return timed
+
+
+def _timed(operation: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a session method to record its outcome and latency."""
+
+    def call(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            _record(operation, start, type(e).__name__)
+            raise
+        if inspect.isgenerator(result):
+            return _timed_generator(operation, start, result)
+        _record(operation, start, OK_OUTCOME)
+        return result
+
+    return call
+
+
+def _timed_generator(
+    operation: str, start: float, generator: Generator[Any, None, None]
+) -> Iterator[Any]:
+    """Record a generating session call once the generator is exhausted."""
+    try:
+        yield from generator
+    except Exception as e:
+        _record(operation, start, type(e).__name__)
+        raise
+    _record(operation, start, OK_OUTCOME)
+
+
+def _record(operation: str, start: float, outcome: str) -> None:
+    """Record the outcome and latency of a session call."""
+    STORE_OPERATIONS.inc(operation, outcome)
+    STORE_OPERATION_DURATION.observe(time.perf_counter() - start, operation)
+
+
+def instrument_session(session: SessionType) -> SessionType:
+    """
+    Wrap a store session to record the outcome and latency of its calls.
+    :param session: The session
+    :return: The instrumented session, with the interface of the original
+    """
+    return _InstrumentedSession(session)  # type: ignore[return-value]
@@ -8,8 +8,11 @@ for additional meta-models like these. This worked well for write request;
 should the other endpoints be refactored to look more like this one?
 """
 
+from typing import List, Optional
+
 from pydantic import BaseModel
 
+import mlte.backend.api.codes as codes
 from mlte.artifact.model import ArtifactModel
 
 
@@ -31,3 +34,50 @@ class WriteArtifactResponse(BaseModel):
 
     artifact: ArtifactModel
     """The model for the artifact that was written."""
+
+
+class WriteArtifactsRequest(BaseModel):
+    """Defines the data in a POST request to write a batch of artifacts."""
+
+    artifacts: List[ArtifactModel]
+    """The models for the artifacts to write."""
+
+    force: bool = False
+    """Indicates that existing artifacts may be overwritten."""
+
+    parents: bool = False
+    """Indicates whether organizational elements should be created."""
+
+
+class ReadArtifactsRequest(BaseModel):
+    """Defines the data in a POST request to read a batch of artifacts."""
+
+    artifact_ids: List[str]
+    """The identifiers of the artifacts to read."""
+
+
+class BatchItemResult(BaseModel):
+    """Defines the outcome of one item of a batch request."""
+
+    status_code: int = codes.OK
+    """The status of the item, as the code a single request would return."""
+
+    artifact: Optional[ArtifactModel] = None
+    """The model for the artifact, if the item succeeded."""
+
+    detail: Optional[str] = None
+    """The reason the item failed, if it did."""
+
+
+class BatchArtifactsResponse(BaseModel):
+    """Defines the data in a response to a batch request."""
+
+    results: List[BatchItemResult]
+    """The outcome of each item, in request order."""
+
+
+class WriteBlobResponse(BaseModel):
+    """Defines the data in a response to writing a blob."""
+
+    digest: str
+    """The digest that addresses the blob that was written."""
@@ -7,14 +7,19 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from mlte.backend.api.api import api_router
 from mlte.backend.api.auth.http_auth_exception import (
     HTTPTokenException,
     json_content_exception_handler,
 )
+from mlte.backend.api.metrics import MetricsMiddleware
 from mlte.backend.core.config import settings
 
+COMPRESSION_MINIMUM_SIZE = 1024
+"""The size, in bytes, below which responses are sent uncompressed."""
+
 
 def create(allowed_origins: list[str] = []) -> FastAPI:
     """
@@ -42,9 +47,37 @@ def create(allowed_origins: list[str] = []) -> FastAPI:
             allow_headers=["*"],
         )
 
+    # Compress responses for clients that accept it
+    _add_compression(app)
+
+    # Time requests; added last, so that it also times the other middleware
+    app.add_middleware(MetricsMiddleware)
+
     # Add proper exception handling for Token responses, to be OAuth compliant.
     app.add_exception_handler(
         HTTPTokenException, json_content_exception_handler  # type: ignore
     )
 
     return app
+
+
+def _add_compression(app: FastAPI) -> None:
+    """
+    Attach response compression middleware to the application.
+
+    Brotli is negotiated when the optional brotli-asgi package is installed,
+    falling back to gzip for clients that do not accept it.
+    :param app: The app
+    """
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        app.add_middleware(
+            GZipMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE
+        )
+    else:
+        app.add_middleware(
+            BrotliMiddleware,
+            minimum_size=COMPRESSION_MINIMUM_SIZE,
+            gzip_fallback=True,
+        )
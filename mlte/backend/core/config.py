@@ -12,6 +12,7 @@ from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from mlte.store.base import StoreURIPrefix
+from mlte.user import passwords
 
 # An enumeration of supported log levels
 _LOG_LEVELS = ["DEBUG", "WARNING", "INFO", "ERROR", "CRITICAL"]
@@ -19,6 +20,9 @@ _LOG_LEVELS = ["DEBUG", "WARNING", "INFO", "ERROR", "CRITICAL"]
 # Default address for Frontend.
 DEFAULT_FRONTEND_ADDRESS = "http://localhost:8000"
 
+# The default authentication cache TTL when several workers serve requests.
+MULTI_WORKER_AUTH_CACHE_TTL = 5.0
+
 
 class Settings(BaseSettings):
     """
@@ -50,6 +54,16 @@ class Settings(BaseSettings):
             ) from None
         return v
 
+    APP_WORKERS: int = 1
+    """The number of worker processes serving requests."""
+
+    @field_validator("APP_WORKERS", mode="after")
+    @classmethod
+    def validate_app_workers(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"At least one worker is required: {v}.")
+        return v
+
     STORE_URI: str = StoreURIPrefix.LOCAL_MEMORY[0]
     """The store URI string; defaults to in-memory store."""
 
@@ -63,6 +77,16 @@ class Settings(BaseSettings):
             raise ValueError(f"Unsupported log level: {v}.")
         return v
 
+    LOG_SAMPLE_RATE: float = 0.1
+    """The fraction of per-request debug messages that are logged."""
+
+    @field_validator("LOG_SAMPLE_RATE", mode="after")
+    @classmethod
+    def validate_log_sample_rate(cls, v: float) -> float:
+        if not 0 <= v <= 1:
+            raise ValueError(f"Log sample rate must be between 0 and 1: {v}.")
+        return v
+
     ALLOWED_ORIGINS: List[str] = [DEFAULT_FRONTEND_ADDRESS]
     """A list of allowed CORS origins."""
 
@@ -71,6 +95,32 @@ class Settings(BaseSettings):
     )
     """The secret key used to encode/decode JWT tokens."""
 
+    AUTH_CACHE_TTL: float = 60
+    """
+    Seconds that decoded tokens and authenticated users are cached for.
+
+    Writing a user drops it from the cache of the worker process that wrote
+    it only; other workers may keep authenticating a changed or deleted user
+    for up to this long. With several workers, this therefore defaults to
+    MULTI_WORKER_AUTH_CACHE_TTL instead.
+    """
+
+    AUTH_CACHE_SIZE: int = 1024
+    """The maximum number of cached tokens and users; 0 disables caching."""
+
+    PASSWORD_WORK_FACTOR: int = passwords.DEFAULT_WORK_FACTOR
+    """The bcrypt work factor used to hash new passwords."""
+
+    @field_validator("PASSWORD_WORK_FACTOR", mode="after")
+    @classmethod
+    def validate_password_work_factor(cls, v: int) -> int:
+        if not passwords.MIN_WORK_FACTOR <= v <= passwords.MAX_WORK_FACTOR:
+            raise ValueError(f"Unsupported password work factor: {v}.")
+        return v
+
+    PASSWORD_WORKERS: int = 4
+    """The number of threads that verify passwords, off the event loop."""
+
     model_config = SettingsConfigDict(
         case_sensitive=True, env_file=".env.backend"
     )
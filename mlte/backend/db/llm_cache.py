@@ -0,0 +1,219 @@
+"""
+mlte/backend/db/llm_cache.py
+
+A persistent cache of LLM responses, keyed by everything that determines the
+response: the provider, the model, the prompts and the request parameters.
+
+The cache has a table of its own, in a database of its own, by default a
+local SQLite file, so that cached responses survive restarts without being
+mixed into the critique database.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import String, Text, create_engine, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    sessionmaker,
+)
+
+
+class CacheBase(DeclarativeBase):
+    """Base class for the cache table."""
+
+    pass
+
+
+class LLMResponse(CacheBase):
+    __tablename__ = "llm_response_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    provider: Mapped[str] = mapped_column(Text)
+    model: Mapped[Optional[str]] = mapped_column(Text)
+    response: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[float]
+    last_used_at: Mapped[float] = mapped_column(index=True)
+
+
+def make_key(
+    provider: str,
+    model: Optional[str],
+    system_prompt: str,
+    user_prompt: str,
+    params: Dict[str, Any],
+) -> str:
+    """
+    Compute the cache key of a request.
+    :param provider: The name of the provider
+    :param model: The model, if the provider has one
+    :param system_prompt: The system prompt
+    :param user_prompt: The user prompt
+    :param params: The request parameters, which must serialize to JSON
+    :return: The key, a hex digest
+    """
+    payload = json.dumps(
+        [provider, model, system_prompt, user_prompt, params],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LLM responses, kept for a time to live, and up to a maximum number of
+    entries; when full, the least recently used entries are evicted.
+    """
+
+    def __init__(self, url: str, ttl: float, max_entries: int):
+        """
+        Initialize the cache; it connects, and creates its table if needed,
+        on first use.
+        :param url: The database URL, e.g. sqlite:///llm_cache.db
+        :param ttl: The time to live of entries, in seconds
+        :param max_entries: The maximum number of entries
+        """
+        self.url = url
+        """The database URL."""
+
+        self.ttl = ttl
+        """The time to live of entries, in seconds."""
+
+        self.max_entries = max_entries
+        """The maximum number of entries."""
+
+        self.hits = 0
+        """The number of lookups that found a live entry."""
+
+        self.misses = 0
+        """The number of lookups that did not."""
+
+        self._lock = threading.Lock()
+        self._sessionmaker: Optional[sessionmaker[Session]] = None
+
+    def _sessions(self) -> Session:
+        """Open a session, connecting and creating the table on first use."""
+        with self._lock:
+            if self._sessionmaker is None:
+                connect_args = (
+                    {"check_same_thread": False}
+                    if self.url.startswith("sqlite")
+                    else {}
+                )
+                engine = create_engine(self.url, connect_args=connect_args)
+                CacheBase.metadata.create_all(bind=engine)
+                self._sessionmaker = sessionmaker(bind=engine)
+        return self._sessionmaker()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a response.
+        :param key: The key of the request
+        :return: The response, or None if there is no live entry
+        """
+        response = None
+        with self._sessions() as db:
+            # Taken once connected, as the first use creates the engine.
+            now = time.time()
+            entry = db.get(LLMResponse, key)
+            if entry is not None:
+                if entry.created_at + self.ttl <= now:
+                    db.delete(entry)
+                else:
+                    entry.last_used_at = now
+                    response = entry.response
+                db.commit()
+        self._count(hit=response is not None)
+        return response
+
+    def put(
+        self, key: str, provider: str, model: Optional[str], response: str
+    ) -> None:
+        """
+        Add or replace a response, evicting entries as needed.
+        :param key: The key of the request
+        :param provider: The name of the provider
+        :param model: The model, if the provider has one
+        :param response: The response
+        """
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._sessions() as db:
+            now = time.time()
+            db.merge(
+                LLMResponse(
+                    key=key,
+                    provider=provider,
+                    model=model,
+                    response=response,
+                    created_at=now,
+                    last_used_at=now,
+                )
+            )
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another process stored the same request first.
+                db.rollback()
+            self._evict(db, now)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a response, if present.
+        :param key: The key of the request
+        """
+        with self._sessions() as db:
+            db.query(LLMResponse).filter(LLMResponse.key == key).delete()
+            db.commit()
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        with self._sessions() as db:
+            db.query(LLMResponse).delete()
+            db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the hit and miss counts, and the number of entries."""
+        with self._sessions() as db:
+            entries = db.query(func.count(LLMResponse.key)).scalar()
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+            }
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _evict(self, db: Session, now: float) -> None:
+        """Remove expired entries, then the least recently used over the limit."""
+        db.query(LLMResponse).filter(
+            LLMResponse.created_at <= now - self.ttl
+        ).delete()
+        excess = (
+            db.query(func.count(LLMResponse.key)).scalar() - self.max_entries
+        )
+        if excess > 0:
+            oldest = [
+                key
+                for (key,) in db.query(LLMResponse.key)
+                .order_by(LLMResponse.last_used_at)
+                .limit(excess)
+            ]
+            db.query(LLMResponse).filter(LLMResponse.key.in_(oldest)).delete(
+                synchronize_session=False
+            )
+        db.commit()
@@ -1,8 +1,10 @@
 from sqlalchemy import (
-    Column, DateTime, Integer, String, Text, ForeignKey,
+    Boolean, Column, DateTime, Integer, String, Text, ForeignKey,
     Table, CheckConstraint, func
 )
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from mlte.backend.db.session import Base
 
 
@@ -123,4 +125,33 @@ class EvaluationCritique(Base):
     evaluation_quality_id = Column(Integer, ForeignKey("evaluation_quality.evaluation_quality_id", ondelete="CASCADE"), nullable=False)
     content = Column(Text, nullable=False)
 
-    evaluation_quality = relationship("EvaluationQuality", back_populates="critiques")
\ No newline at end of file
+    evaluation_quality = relationship("EvaluationQuality", back_populates="critiques")
+
+class RequirementQualityFingerprint(Base):
+    """
+    The fingerprint of the inputs of the last critique of a requirement for
+    a quality. It is kept for every critiqued quality, including those rated
+    high, which have no feedback.
+    """
+    __tablename__ = "requirement_quality_fingerprint"
+
+    requirement_id = Column(Integer, ForeignKey("requirements.requirement_id", ondelete="CASCADE"), primary_key=True)
+    quality_id = Column(Integer, ForeignKey("quality.quality_id", ondelete="CASCADE"), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+
+
+class CritiqueJob(Base):
+    """A set critique, run in the background by the job queue."""
+    __tablename__ = "critique_jobs"
+
+    job_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    artifact_id: Mapped[int] = mapped_column(Integer, ForeignKey("artifacts.artifact_id", ondelete="CASCADE"), nullable=False)
+    filter_criteria: Mapped[str] = mapped_column(Text, nullable=False)
+    requirements_version: Mapped[str] = mapped_column(String(32), nullable=False)
+    use_cache: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    status: Mapped[str] = mapped_column(String, CheckConstraint("status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')"), nullable=False, index=True)
+    result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -14,4 +14,18 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# The tables known to exist, by database
+_tables_checked = set()
+
+def ensure_table(db, table):
+    """
+    Create a table if it is missing. Databases are set up by init_db, so
+    those set up before a table was added lack it.
+    """
+    bind = db.get_bind()
+    key = (str(bind.url), table.name)
+    if key not in _tables_checked:
+        table.create(bind=bind, checkfirst=True)
+        _tables_checked.add(key)
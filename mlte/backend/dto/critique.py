@@ -1,4 +1,5 @@
 from pydantic import BaseModel, field_serializer
+from datetime import datetime
 from typing import List, Optional
 
 class ProjectContext(BaseModel):
@@ -50,6 +51,26 @@ class SetCritiqueStats(BaseModel):
 class SetCritiqueRequest(BaseModel):
     artifact_id: int
     filter_criteria: str
+    use_cache: bool = True
+
+class BulkCritiqueRequest(BaseModel):
+    artifact_id: int
+    filter_criteria: str = "All"
+    use_cache: bool = True
 
 class SetCritiqueResponse(BaseModel):
-    stats: SetCritiqueStats
\ No newline at end of file
+    stats: SetCritiqueStats
+
+class CritiqueJobResponse(BaseModel):
+    job_id: int
+    artifact_id: int
+    filter_criteria: str
+    requirements_version: str
+    status: str
+    stats: Optional[SetCritiqueStats] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # Whether the job already existed for the same requirement set
+    deduplicated: bool = False
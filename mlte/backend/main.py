@@ -4,20 +4,24 @@ mlte/backend/main.py
 Entry point for MLTE artifact store server.
 """
 
+import json
 import logging
+import os
 import sys
 from typing import Any, List
 
 import uvicorn
+from fastapi import FastAPI
 from pydantic.networks import HttpUrl
 
 import mlte.backend.app_factory as app_factory
 import mlte.backend.util.origins as util
-from mlte.backend.core.config import settings
+from mlte.backend.core.config import MULTI_WORKER_AUTH_CACHE_TTL, settings
 from mlte.backend.state import state
 from mlte.store.artifact import factory as artifact_store_factory
 from mlte.store.base import StoreType
 from mlte.store.user import factory as user_store_factory
+from mlte.user import passwords
 
 # Application exit codes
 EXIT_SUCCESS = 0
@@ -26,6 +30,9 @@ EXIT_FAILURE = 1
 # Wildcard for any URL.
 ANY_URL = "*"
 
+# The import string of the factory of worker applications.
+APP_FACTORY = "mlte.backend.main:create_app"
+
 
 def _validate_origins(allowed_origins: List[str]) -> List[Any]:
     """
@@ -43,6 +50,7 @@ def run(
     store_uri: str,
     allowed_origins: List[str],
     jwt_secret: str,
+    workers: int = 1,
 ) -> int:
     """
     Run the artifact store application.
@@ -51,21 +59,77 @@ def run(
     :param store_uri: The store URI string
     :param allowed_origins: A list of allowed CORS origins
     :param jwt_secret: A secret random string key used to sign tokens
+    :param workers: The number of worker processes serving requests
     :return: Return code
     """
     # Resolve hosts and validate resolved origins.
-    allowed_origins = util.resolve_hosts(allowed_origins)
-    _ = _validate_origins(allowed_origins)
+    resolved_origins = util.resolve_hosts(allowed_origins)
+    _ = _validate_origins(resolved_origins)
+
+    # Initialize the stores and token key. With several workers, this creates
+    # the stores once, before the workers open them concurrently.
+    init_state(store_uri, jwt_secret)
+
+    if workers == 1:
+        # The global FastAPI application
+        app = app_factory.create(resolved_origins)
+
+        # Run the server
+        uvicorn.run(app, host=host, port=port)
+        return EXIT_SUCCESS
+
+    if state.artifact_store.uri.type == StoreType.LOCAL_MEMORY:
+        raise RuntimeError(
+            "Cannot run several workers with an in-memory store, as each worker would have its own."
+        )
+
+    # Workers are separate processes, which configure themselves from the
+    # settings; pass the configuration on through their environment.
+    os.environ.update(
+        STORE_URI=store_uri,
+        ALLOWED_ORIGINS=json.dumps(allowed_origins),
+        JWT_SECRET_KEY=jwt_secret,
+    )
+    # Users written in one worker stay cached in the others until they
+    # expire, so keep that window short unless it is configured.
+    if "AUTH_CACHE_TTL" not in settings.model_fields_set:
+        os.environ["AUTH_CACHE_TTL"] = str(MULTI_WORKER_AUTH_CACHE_TTL)
+    uvicorn.run(
+        APP_FACTORY, factory=True, host=host, port=port, workers=workers
+    )
+    return EXIT_SUCCESS
+
+
+def create_app() -> FastAPI:
+    """
+    Create the application of a worker process, configured from the settings.
+    The stores of the worker are initialized when it starts up.
+    :return: The app
+    """
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    app = app_factory.create(util.resolve_hosts(settings.ALLOWED_ORIGINS))
+    app.add_event_handler(
+        "startup",
+        lambda: init_state(settings.STORE_URI, settings.JWT_SECRET_KEY),
+    )
+    return app
 
-    # The global FastAPI application
-    app = app_factory.create(allowed_origins)
 
+def init_state(store_uri: str, jwt_secret: str) -> None:
+    """
+    Initialize the stores and the token key of the application state.
+    :param store_uri: The store URI string
+    :param jwt_secret: A secret random string key used to sign tokens
+    """
     # Initialize the backing artifact store instance
     store = artifact_store_factory.create_store(store_uri)
     if store.uri.type == StoreType.REMOTE_HTTP:
         raise RuntimeError("Cannot run backend with remote HTTP store.")
     state.set_artifact_store(store)
 
+    # Set the cost of hashing new passwords, including the default user's.
+    passwords.set_work_factor(settings.PASSWORD_WORK_FACTOR)
+
     # Initialize the backing user store instance. Assume same store as artifact one for now.
     # TODO: allow for separate config of uri here
     user_store = user_store_factory.create_store(store_uri)
@@ -74,20 +138,16 @@ def run(
     # Set the token signing key.
     state.set_token_key(jwt_secret)
 
-    # Run the server
-    uvicorn.run(app, host=host, port=port)
-    return EXIT_SUCCESS
-
 
 def main() -> int:
-    # TODO(Kyle): use log level.
-    logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(level=settings.LOG_LEVEL)
     return run(
         settings.APP_HOST,
         int(settings.APP_PORT),
         settings.STORE_URI,
         settings.ALLOWED_ORIGINS,
         settings.JWT_SECRET_KEY,
+        settings.APP_WORKERS,
     )
 
 
@@ -3,4 +3,17 @@ import os
 
 load_dotenv()
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
\ No newline at end of file
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# The maximum number of LLM requests in flight at once, across all critiques.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "10"))
+
+# The cache of LLM responses; an empty URL disables it.
+LLM_CACHE_URL = os.getenv("LLM_CACHE_URL", "sqlite:///llm_cache.db")
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", str(7 * 24 * 60 * 60)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+
+# The number of set critique jobs run at once, and the time after which a
+# running job is given up on.
+CRITIQUE_JOB_WORKERS = int(os.getenv("CRITIQUE_JOB_WORKERS", "2"))
+CRITIQUE_JOB_TIMEOUT = float(os.getenv("CRITIQUE_JOB_TIMEOUT", str(60 * 60)))
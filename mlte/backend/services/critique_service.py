@@ -1,12 +1,12 @@
+import hashlib
 import time
 import traceback
-import openai
 import json
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
-from typing import Any, Dict, List, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 from sqlalchemy.orm import Session
 
 from mlte.backend.services.config import OPENAI_API_KEY
@@ -22,10 +22,12 @@ from mlte.backend.services.requirement_service import RequirementService
 
 class CritiqueService:
 
-    def __init__(self, db: Session, llm_service: LLMService, req_service: RequirementService):
+    def __init__(self, db: Session, llm_service: LLMService, req_service: RequirementService, use_cache: bool = True):
         self.db = db
         self.llm_service = llm_service
         self.req_service = req_service
+        # Whether LLM responses may come from the cache
+        self.use_cache = use_cache
     
     """
     Service for individual requirement quality critique.
@@ -34,30 +36,39 @@ class CritiqueService:
                            "Feasible", "Verifiable", "Correct", "Conforming"]
     
     # individual_qualities = ["Unambiguous"]
+
+    # Bump when the critique prompts change, so that requirements critiqued
+    # with the old prompts are critiqued again.
+    prompt_version = 1
     
     async def critique_requirement(self, artifact_id: int, req_id: int) -> crit_dto.CritiqueStats:
         print(f"Processing requirement {req_id} for artifact {artifact_id}")
         artifact = self.db.query(Artifact).filter_by(artifact_id=artifact_id).first()
+        if not artifact:
+            raise ValueError(f"Artifact with ID {artifact_id} not found.")
         req = self.db.query(Requirement).filter_by(requirement_id=req_id).first()
-        req_category = ", ".join(sorted([c.category.name for c in req.categories]))
-        project_context = crit_dto.ProjectContext(
-            project_description=artifact.project_description,
-            ml_task=artifact.ml_task,
-            usage_context=artifact.usage_context,
-            target_audience=artifact.target_audience,
-            dataset_description=artifact.dataset_description
-        )
+        if not req:
+            raise ValueError(f"Requirement with ID {req_id} not found.")
+        content = str(req.content)
+        req_category, project_context = self._requirement_inputs(artifact, req)
+        fingerprints = self._quality_fingerprints(content, req_category, project_context)
+        stale = self._stale_qualities(req_id, fingerprints)
+        if not stale:
+            print(f"Requirement {req_id} is unchanged since its last critique")
+            return self.req_service.get_critique_stats(req_id)
+
         print(f"Starting critique for requirement {req_id}")
-        print(f"Requirement: {req.content}")
+        print(f"Requirement: {content}")
         print(f"Requirement category: {req_category}")
         print(f"Project context: {project_context}")
+        print(f"Qualities to critique: {stale}")
 
         tasks = []
-        for quality in self.individual_qualities:
+        for quality in stale:
             task = asyncio.create_task(
                 self._process_single_quality(
                     quality=quality, 
-                    req=req.content, 
+                    req=content, 
                     req_category=req_category,
                     project_context=project_context
                 )
@@ -67,13 +78,8 @@ class CritiqueService:
             tasks.append(task)
 
         completed = 0
-        warnings = []
-        errors = []
         total = len(tasks)
 
-        # delete old feedbacks
-        self.req_service.delete_all_feedbacks_for_requirement(req_id)
-
         for task in asyncio.as_completed(tasks):
             try:
 
@@ -84,26 +90,9 @@ class CritiqueService:
                 print(f"Task completed at {time.strftime('%H:%M:%S', time.localtime())}")
                 if result:
                     quality_name = result["quality"]
-                    rating: crit_dto.Rating = result["rating"]
-                    critiques = result["critiques"]
-                    print(f"Quality: {quality_name}, Rating: {rating.rating}, Critiques: {critiques}")
-                    if rating.rating == "low":
-                        errors.append(quality_name)
-                        level = "error"
-                    elif rating.rating == "medium":
-                        warnings.append(quality_name)
-                        level = "warning"
-                    else:
-                        level = None
-
-                    if level:
-                        self.req_service.add_feedback_with_quality_and_critiques(
-                            requirement_id=req_id,
-                            level=level,
-                            quality_name=quality_name,
-                            critique_contents=critiques
-                        )
-                        print(f"Saved feedback for quality: {quality_name}")
+                    print(f"Quality: {quality_name}, Rating: {result['rating'].rating}, Critiques: {result['critiques']}")
+                    self._store_quality_result(req_id, result, fingerprints[quality_name])
+                    print(f"Saved feedback for quality: {quality_name}")
                 
                 completed += 1
                 print(f"Completed {completed}/{total} tasks.")
@@ -113,7 +102,161 @@ class CritiqueService:
                 completed += 1
                 print(f"Completed {completed}/{total} tasks (including failures).")
 
-        return crit_dto.CritiqueStats(warnings=warnings, errors=errors)
+        return self.req_service.get_critique_stats(req_id)
+
+    async def critique_requirements(self, artifact_id: int, filter_criteria: str = "All") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Critique all requirements of an artifact, or those in the categories
+        of the filter, yielding an event as each critique completes.
+
+        The qualities of all requirements are critiqued together, by a pool
+        of as many workers as the LLM service allows requests in flight, so
+        that results arrive steadily. Events are dicts with an "event" key:
+        "start", then "quality" for each critiqued quality, "requirement"
+        once all qualities of a requirement are done, and finally "done".
+        """
+        artifact = self.db.query(Artifact).filter_by(artifact_id=artifact_id).first()
+        if not artifact:
+            raise ValueError(f"Artifact with ID {artifact_id} not found.")
+        if filter_criteria == "All":
+            requirements = self.db.query(Requirement).filter_by(artifact_id=artifact_id).order_by(Requirement.requirement_id).all()
+        else:
+            requirements = self._get_requirements_by_categories(artifact_id, filter_criteria.split(","))
+
+        # Plan the (requirement, quality) critiques that are needed
+        plans = []
+        for req in requirements:
+            req_id = int(req.requirement_id)
+            content = str(req.content)
+            req_category, project_context = self._requirement_inputs(artifact, req)
+            fingerprints = self._quality_fingerprints(content, req_category, project_context)
+            stale = self._stale_qualities(req_id, fingerprints)
+            plans.append((req_id, content, req_category, project_context, fingerprints, stale))
+
+        total = sum(len(stale) for *_, stale in plans)
+        yield {"event": "start", "artifact_id": artifact_id, "requirements": len(requirements), "tasks": total}
+
+        remaining: Dict[int, int] = {}
+        fingerprints_by_req: Dict[int, Dict[str, str]] = {}
+        work: List[Tuple[int, str, str, crit_dto.ProjectContext, str]] = []
+        for req_id, content, req_category, project_context, fingerprints, stale in plans:
+            if not stale:
+                yield self._requirement_event(req_id, cached=True)
+                continue
+            remaining[req_id] = len(stale)
+            fingerprints_by_req[req_id] = fingerprints
+            work.extend((req_id, content, req_category, project_context, quality) for quality in stale)
+
+        # A pool of workers takes the critiques in turn, so that only as many
+        # are started as the LLM service has requests in flight
+        pending = iter(work)
+        results: "asyncio.Queue[Tuple[int, str, Any, Optional[Exception]]]" = asyncio.Queue()
+
+        async def run() -> None:
+            # Failures are queued too, so that they can be reported with their critique
+            for req_id, content, req_category, project_context, quality in pending:
+                try:
+                    result = await self._call_llm_for_critique(quality, content, req_category, project_context)
+                    await results.put((req_id, quality, result, None))
+                except Exception as e:
+                    traceback.print_exc()
+                    await results.put((req_id, quality, None, e))
+
+        workers = [asyncio.create_task(run()) for _ in range(min(self.llm_service.max_concurrency, total))]
+
+        failed = 0
+        try:
+            for _ in range(total):
+                req_id, quality, result, error = await results.get()
+                if error is None:
+                    try:
+                        level = self._store_quality_result(req_id, result, fingerprints_by_req[req_id][quality])
+                    except Exception as e:
+                        traceback.print_exc()
+                        error = e
+                if error is None:
+                    yield {
+                        "event": "quality",
+                        "requirement_id": req_id,
+                        "quality": quality,
+                        "rating": result["rating"].rating,
+                        "level": level,
+                        "critiques": result["critiques"],
+                    }
+                else:
+                    failed += 1
+                    yield {"event": "quality", "requirement_id": req_id, "quality": quality, "error": str(error)}
+
+                remaining[req_id] -= 1
+                if remaining[req_id] == 0:
+                    yield self._requirement_event(req_id, cached=False)
+        finally:
+            # The client may have gone away; stop the critiques left
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        yield {"event": "done", "completed": total - failed, "failed": failed}
+
+    def _requirement_event(self, req_id: int, cached: bool) -> Dict[str, Any]:
+        stats = self.req_service.get_critique_stats(req_id)
+        return {"event": "requirement", "requirement_id": req_id, "cached": cached, "stats": stats.model_dump()}
+
+    def _requirement_inputs(self, artifact: Artifact, req: Requirement) -> Tuple[str, crit_dto.ProjectContext]:
+        # the category and project context the critique of a requirement uses
+        req_category = ", ".join(sorted([c.category.name for c in req.categories]))
+        project_context = crit_dto.ProjectContext(
+            project_description=artifact.project_description,
+            ml_task=artifact.ml_task,
+            usage_context=artifact.usage_context,
+            target_audience=artifact.target_audience,
+            dataset_description=artifact.dataset_description
+        )
+        return req_category, project_context
+
+    def _quality_fingerprints(self, content: str, req_category: str, project_context: crit_dto.ProjectContext) -> Dict[str, str]:
+        return {
+            quality: self._fingerprint(content, req_category, project_context, quality)
+            for quality in self.individual_qualities
+        }
+
+    def _stale_qualities(self, req_id: int, fingerprints: Dict[str, str]) -> List[str]:
+        # Only critique the qualities whose inputs changed since their last
+        # critique; bypassing the cache critiques all of them again.
+        previous = self.req_service.get_quality_fingerprints(req_id) if self.use_cache else {}
+        return [q for q in self.individual_qualities if previous.get(q) != fingerprints[q]]
+
+    def _store_quality_result(self, req_id: int, result: Dict[str, Any], fingerprint: str) -> Optional[str]:
+        """Replace the feedback of a critiqued quality, returning its level."""
+        quality_name = result["quality"]
+        rating: crit_dto.Rating = result["rating"]
+        if rating.rating == "low":
+            level = "error"
+        elif rating.rating == "medium":
+            level = "warning"
+        else:
+            level = None
+
+        # replace the old feedback of this quality; a failed critique keeps
+        # it, and is retried next time
+        self.req_service.delete_feedbacks_for_quality(req_id, quality_name)
+        if level:
+            self.req_service.add_feedback_with_quality_and_critiques(
+                requirement_id=req_id,
+                level=level,
+                quality_name=quality_name,
+                critique_contents=result["critiques"]
+            )
+        self.req_service.set_quality_fingerprint(req_id, quality_name, fingerprint)
+        return level
+
+    def _fingerprint(self, content: str, req_category: str, project_context: crit_dto.ProjectContext, quality: str) -> str:
+        # everything the critique of a quality depends on
+        payload = json.dumps(
+            [self.prompt_version, quality, content, req_category, project_context.model_dump()],
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     
     async def _process_single_quality(self, quality: str, req: str, req_category: str, project_context: crit_dto.ProjectContext):
         try:
@@ -163,7 +306,7 @@ class CritiqueService:
         else:
             return crit_dto.Rating(rating="", explanation=""), ""
         
-        rating_result, prev_conversation = self._rate_req(req, rating_prompt)
+        rating_result, prev_conversation = await self._rate_req(req, rating_prompt)
 
         return crit_dto.Rating(rating=rating_result["eval_result"], explanation=rating_result["explanation"]), prev_conversation
         
@@ -209,34 +352,42 @@ class CritiqueService:
         critiques = []
         if rating == "medium":
             prompt = context + criticize_medium_prompt + output_format
-            result = self._safe_perform_query_return_json(prompt, system_promt)
+            result = await self._safe_perform_query_return_json(prompt, system_promt)
             critiques = result["critiques"]
         elif rating == "low":
             prompt = context + criticize_low_prompt + output_format
-            result = self._safe_perform_query_return_json(prompt, system_promt)
+            result = await self._safe_perform_query_return_json(prompt, system_promt)
             critiques = result["critiques"]
         else:
             return []
         return critiques
 
-    def _rate_req(self, req, rating_prompt, model="gpt-4-turbo"):
+    async def _rate_req(self, req, rating_prompt, model="gpt-4-turbo"):
         system_prompt = "You are an expert in analyzing requirement quality."
         req_prompt = f"The user has provided a requirement: {req}\n"
         prompt = req_prompt + rating_prompt
         # result = perform_query("", prompt, system_promt, model)
-        result = self.llm_service.send_message(system_prompt, prompt)
-        json_result = json.loads(result)
+        result = await self.llm_service.asend_message(system_prompt, prompt, use_cache=self.use_cache)
+        try:
+            json_result = json.loads(result)
+        except json.JSONDecodeError:
+            # Do not keep serving a response that cannot be used.
+            await self.llm_service.aforget(system_prompt, prompt)
+            raise
         context = "User Prompt: " + prompt + " System Response: " + result
         return json_result, context
 
-    def _safe_perform_query_return_json(self, prompt: str, system_promt: str, max_retries=5):
+    async def _safe_perform_query_return_json(self, prompt: str, system_promt: str, max_retries=5):
         attempt = 0
         while attempt < max_retries:
             try:
-                new_result = self.llm_service.send_message(system_promt, prompt)
+                # Retries ask the model again, replacing the cached response.
+                new_result = await self.llm_service.asend_message(
+                    system_promt, prompt, use_cache=self.use_cache and attempt == 0)
                 return json.loads(new_result)
             except json.JSONDecodeError:
                 attempt += 1
+        await self.llm_service.aforget(system_promt, prompt)
         raise ValueError("Failed to get a valid JSON response after multiple attempts.")
 
     def _construct_necessary_rating_prompt(self, req_category: str, context: crit_dto.ProjectContext) -> str:
@@ -694,7 +845,7 @@ class CritiqueService:
             return None
         
         system_prompt = "You are an expert in analyzing requirement sets and their quality."
-        result = self._safe_perform_query_return_json(prompt, system_prompt)
+        result = await self._safe_perform_query_return_json(prompt, system_prompt)
 
         print(f"LLM response: {result}")
 
@@ -1044,3 +1195,4 @@ class CritiqueService:
         - Do not include any extra text or formatting! Do not inclue ```json."
             
         return intro + project_context + requirements + request + output
+
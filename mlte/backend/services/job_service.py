@@ -0,0 +1,315 @@
+import asyncio
+import json
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+import mlte.backend.dto.critique as crit_dto
+from mlte.backend.db.models import CritiqueJob
+from mlte.backend.db.session import ensure_table
+from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.llm.llm_service import LLMService
+from mlte.backend.services.requirement_service import RequirementService
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+"""The statuses of jobs that are not finished."""
+
+
+class CritiqueJobQueue:
+    """
+    Runs set critiques in the background, on a pool of worker tasks in the
+    event loop of the backend.
+
+    Jobs are kept in the database, so that they can be polled from any
+    backend process. A job is claimed by the worker that moves it from
+    queued to running, so with several backend processes each job still runs
+    once. Submitting a critique of a set that is already queued or running,
+    with the same requirements, returns the job for it instead.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        llm_service: LLMService,
+        workers: int = 2,
+        timeout: float = 60 * 60,
+    ):
+        """
+        :param session_factory: Opens database sessions for the workers
+        :param llm_service: The LLM service critiques use
+        :param workers: The number of jobs run at once
+        :param timeout: The time, in seconds, after which a running job fails
+        """
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1.")
+        self.session_factory = session_factory
+        self.llm_service = llm_service
+        self.workers = workers
+        self.timeout = timeout
+
+        self._queue: Optional["asyncio.Queue[int]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_tasks: List["asyncio.Task[None]"] = []
+        # The jobs running in this process, to cancel them
+        self._running: Dict[int, "asyncio.Future[Any]"] = {}
+        self._cancelled: Set[int] = set()
+
+    def submit(
+        self,
+        db: Session,
+        artifact_id: int,
+        filter_criteria: str,
+        use_cache: bool = True,
+    ) -> Tuple[CritiqueJob, bool]:
+        """
+        Queue a critique of a requirement set.
+        :return: The job, and whether it was created rather than reused
+        """
+        ensure_table(db, CritiqueJob.__table__)
+        version = RequirementService(db).get_requirements_version(
+            artifact_id, filter_criteria
+        )
+
+        existing = self._active_jobs(db, artifact_id, filter_criteria)
+        for job in existing:
+            if job.requirements_version == version:
+                return job, False
+        # Queued critiques of an earlier version of the set are superseded
+        for job in existing:
+            if job.status == QUEUED:
+                self._finish(
+                    db, job, CANCELLED, error="Superseded by a newer job."
+                )
+
+        job = CritiqueJob(
+            artifact_id=artifact_id,
+            filter_criteria=filter_criteria,
+            requirements_version=version,
+            use_cache=use_cache,
+            status=QUEUED,
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        self._queue_for_loop().put_nowait(job.job_id)
+        return job, True
+
+    def get(self, db: Session, job_id: int) -> Optional[CritiqueJob]:
+        ensure_table(db, CritiqueJob.__table__)
+        job = db.query(CritiqueJob).filter_by(job_id=job_id).first()
+        if job is not None:
+            self._expire_if_lost(db, job)
+        return job
+
+    def cancel(self, db: Session, job_id: int) -> Optional[CritiqueJob]:
+        """
+        Cancel a job, if it is not finished. A job running in another
+        backend process is marked cancelled, and its result is discarded.
+        :return: The job, or None if there is no such job
+        """
+        job = self.get(db, job_id)
+        if job is None or job.status not in ACTIVE_STATUSES:
+            return job
+        self._finish(db, job, CANCELLED)
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancelled.add(job_id)
+            task.cancel()
+        return job
+
+    def _active_jobs(
+        self, db: Session, artifact_id: int, filter_criteria: str
+    ) -> List[CritiqueJob]:
+        jobs = (
+            db.query(CritiqueJob)
+            .filter(
+                CritiqueJob.artifact_id == artifact_id,
+                CritiqueJob.filter_criteria == filter_criteria,
+                CritiqueJob.status.in_(ACTIVE_STATUSES),
+            )
+            .all()
+        )
+        return [job for job in jobs if not self._expire_if_lost(db, job)]
+
+    def _expire_if_lost(self, db: Session, job: CritiqueJob) -> bool:
+        """
+        Fail a job running past the timeout, which was lost, e.g. with its
+        process; the worker of a job times it out itself otherwise.
+        :return: Whether the job is no longer active
+        """
+        if job.status != RUNNING or job.started_at is None:
+            return False
+        if _aware(job.started_at) >= _now() - timedelta(seconds=self.timeout):
+            return False
+        self._finish(
+            db, job, FAILED, error="The job timed out.", only_from=RUNNING
+        )
+        return job.status not in ACTIVE_STATUSES
+
+    def start(self):
+        """
+        Start the workers, if they are not running in this event loop, and
+        have them pick up the jobs that are queued.
+        """
+        self._queue_for_loop()
+
+    def _queue_for_loop(self) -> "asyncio.Queue[int]":
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop:
+            return self._queue
+        self._loop = loop
+        queue: "asyncio.Queue[int]" = asyncio.Queue()
+        self._queue = queue
+        self._worker_tasks = [
+            loop.create_task(self._work(queue)) for _ in range(self.workers)
+        ]
+
+        # Pick up jobs queued before the workers started
+        with self.session_factory() as db:
+            ensure_table(db, CritiqueJob.__table__)
+            for (job_id,) in (
+                db.query(CritiqueJob.job_id)
+                .filter_by(status=QUEUED)
+                .order_by(CritiqueJob.job_id)
+            ):
+                queue.put_nowait(job_id)
+        return queue
+
+    async def _work(self, queue: "asyncio.Queue[int]"):
+        while True:
+            job_id = await queue.get()
+            try:
+                await self._run(job_id)
+            except Exception:
+                traceback.print_exc()
+
+    async def _run(self, job_id: int):
+        with self.session_factory() as db:
+            # Claim the job; another worker or process may have already
+            claimed = (
+                db.query(CritiqueJob)
+                .filter_by(job_id=job_id, status=QUEUED)
+                .update(
+                    {"status": RUNNING, "started_at": _now()},
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if not claimed:
+                return
+            job = db.query(CritiqueJob).filter_by(job_id=job_id).one()
+
+            critique_service = CritiqueService(
+                db,
+                self.llm_service,
+                RequirementService(db),
+                use_cache=job.use_cache,
+            )
+            task = asyncio.ensure_future(
+                asyncio.wait_for(
+                    critique_service.critique_requirement_set(
+                        job.artifact_id, job.filter_criteria
+                    ),
+                    self.timeout,
+                )
+            )
+            self._running[job_id] = task
+            try:
+                stats = await task
+            except asyncio.CancelledError:
+                db.rollback()
+                self._finish(db, job, CANCELLED, only_from=RUNNING)
+                if job_id in self._cancelled:
+                    self._cancelled.discard(job_id)
+                    return
+                # The worker itself is being stopped
+                raise
+            except asyncio.TimeoutError:
+                db.rollback()
+                self._finish(
+                    db,
+                    job,
+                    FAILED,
+                    error="The job timed out.",
+                    only_from=RUNNING,
+                )
+                return
+            except Exception as e:
+                traceback.print_exc()
+                db.rollback()
+                self._finish(db, job, FAILED, error=str(e), only_from=RUNNING)
+                return
+            finally:
+                self._running.pop(job_id, None)
+
+            result = (
+                json.dumps(stats.model_dump()) if stats is not None else None
+            )
+            self._finish(db, job, SUCCEEDED, result=result, only_from=RUNNING)
+
+    def _finish(
+        self,
+        db: Session,
+        job: CritiqueJob,
+        status: str,
+        result: Optional[str] = None,
+        error: Optional[str] = None,
+        only_from: Optional[str] = None,
+    ):
+        # With only_from, a job that was meanwhile cancelled stays cancelled
+        query = db.query(CritiqueJob).filter_by(job_id=job.job_id)
+        if only_from is not None:
+            query = query.filter_by(status=only_from)
+        query.update(
+            {
+                "status": status,
+                "result": result,
+                "error": error,
+                "finished_at": _now(),
+            },
+            synchronize_session=False,
+        )
+        db.commit()
+        db.refresh(job)
+
+
+def to_response(
+    job: CritiqueJob, created: bool = True
+) -> crit_dto.CritiqueJobResponse:
+    return crit_dto.CritiqueJobResponse(
+        job_id=job.job_id,
+        artifact_id=job.artifact_id,
+        filter_criteria=job.filter_criteria,
+        requirements_version=job.requirements_version,
+        status=job.status,
+        stats=crit_dto.SetCritiqueStats(**json.loads(job.result))
+        if job.result
+        else None,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        deduplicated=not created,
+    )
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _aware(moment: datetime) -> datetime:
+    # SQLite returns timestamps without their time zone
+    return (
+        moment
+        if moment.tzinfo is not None
+        else moment.replace(tzinfo=timezone.utc)
+    )
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
@@ -10,3 +12,17 @@ class BaseLLMProvider(ABC):
         return str: The response from the model.
         """
         pass
+
+    async def achat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        """
+        Asynchronous version of chat, with the same arguments.
+
+        Providers with an asynchronous client should override this; by default
+        the blocking chat runs in a worker thread, so that it does not block
+        the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.chat, system_prompt, user_prompt, **kwargs),
+        )
@@ -1,10 +1,127 @@
-from typing import List, Dict
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+from mlte.backend.db.llm_cache import LLMResponseCache, make_key
 from .base import BaseLLMProvider
 
+DEFAULT_MAX_CONCURRENCY = 10
+"""The default maximum number of requests in flight at once."""
+
+
 class LLMService:
-    def __init__(self, provider: BaseLLMProvider):
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache: Optional[LLMResponseCache] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("The maximum concurrency must be at least 1.")
         self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        # Semaphores belong to an event loop, so one is made for each loop.
+        self._semaphore: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = None
+
+    def send_message(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        use_cache: bool = True,
+        **params: Any,
+    ) -> str:
+        """
+        Send a message, answering from the cache if it has the response.
+        With use_cache off, the cache is not read, but the fresh response
+        still replaces the cached one.
+        """
+        key = self._key(system_prompt, user_prompt, params)
+        response = self._lookup(key, use_cache)
+        if response is None:
+            response = self.provider.chat(
+                system_prompt=system_prompt, user_prompt=user_prompt, **params
+            )
+            self._store(key, response)
+        return response
+
+    async def asend_message(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        use_cache: bool = True,
+        **params: Any,
+    ) -> str:
+        """
+        Send a message without blocking the event loop. Concurrent calls on
+        this service share a bound on the requests in flight at once; cached
+        responses are answered without waiting for it. The cache database is
+        blocking, so it is read and written in the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(system_prompt, user_prompt, params)
+        response = None
+        if self.cache is not None and use_cache:
+            response = await loop.run_in_executor(
+                None, self._lookup, key, use_cache
+            )
+        if response is None:
+            async with self._get_semaphore():
+                response = await self.provider.achat(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    **params,
+                )
+            if self.cache is not None:
+                await loop.run_in_executor(None, self._store, key, response)
+        return response
+
+    def forget(
+        self, system_prompt: str, user_prompt: str, **params: Any
+    ) -> None:
+        """Remove the cached response to a message, e.g. when it was unusable."""
+        if self.cache is not None:
+            self.cache.invalidate(self._key(system_prompt, user_prompt, params))
+
+    async def aforget(
+        self, system_prompt: str, user_prompt: str, **params: Any
+    ) -> None:
+        """Remove a cached response without blocking the event loop."""
+        if self.cache is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                self.cache.invalidate,
+                self._key(system_prompt, user_prompt, params),
+            )
+
+    def _key(
+        self, system_prompt: str, user_prompt: str, params: Dict[str, Any]
+    ) -> str:
+        return make_key(
+            type(self.provider).__name__,
+            getattr(self.provider, "model", None),
+            system_prompt,
+            user_prompt,
+            params,
+        )
+
+    def _lookup(self, key: str, use_cache: bool) -> Optional[str]:
+        if self.cache is None or not use_cache:
+            return None
+        return self.cache.get(key)
 
-    def send_message(self, system_prompt: str, user_prompt: str) -> str:
-        return self.provider.chat(system_prompt=system_prompt, user_prompt=user_prompt)
+    def _store(self, key: str, response: str) -> None:
+        if self.cache is not None:
+            self.cache.put(
+                key,
+                type(self.provider).__name__,
+                getattr(self.provider, "model", None),
+                response,
+            )
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
@@ -1,20 +1,59 @@
-import openai
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Optional
 from .base import BaseLLMProvider
 
+if TYPE_CHECKING:
+    import openai
+    from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
+
+
 class OpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str = "gpt-4-turbo"):
         self.model = model
-        self.client = openai.OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self._client: Optional["openai.OpenAI"] = None
+        self._async_client: Optional["openai.AsyncOpenAI"] = None
 
-    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
-        messages = [
+    @property
+    def client(self) -> "openai.OpenAI":
+        """The OpenAI client, created on first use."""
+        if self._client is None:
+            import openai
+
+            self._client = openai.OpenAI(api_key=self.api_key)
+        return self._client
+
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        """The asynchronous OpenAI client, created on first use."""
+        if self._async_client is None:
+            import openai
+
+            self._async_client = openai.AsyncOpenAI(api_key=self.api_key)
+        return self._async_client
+
+    def _messages(self, system_prompt: str, user_prompt: str) -> List["ChatCompletionMessageParam"]:
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._messages(system_prompt, user_prompt),
             **kwargs
         )
-        return response.choices[0].message.content.strip()
+        return self._content(response)
+
+    async def achat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=self._messages(system_prompt, user_prompt),
+            **kwargs
+        )
+        return self._content(response)
+
+    @staticmethod
+    def _content(response: "ChatCompletion") -> str:
+        """The text of a completion, which is empty when it has none, e.g. a refusal or a tool call."""
+        return (response.choices[0].message.content or "").strip()
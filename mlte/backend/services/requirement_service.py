@@ -1,11 +1,13 @@
 import hashlib
-from typing import List, Union
+from typing import Dict, List, Union
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from mlte.backend.db.models import (
     Artifact, Requirement, Category, 
     Feedback, Quality, Critique, 
-    RequirementCategory, FeedbackQuality)
+    RequirementCategory, FeedbackQuality,
+    RequirementQualityFingerprint)
+from mlte.backend.db.session import ensure_table
 from mlte.backend.dto import requirement as req_dto
 from mlte.backend.dto import critique as crit_dto
 
@@ -81,6 +83,51 @@ class RequirementService:
         self.db.query(Feedback).filter_by(requirement_id=requirement_id).delete()
         self.db.commit()
 
+    def delete_feedbacks_for_quality(self, requirement_id: int, quality_name: str):
+        # delete the feedbacks of one quality for this requirement
+        feedbacks = self.db.query(Feedback).join(
+            FeedbackQuality,
+            Feedback.feedback_id == FeedbackQuality.feedback_id
+        ).join(
+            Quality,
+            FeedbackQuality.quality_id == Quality.quality_id
+        ).filter(
+            Feedback.requirement_id == requirement_id,
+            Quality.name == quality_name
+        ).all()
+        for feedback in feedbacks:
+            self.db.delete(feedback)
+        self.db.commit()
+
+    def get_quality_fingerprints(self, requirement_id: int) -> Dict[str, str]:
+        # the fingerprints of the last critiques, by quality name
+        self._ensure_fingerprint_table()
+        rows = self.db.query(Quality.name, RequirementQualityFingerprint.fingerprint).join(
+            RequirementQualityFingerprint,
+            RequirementQualityFingerprint.quality_id == Quality.quality_id
+        ).filter(
+            RequirementQualityFingerprint.requirement_id == requirement_id
+        ).all()
+        return {name: fingerprint for name, fingerprint in rows}
+
+    def set_quality_fingerprint(self, requirement_id: int, quality_name: str, fingerprint: str):
+        self._ensure_fingerprint_table()
+        quality = self.db.query(Quality).filter_by(name=quality_name).first()
+        if not quality:
+            quality = Quality(name=quality_name)
+            self.db.add(quality)
+            self.db.commit()
+            self.db.refresh(quality)
+        self.db.merge(RequirementQualityFingerprint(
+            requirement_id=requirement_id,
+            quality_id=quality.quality_id,
+            fingerprint=fingerprint
+        ))
+        self.db.commit()
+
+    def _ensure_fingerprint_table(self):
+        ensure_table(self.db, RequirementQualityFingerprint.__table__)
+
 
     def add_feedback_with_quality_and_critiques(
         self,
@@ -4,10 +4,14 @@ mlte/backend/state/state.py
 Globally-accessible application state.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from mlte.backend.core.config import settings
+from mlte.backend.util.cache import TTLCache
 from mlte.store.artifact.store import ArtifactStore
 from mlte.store.user.store import UserStore
+from mlte.user.model import BasicUser
 
 
 class State:
@@ -23,6 +27,22 @@ class State:
         self._jwt_secret_key: str = ""
         """Secret key used to sign authentication tokens."""
 
+        self.token_cache: TTLCache[str, str] = TTLCache(
+            settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL
+        )
+        """Usernames of recently decoded tokens, keyed by token."""
+
+        self.user_cache: TTLCache[str, BasicUser] = TTLCache(
+            settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL
+        )
+        """Recently authenticated users, keyed by username."""
+
+        self.password_pool = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_WORKERS,
+            thread_name_prefix="mlte-password",
+        )
+        """Threads that verify passwords, so bcrypt does not block requests."""
+
     def set_artifact_store(self, store: ArtifactStore):
         """Set the globally-configured backend artifact store."""
         self._artifact_store = store
@@ -30,10 +50,12 @@ class State:
     def set_user_store(self, store: UserStore):
         """Set the globally-configured backend artifact store."""
         self._user_store = store
+        self.user_cache.clear()
 
     def set_token_key(self, token_key: str):
         """Sets the globally used token secret key."""
         self._jwt_secret_key = token_key
+        self.token_cache.clear()
 
     @property
     def artifact_store(self) -> ArtifactStore:
@@ -0,0 +1,117 @@
+"""
+mlte/backend/util/cache.py
+
+A bounded, thread-safe cache with expiring entries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Optional, Tuple, TypeVar
+
+KeyType = TypeVar("KeyType")
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """
+    A least-recently-used cache whose entries expire after a time to live.
+
+    Entries are evicted when they expire, or when the cache is full and a
+    new entry is added.
+    """
+
+    def __init__(self, capacity: int, ttl: float) -> None:
+        """
+        Initialize a cache.
+        :param capacity: The maximum number of entries
+        :param ttl: The time to live of entries, in seconds
+        """
+        self.capacity = capacity
+        """The maximum number of entries."""
+
+        self.ttl = ttl
+        """The time to live of entries, in seconds."""
+
+        self._entries: OrderedDict[
+            KeyType, Tuple[float, ValueType]
+        ] = OrderedDict()
+        """The entries, with their expiry times, least recently used first."""
+
+        self._generation = 0
+        """Incremented by every invalidation; see generation()."""
+
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        """
+        Get the value of a live entry.
+        :param key: The key of the entry
+        :return: The value, or None if there is no live entry for the key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiry, value = entry
+            if expiry <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self) -> int:
+        """
+        Get the current generation of the cache. A value read from its source
+        after taking the generation can be put with it, and is then dropped
+        if an invalidation happened in between, as it may be stale.
+        :return: The generation
+        """
+        with self._lock:
+            return self._generation
+
+    def put(
+        self,
+        key: KeyType,
+        value: ValueType,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Add or replace an entry.
+        :param key: The key of the entry
+        :param value: The value of the entry
+        :param ttl: A time to live for this entry, if shorter than the default
+        :param generation: The generation the value was read in, if checked
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.capacity <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: KeyType) -> None:
+        """
+        Remove an entry, if present.
+        :param key: The key of the entry
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,30 @@
+"""
+mlte/backend/util/logs.py
+
+Logging utilities.
+"""
+
+import logging
+import random
+
+
+class SamplingFilter(logging.Filter):
+    """
+    A filter that lets through only a sample of debug messages.
+
+    Used on loggers that write a debug message for every request, so that
+    debug logging can be enabled on a busy server. Messages above the debug
+    level are always let through.
+    """
+
+    def __init__(self, rate: float) -> None:
+        """
+        Initialize a filter.
+        :param rate: The fraction of debug messages to let through
+        """
+        super().__init__()
+        self.rate = rate
+        """The fraction of debug messages to let through."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
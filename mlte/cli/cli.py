@@ -10,10 +10,9 @@ import sys
 import traceback
 from importlib.metadata import PackageNotFoundError, version
 
-import mlte.backend.main as backend
-import mlte.frontend as frontend
 from mlte.backend.core.config import settings as backend_settings
 from mlte.frontend.config import settings as frontend_settings
+from mlte.store.base import StoreType, StoreURI
 
 # CLI exit codes
 EXIT_SUCCESS = 0
@@ -54,7 +53,11 @@ def _prepare_parser():
 
     # Attach subparsers
     subparser = base_parser.add_subparsers(help="Subcommands:")
-    for attach_to in [_attach_backend_parser, _attach_frontend_parser]:
+    for attach_to in [
+        _attach_backend_parser,
+        _attach_frontend_parser,
+        _attach_rebuild_manifests_parser,
+    ]:
         attach_to(subparser)
     return base_parser
 
@@ -66,7 +69,7 @@ def _attach_backend_parser(
     parser: argparse.ArgumentParser = subparser.add_parser(
         "backend", help="Run an instance of the MLTE artifact store."
     )
-    parser.set_defaults(func=backend.run)
+    parser.set_defaults(func=_run_backend)
 
     # Additional arguments.
     parser.add_argument(
@@ -99,6 +102,12 @@ def _attach_backend_parser(
         default=backend_settings.JWT_SECRET_KEY,
         help="A secret random string key used to sign tokens",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=backend_settings.APP_WORKERS,
+        help=f"The number of worker processes serving requests; requires a file system or relational DB store if more than one (default: {backend_settings.APP_WORKERS})",
+    )
 
 
 def _attach_frontend_parser(
@@ -108,7 +117,7 @@ def _attach_frontend_parser(
     parser: argparse.ArgumentParser = subparser.add_parser(
         "ui", help="Run an instance of the MLTE frontend user interface."
     )
-    parser.set_defaults(func=frontend.run_frontend)
+    parser.set_defaults(func=_run_frontend)
 
     # Additional arguments.
     parser.add_argument(
@@ -125,6 +134,65 @@ def _attach_frontend_parser(
     )
 
 
+def _attach_rebuild_manifests_parser(
+    subparser: argparse._SubParsersAction[argparse.ArgumentParser],
+):
+    """Attach the manifest rebuild subparser to the base parser."""
+    parser: argparse.ArgumentParser = subparser.add_parser(
+        "rebuild-manifests",
+        help="Rebuild the artifact manifests of a local file system store.",
+    )
+    parser.set_defaults(func=_rebuild_manifests)
+
+    # Additional arguments.
+    parser.add_argument(
+        "--store-uri",
+        type=str,
+        default=backend_settings.STORE_URI,
+        help=f"The URI for the file system store (default: {backend_settings.STORE_URI}).",
+    )
+
+
+# -----------------------------------------------------------------------------
+# Subcommands
+# -----------------------------------------------------------------------------
+
+
+def _run_backend(**kwargs) -> int:
+    """Run the artifact store; see mlte.backend.main.run()."""
+    import mlte.backend.main as backend
+
+    return backend.run(**kwargs)
+
+
+def _run_frontend(**kwargs) -> int:
+    """Run the frontend; see mlte.frontend.run_frontend()."""
+    import mlte.frontend as frontend
+
+    return frontend.run_frontend(**kwargs)
+
+
+def _rebuild_manifests(store_uri: str) -> int:
+    """
+    Rebuild the manifests of all versions in a local file system store.
+    :param store_uri: The store URI string
+    :return: Return code
+    """
+    uri = StoreURI.from_string(store_uri)
+    if uri.type != StoreType.LOCAL_FILESYSTEM:
+        raise RuntimeError("Manifests only exist in file system stores.")
+
+    from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+
+    session = LocalFileSystemStore(uri).session()
+    try:
+        count = session.rebuild_manifests()
+    finally:
+        session.close()
+    print(f"Rebuilt {count} manifest(s) in {store_uri}.")
+    return EXIT_SUCCESS
+
+
 # -----------------------------------------------------------------------------
 # Entry Point
 # -----------------------------------------------------------------------------
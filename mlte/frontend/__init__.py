@@ -1,9 +1,5 @@
 import os
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-
 # Application exit codes
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -19,6 +15,9 @@ def run_frontend(
     :param port: The application port
     :return: Return code
     """
+    import uvicorn
+    from fastapi import FastAPI
+    from fastapi.staticfiles import StaticFiles
 
     app = FastAPI()
     static_dir = (
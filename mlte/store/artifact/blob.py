@@ -0,0 +1,174 @@
+"""
+mlte/store/artifact/blob.py
+
+Content-addressed storage of large value payloads.
+
+Image data and large arrays are stored out of line, in the blob area of a
+store, and artifacts only keep the digest of the payload. Blobs are addressed
+by the hash of their content, so identical payloads are stored only once.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import re
+import typing
+from typing import Callable, Iterable, Iterator, Optional
+
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.store.artifact.store import ArtifactStore, ManagedArtifactSession
+from mlte.value.model import ArrayValueModel, ImageValueModel, ValueModel
+
+DIGEST_ALGORITHM = "sha256"
+"""The hash algorithm used to address blobs."""
+
+ARRAY_BLOB_THRESHOLD = 64 * 1024
+"""The size, in bytes of JSON, above which arrays are stored out of line."""
+
+BLOB_CHUNK_SIZE = 64 * 1024
+"""The size of the chunks blobs are read and written in, in bytes."""
+
+_DIGEST_PATTERN = re.compile(f"^{DIGEST_ALGORITHM}:[0-9a-f]{{64}}$")
+"""The format of a blob digest."""
+
+
+def blob_digest(content: bytes) -> str:
+    """
+    Compute the digest that addresses a blob.
+    :param content: The blob content
+    :return: The digest
+    """
+    return f"{DIGEST_ALGORITHM}:{hashlib.sha256(content).hexdigest()}"
+
+
+def check_digest(digest: str) -> str:
+    """
+    Check that a digest is well formed.
+    :param digest: The digest
+    :raises ValueError: If the digest is malformed
+    :return: The hex-encoded hash in the digest
+    """
+    if _DIGEST_PATTERN.match(digest) is None:
+        raise ValueError(f"Malformed blob digest '{digest}'.")
+    return digest.split(":", 1)[1]
+
+
+def checked_chunks(chunks: Iterable[bytes], digest: str) -> Iterator[bytes]:
+    """
+    Pass the chunks of a blob through, checking the digest of the content.
+    :param chunks: The blob content, in chunks
+    :param digest: The expected digest of the content
+    :raises ValueError: If the content does not match the digest, once the
+    last chunk was passed through
+    :return: The chunks
+    """
+    hash = hashlib.new(DIGEST_ALGORITHM)
+    for chunk in chunks:
+        hash.update(chunk)
+        yield chunk
+    if f"{DIGEST_ALGORITHM}:{hash.hexdigest()}" != digest:
+        raise ValueError("Blob content does not match its digest.")
+
+
+def content_chunks(content: bytes) -> Iterator[bytes]:
+    """
+    Split blob content into chunks.
+    :param content: The blob content
+    :return: The chunks
+    """
+    for start in range(0, len(content), BLOB_CHUNK_SIZE):
+        yield content[start : start + BLOB_CHUNK_SIZE]
+
+
+def offload_blobs(
+    artifact: ArtifactModel, write_blob: Callable[[bytes], str]
+) -> ArtifactModel:
+    """
+    Move the large value payloads of an artifact to the blob area of a store.
+    :param artifact: The artifact
+    :param write_blob: Writes a blob to the store, and returns its digest
+    :return: The artifact, with its payloads replaced by blob digests
+    """
+    content = blob_payload(artifact)
+    if content is None:
+        return artifact
+    return with_blob(artifact, write_blob(content))
+
+
+def blob_payload(artifact: ArtifactModel) -> Optional[bytes]:
+    """
+    Get the payload of an artifact that should be stored out of line.
+    :param artifact: The artifact
+    :return: The payload, or None if the artifact is stored as is
+    """
+    if artifact.header.type != ArtifactType.VALUE:
+        return None
+
+    value = typing.cast(ValueModel, artifact.body).value
+    if isinstance(value, ImageValueModel) and value.data is not None:
+        return base64.decodebytes(value.data.encode("utf-8"))
+    if isinstance(value, ArrayValueModel) and value.data is not None:
+        content = json.dumps(value.data).encode("utf-8")
+        if len(content) >= ARRAY_BLOB_THRESHOLD:
+            return content
+    return None
+
+
+def with_blob(artifact: ArtifactModel, digest: str) -> ArtifactModel:
+    """
+    Replace the payload of an artifact with a reference to its blob.
+    :param artifact: The artifact, with a payload to store out of line
+    :param digest: The digest of the stored payload
+    :return: The artifact, referencing the blob
+    """
+    body = typing.cast(ValueModel, artifact.body)
+    return artifact.model_copy(
+        update={
+            "body": body.model_copy(
+                update={
+                    "value": body.value.model_copy(
+                        update={"data": None, "blob": digest}
+                    )
+                }
+            )
+        }
+    )
+
+
+class LazyBlob:
+    """A blob in a store, fetched on first access."""
+
+    def __init__(self, digest: str) -> None:
+        self.digest = digest
+        """The digest of the blob."""
+
+        self.store: Optional[ArtifactStore] = None
+        """The store the blob is read from."""
+
+        self._content: Optional[bytes] = None
+        """The content of the blob, once fetched."""
+
+    def bind(self, store: ArtifactStore) -> None:
+        """
+        Set the store that the blob is read from.
+        :param store: The store
+        """
+        self.store = store
+
+    def read(self) -> bytes:
+        """
+        Get the content of the blob, fetching it on first access.
+        :raises RuntimeError: If the blob is not bound to a store
+        :return: The blob content
+        """
+        if self._content is None:
+            if self.store is None:
+                raise RuntimeError(
+                    f"Blob {self.digest} is not bound to a store; load the value from a store to read it."
+                )
+            with ManagedArtifactSession(self.store.session()) as handle:
+                self._content = handle.read_blob(self.digest)
+        return self._content
@@ -5,10 +5,6 @@ Top-level functions for artifact store creation.
 """
 
 from mlte.store.artifact.store import ArtifactStore
-from mlte.store.artifact.underlying.fs import LocalFileSystemStore
-from mlte.store.artifact.underlying.http import HttpArtifactStore
-from mlte.store.artifact.underlying.memory import InMemoryStore
-from mlte.store.artifact.underlying.rdbs.store import RelationalDBStore
 from mlte.store.base import StoreType, StoreURI
 
 
@@ -20,12 +16,20 @@ def create_store(uri: str) -> ArtifactStore:
     """
     parsed_uri = StoreURI.from_string(uri)
     if parsed_uri.type == StoreType.LOCAL_MEMORY:
+        from mlte.store.artifact.underlying.memory import InMemoryStore
+
         return InMemoryStore(parsed_uri)
     if parsed_uri.type == StoreType.LOCAL_FILESYSTEM:
+        from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+
         return LocalFileSystemStore(parsed_uri)
     if parsed_uri.type == StoreType.REMOTE_HTTP:
+        from mlte.store.artifact.underlying.http import HttpArtifactStore
+
         return HttpArtifactStore(parsed_uri)
     if parsed_uri.type == StoreType.RELATIONAL_DB:
+        from mlte.store.artifact.underlying.rdbs.store import RelationalDBStore
+
         return RelationalDBStore(parsed_uri)
     else:
         raise Exception(
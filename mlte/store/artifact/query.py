@@ -7,15 +7,16 @@ Query and filtering functionality for store operations.
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Literal, Union
+from typing import List, Literal, Optional, Set, Union
 
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.model import BaseModel
 
 # A type alias
 Filter = Union[
     "ArtifactIdentifierFilter",
+    "ArtifactIdentifierPrefixFilter",
     "ArtifactTypeFilter",
     "AndFilter",
     "OrFilter",
@@ -34,6 +35,9 @@ class FilterType(str, Enum):
     IDENTIFIER = "identifier"
     """A filter over artifact identifiers."""
 
+    IDENTIFIER_PREFIX = "identifier_prefix"
+    """A filter over artifact identifier prefixes."""
+
     TYPE = "type"
     """A filter over artifact types."""
 
@@ -60,7 +64,26 @@ class ArtifactIdentifierFilter(BaseModel):
     """The artifact identifier to match."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return artifact.header.identifier == self.artifact_id
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return header.identifier == self.artifact_id
+
+
+class ArtifactIdentifierPrefixFilter(BaseModel):
+    """A filter that matches artifact identifiers that start with a prefix."""
+
+    type: Literal[FilterType.IDENTIFIER_PREFIX]
+    """An identifier for the filter type."""
+
+    prefix: str
+    """The artifact identifier prefix to match."""
+
+    def match(self, artifact: ArtifactModel) -> bool:
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return header.identifier.startswith(self.prefix)
 
 
 class ArtifactTypeFilter(BaseModel):
@@ -73,7 +96,10 @@ class ArtifactTypeFilter(BaseModel):
     """The artifact type to match."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return artifact.header.type == self.artifact_type
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return header.type == self.artifact_type
 
 
 class AllFilter(BaseModel):
@@ -85,6 +111,9 @@ class AllFilter(BaseModel):
     def match(self, _: ArtifactModel) -> bool:
         return True
 
+    def match_header(self, _: ArtifactHeaderModel) -> bool:
+        return True
+
 
 class NoneFilter(BaseModel):
     """A filter that matches no artifacts."""
@@ -95,6 +124,9 @@ class NoneFilter(BaseModel):
     def match(self, _: ArtifactModel) -> bool:
         return False
 
+    def match_header(self, _: ArtifactHeaderModel) -> bool:
+        return False
+
 
 class AndFilter(BaseModel):
     """A generic filter that implements a logical AND of filters."""
@@ -106,7 +138,10 @@ class AndFilter(BaseModel):
     """The filters of which the composition is composed."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return all(filter.match(artifact) for filter in self.filters)
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return all(filter.match_header(header) for filter in self.filters)
 
 
 class OrFilter(BaseModel):
@@ -119,7 +154,10 @@ class OrFilter(BaseModel):
     """The filters of which the composition is composed."""
 
     def match(self, artifact: ArtifactModel) -> bool:
-        return any(filter.match(artifact) for filter in self.filters)
+        return self.match_header(artifact.header)
+
+    def match_header(self, header: ArtifactHeaderModel) -> bool:
+        return any(filter.match_header(header) for filter in self.filters)
 
 
 class Query(BaseModel):
@@ -132,3 +170,87 @@ class Query(BaseModel):
 # Necessary for pydantic to resolve forward references
 AndFilter.model_rebuild()
 OrFilter.model_rebuild()
+
+# -----------------------------------------------------------------------------
+# Index Selection
+# -----------------------------------------------------------------------------
+
+
+class ArtifactIndex:
+    """
+    The interface of secondary indexes over the artifacts of a version,
+    which stores can keep to avoid scanning all artifacts in a query.
+    """
+
+    def with_identifier(self, artifact_id: str) -> Set[str]:
+        """
+        Look up an artifact by identifier.
+        :param artifact_id: The artifact identifier
+        :return: The identifier, if the artifact exists, or an empty set
+        """
+        raise NotImplementedError("Cannot invoke method on abstract index.")
+
+    def with_identifier_prefix(self, prefix: str) -> Set[str]:
+        """
+        Look up artifacts by identifier prefix.
+        :param prefix: The identifier prefix
+        :return: The identifiers of the artifacts that start with the prefix
+        """
+        raise NotImplementedError("Cannot invoke method on abstract index.")
+
+    def with_type(self, artifact_type: ArtifactType) -> Set[str]:
+        """
+        Look up artifacts by type.
+        :param artifact_type: The artifact type
+        :return: The identifiers of the artifacts of the type
+        """
+        raise NotImplementedError("Cannot invoke method on abstract index.")
+
+
+def index_candidates(
+    filter: Filter, index: ArtifactIndex
+) -> Optional[Set[str]]:
+    """
+    Use an index to narrow down the artifacts that may match a filter.
+
+    Candidates are a superset of the matching artifacts, so the filter must
+    still be applied to them.
+    :param filter: The filter
+    :param index: The index over the artifacts to filter
+    :return: The identifiers of the candidate artifacts, or None if the
+    index cannot narrow down the filter and all artifacts must be scanned
+    """
+    if isinstance(filter, AllFilter):
+        return None
+    if isinstance(filter, NoneFilter):
+        return set()
+    if isinstance(filter, ArtifactIdentifierFilter):
+        return index.with_identifier(filter.artifact_id)
+    if isinstance(filter, ArtifactIdentifierPrefixFilter):
+        return index.with_identifier_prefix(filter.prefix)
+    if isinstance(filter, ArtifactTypeFilter):
+        return index.with_type(filter.artifact_type)
+    if isinstance(filter, AndFilter):
+        # Any indexed operand narrows down the whole conjunction; start from
+        # the smallest one to keep the intersections cheap.
+        narrowed = [
+            candidates
+            for candidates in (
+                index_candidates(f, index) for f in filter.filters
+            )
+            if candidates is not None
+        ]
+        if len(narrowed) == 0:
+            return None
+        narrowed.sort(key=len)
+        return narrowed[0].intersection(*narrowed[1:])
+    if isinstance(filter, OrFilter):
+        # A disjunction can only be narrowed down if all its operands can.
+        union: Set[str] = set()
+        for f in filter.filters:
+            candidates = index_candidates(f, index)
+            if candidates is None:
+                return None
+            union |= candidates
+        return union
+    raise Exception(f"Unsupported filter type for index selection: {filter}")
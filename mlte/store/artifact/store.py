@@ -7,13 +7,17 @@ MLTE artifact store interface implementation.
 from __future__ import annotations
 
 import time
-from typing import List, Optional, cast
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, cast
 
+import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
 from mlte.store.artifact.query import Query
 from mlte.store.base import ManagedSession, Store, StoreSession
 
+ArtifactResult = Union[ArtifactModel, RuntimeError]
+"""The outcome of one item of a batch operation: the artifact, or the store error it failed with."""
+
 # -----------------------------------------------------------------------------
 # ArtifactStore
 # -----------------------------------------------------------------------------
@@ -184,6 +188,82 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def write_artifacts_with_header(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+        user: Optional[str] = None,
+    ) -> List[ArtifactResult]:
+        """
+        Write a batch of artifacts, generating the timestamp and adding creator. Internally calls the actual write_artifacts implementation.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        :return: The result for each artifact, in order
+        """
+        timestamp = int(time.time())
+        for artifact in artifacts:
+            artifact.header.timestamp = timestamp
+            artifact.header.creator = user
+        return self.write_artifacts(
+            model_id,
+            version_id,
+            artifacts,
+            force=force,
+            parents=parents,
+        )
+
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactResult]:
+        """
+        Write a batch of artifacts.
+
+        Failures are reported per artifact: the result for an artifact that
+        could not be written is the store error it failed with. An artifact
+        whose identifier already appeared earlier in the batch fails with
+        ErrorAlreadyExists. The default implementation writes the artifacts
+        one at a time; stores override it to write the batch at once.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        :return: The result for each artifact, in order
+        """
+        results: List[ArtifactResult] = []
+        for artifact, duplicate in zip(artifacts, find_duplicates(artifacts)):
+            if duplicate is not None:
+                results.append(duplicate)
+                continue
+            try:
+                results.append(
+                    self.write_artifact(
+                        model_id,
+                        version_id,
+                        artifact,
+                        force=force,
+                        parents=parents,
+                    )
+                )
+            except (errors.ErrorNotFound, errors.ErrorAlreadyExists) as e:
+                results.append(e)
+        return results
+
     def read_artifact(
         self,
         model_id: str,
@@ -207,19 +287,88 @@ class ArtifactStoreSession(StoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ArtifactModel]:
         """
-        Read artifacts withi limit and offset.
+        Read artifacts with limit and offset, or with limit and a cursor.
         :param model_id: The identifier for the model
         :param version_id: The identifier for the model version
         :param limit: The limit on artifacts to read
-        :param offset: The offset on artifacts to read
+        :param offset: The offset on artifacts to read, ignored if a cursor is given
+        :param cursor: The identifier of the last artifact of the previous page;
+        if given, only artifacts that come after it are read, also when it
+        was deleted since
+        :raises ErrorNotFound: If the store cannot place the cursor, as it
+        never named an artifact of the version
         :return: The read artifacts
         """
         raise NotImplementedError(
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        batch_size: int = 100,
+    ) -> Iterator[ArtifactModel]:
+        """
+        Iterate over all artifacts in a version, in the order they are read.
+
+        Artifacts are read lazily, one batch at a time, so that only a batch
+        is held in memory however large the version is. The default
+        implementation pages through `read_artifacts` with a cursor.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param batch_size: The number of artifacts read at a time
+        :raises ValueError: If the batch size is less than 1
+        :return: An iterator over the artifacts
+        """
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1.")
+        return self._iter_artifacts(model_id, version_id, batch_size)
+
+    def _iter_artifacts(
+        self, model_id: str, version_id: str, batch_size: int
+    ) -> Iterator[ArtifactModel]:
+        """Page through the artifacts in a version; see iter_artifacts()."""
+        cursor: Optional[str] = None
+        while True:
+            batch = self.read_artifacts(
+                model_id, version_id, limit=batch_size, cursor=cursor
+            )
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            cursor = batch[-1].header.identifier
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+    ) -> List[ArtifactResult]:
+        """
+        Read a batch of artifacts by identifier.
+
+        Failures are reported per identifier: the result for an artifact that
+        could not be read is the store error it failed with. The default
+        implementation reads the artifacts one at a time.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifact_ids: The artifact identifiers
+        :return: The result for each identifier, in order
+        """
+        results: List[ArtifactResult] = []
+        for artifact_id in artifact_ids:
+            try:
+                results.append(
+                    self.read_artifact(model_id, version_id, artifact_id)
+                )
+            except errors.ErrorNotFound as e:
+                results.append(e)
+        return results
+
     def search_artifacts(
         self,
         model_id: str,
@@ -254,6 +403,82 @@ class ArtifactStoreSession(StoreSession):
             "Cannot invoke method on abstract ArtifactStoreSession."
         )
 
+    # -------------------------------------------------------------------------
+    # Interface: Blob
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, content: bytes) -> str:
+        """
+        Write a blob to the content-addressed blob area of the store.
+
+        Writing a blob that is already stored is a no-op.
+        :param content: The blob content
+        :return: The digest that addresses the blob
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def read_blob(self, digest: str) -> bytes:
+        """
+        Read a blob from the content-addressed blob area of the store.
+        :param digest: The digest that addresses the blob
+        :raises ErrorNotFound: If the blob is not stored
+        :return: The blob content
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def write_blob_chunks(self, chunks: Iterable[bytes], digest: str) -> str:
+        """
+        Write a blob from its content in chunks, checking it against its
+        digest. Stores that can write blobs incrementally do so without
+        holding the whole content in memory.
+        :param chunks: The blob content, in chunks
+        :param digest: The digest of the blob
+        :raises ValueError: If the content does not match the digest
+        :return: The digest that addresses the blob
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+    def read_blob_chunks(self, digest: str) -> Tuple[int, Iterator[bytes]]:
+        """
+        Read a blob in chunks. Stores that can read blobs incrementally do so
+        without holding the whole content in memory.
+        :param digest: The digest that addresses the blob
+        :raises ErrorNotFound: If the blob is not stored
+        :return: The size of the blob, and its content in chunks
+        """
+        raise NotImplementedError(
+            "Cannot invoke method on abstract ArtifactStoreSession."
+        )
+
+
+def find_duplicates(
+    artifacts: List[ArtifactModel],
+) -> List[Optional[errors.ErrorAlreadyExists]]:
+    """
+    Find the artifacts of a batch whose identifier appeared earlier in it.
+    :param artifacts: The artifacts of the batch
+    :return: For each artifact, an error if it is a duplicate, or None
+    """
+    seen = set()
+    duplicates: List[Optional[errors.ErrorAlreadyExists]] = []
+    for artifact in artifacts:
+        identifier = artifact.header.identifier
+        duplicates.append(
+            errors.ErrorAlreadyExists(
+                f"Artifact '{identifier}' appears more than once in the batch."
+            )
+            if identifier in seen
+            else None
+        )
+        seen.add(identifier)
+    return duplicates
+
 
 class ManagedArtifactSession(ManagedSession):
     """A simple context manager for store sessions."""
@@ -5,21 +5,217 @@ Implementation of local file system artifact store.
 """
 from __future__ import annotations
 
+import bisect
+import hashlib
+import json
+import os
 from pathlib import Path
-from typing import List
+from typing import (
+    Any,
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pydantic
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.model import BaseModel
+from mlte.store.artifact.blob import (
+    BLOB_CHUNK_SIZE,
+    blob_digest,
+    check_digest,
+    checked_chunks,
+    offload_blobs,
+)
 from mlte.store.artifact.query import Query
-from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
+from mlte.store.artifact.store import (
+    ArtifactResult,
+    ArtifactStore,
+    ArtifactStoreSession,
+)
 from mlte.store.base import StoreURI
-from mlte.store.common.fs import JsonFileStorage, parse_root_path
+from mlte.store.common.fs import (
+    CODECS,
+    DEFAULT_CODEC,
+    JsonFileStorage,
+    codec_for_path,
+    parse_codec,
+    parse_root_path,
+)
 
 BASE_MODELS_FOLDER = "models"
 """Base fodler to store models in."""
 
+BASE_BLOBS_FOLDER = "blobs"
+"""Base folder to store blobs in, shared by all models and versions."""
+
+MANIFEST_FILENAME = ".manifest"
+"""Name of the manifest file kept in each version folder."""
+
+JOURNAL_FILENAME = ".manifest.journal"
+"""Name of the journal of manifest updates kept in each version folder."""
+
+JOURNAL_COMPACTION_MIN = 256
+"""The least number of journal records merged into the manifest at once."""
+
+
+# -----------------------------------------------------------------------------
+# Manifest
+# -----------------------------------------------------------------------------
+
+
+class ManifestEntry(BaseModel):
+    """The manifest entry of a single stored artifact."""
+
+    header: ArtifactHeaderModel
+    """The header of the artifact."""
+
+    size: int
+    """The size of the artifact file, in bytes."""
+
+    sha256: str
+    """The SHA-256 hash of the artifact file."""
+
+    codec: str = DEFAULT_CODEC
+    """The name of the codec the artifact file was written with."""
+
+
+class VersionManifest(BaseModel):
+    """
+    An index of the artifacts stored in a version folder.
+
+    It allows listing, paging and searching artifacts by their headers
+    without opening the artifact files themselves.
+    """
+
+    entries: Dict[str, ManifestEntry] = {}
+    """Artifact identifier - manifest entry for that artifact."""
+
+    _identifiers: Optional[List[str]] = pydantic.PrivateAttr(default=None)
+
+    def identifiers(self) -> List[str]:
+        """Return the artifact identifiers, in sorted order."""
+        # Cached manifests are never modified, only replaced.
+        if self._identifiers is None:
+            self._identifiers = sorted(self.entries.keys())
+        return self._identifiers
+
+    def updated(
+        self, changes: Dict[str, Optional[ManifestEntry]]
+    ) -> VersionManifest:
+        """
+        Return a copy of the manifest with entries replaced or removed.
+        :param changes: Artifact identifier - new entry, or None to remove it
+        :return: The updated manifest
+        """
+        entries = dict(self.entries)
+        for identifier, entry in changes.items():
+            if entry is None:
+                entries.pop(identifier, None)
+            else:
+                entries[identifier] = entry
+        return VersionManifest.model_construct(entries=entries)
+
+
+def _manifest_entry(
+    header: ArtifactHeaderModel, content: bytes, codec: str
+) -> ManifestEntry:
+    """
+    Build the manifest entry for an artifact file.
+    :param header: The header of the artifact
+    :param content: The serialized artifact, as stored in its file
+    :param codec: The name of the codec used to serialize the artifact
+    :return: The manifest entry
+    """
+    return ManifestEntry(
+        header=header,
+        size=len(content),
+        sha256=hashlib.sha256(content).hexdigest(),
+        codec=codec,
+    )
+
+
+class _ManifestState:
+    """
+    A version manifest held in memory, with the files it was read from.
+
+    The manifest of a version is stored as a compact snapshot, plus a journal
+    that writers append updates to, one JSON record per line. Once the
+    journal holds as many records as the snapshot has entries, the two are
+    merged into a new snapshot and an empty journal, both marked with a new
+    generation. This keeps writes proportional to the updated entries, and
+    lets readers catch up on the journal records they have not read yet.
+    """
+
+    def __init__(
+        self,
+        manifest: VersionManifest,
+        generation: int,
+        snapshot_key: Tuple[int, int, int],
+    ) -> None:
+        self.manifest = manifest
+        """The manifest, which is replaced rather than modified."""
+
+        self.generation = generation
+        """The generation of the snapshot."""
+
+        self.snapshot_key = snapshot_key
+        """The inode, modification time and size of the snapshot file."""
+
+        self.journal_inode: Optional[int] = None
+        """The inode of the journal, or None if there is no usable journal."""
+
+        self.journal_offset = 0
+        """The size of the journal content read so far."""
+
+        self.journal_records = 0
+        """The number of journal records read so far."""
+
+    def advanced(
+        self,
+        changes: Dict[str, Optional[ManifestEntry]],
+        journal_inode: int,
+        journal_offset: int,
+        records: int,
+    ) -> _ManifestState:
+        """Return the state after reading or writing journal records."""
+        state = _ManifestState(
+            self.manifest.updated(changes) if changes else self.manifest,
+            self.generation,
+            self.snapshot_key,
+        )
+        state.journal_inode = journal_inode
+        state.journal_offset = journal_offset
+        state.journal_records = self.journal_records + records
+        return state
+
+
+def _snapshot_key(stat: os.stat_result) -> Tuple[int, int, int]:
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _file_chunks(f: BinaryIO) -> Iterator[bytes]:
+    """Read an open file in chunks, closing it at the end."""
+    with f:
+        while True:
+            chunk = f.read(BLOB_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _journal_record(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8") + b"\n"
+
 
 # -----------------------------------------------------------------------------
 # LocalFileSystemStore
@@ -27,20 +223,31 @@ BASE_MODELS_FOLDER = "models"
 
 
 class LocalFileSystemStore(ArtifactStore):
-    """A local file system implementation of the MLTE artifact store."""
+    """
+    A local file system implementation of the MLTE artifact store.
+
+    New artifacts are encoded with the codec selected by the `codec` URI
+    parameter (e.g. `fs:///path?codec=msgpack`); artifacts written with
+    other codecs can still be read.
+    """
 
     def __init__(self, uri: StoreURI) -> None:
         super().__init__(uri=uri)
 
-        self.storage = JsonFileStorage()
+        self.storage = JsonFileStorage(codec=parse_codec(uri.uri))
         """The underlying storage for the store."""
 
+        self.manifests: Dict[Path, _ManifestState] = {}
+        """The manifests read by sessions, by version folder."""
+
     def session(self) -> LocalFileSystemStoreSession:
         """
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return LocalFileSystemStoreSession(self.uri.uri, storage=self.storage)
+        return LocalFileSystemStoreSession(
+            self.uri.uri, storage=self.storage, manifests=self.manifests
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -51,10 +258,18 @@ class LocalFileSystemStore(ArtifactStore):
 class LocalFileSystemStoreSession(ArtifactStoreSession):
     """A local file-system implementation of the MLTE artifact store."""
 
-    def __init__(self, uri: str, storage: JsonFileStorage) -> None:
+    def __init__(
+        self,
+        uri: str,
+        storage: JsonFileStorage,
+        manifests: Optional[Dict[Path, _ManifestState]] = None,
+    ) -> None:
         self.storage = storage
         """A reference to underlying storage."""
 
+        self.manifests = manifests if manifests is not None else {}
+        """The manifests read so far, shared by the sessions of a store."""
+
         self.root = parse_root_path(uri)
         """The remote artifact store URL."""
 
@@ -74,6 +289,16 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         # Closing a local FS session is a no-op.
         pass
 
+    def group_commit(self) -> ContextManager[None]:
+        """
+        Batch the disk flushes of the writes done within the returned context.
+
+        Useful for bulk ingestion: all artifacts written in the batch are
+        flushed to disk once, when the context exits.
+        :return: The batch, to be used as a context manager
+        """
+        return self.storage.group_commit()
+
     # -------------------------------------------------------------------------
     # Structural Elements
     # -------------------------------------------------------------------------
@@ -102,6 +327,10 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         self._ensure_model_exists(model_id)
         model = self._read_model(model_id)
         self.storage.delete_folder(Path(self._base_path(), model_id))
+        for version in model.versions:
+            self.manifests.pop(
+                self._base_artifact_path(model_id, version.identifier), None
+            )
         return model
 
     def create_version(self, model_id: str, version: VersionCreate) -> Version:
@@ -138,6 +367,7 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         self.storage.delete_folder(
             Path(self._base_path(), model_id, version_id)
         )
+        self.manifests.pop(self._base_artifact_path(model_id, version_id), None)
         return version
 
     # -------------------------------------------------------------------------
@@ -202,33 +432,74 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         if parents:
             storeutil.create_parents(self, model_id, version_id)
 
-        artifacts = self._get_version_artifacts(model_id, version_id)
-        if artifact.header.identifier in artifacts and not force:
-            raise errors.ErrorAlreadyExists(
-                f"Artifact '{artifact.header.identifier}'"
-            )
+        with self._lock_version(model_id, version_id):
+            state = self._load_manifest(model_id, version_id)
+            previous = state.manifest.entries.get(artifact.header.identifier)
+            if previous is not None and not force:
+                raise errors.ErrorAlreadyExists(
+                    f"Artifact '{artifact.header.identifier}'"
+                )
 
-        self.storage.write_json_to_file(
-            self._artifact_path(
-                model_id, version_id, artifact.header.identifier
-            ),
-            artifact.model_dump(),
-        )
+            artifact = offload_blobs(artifact, self.write_blob)
+            codec = self.storage.codec.name
+            path = self._artifact_path(
+                model_id, version_id, artifact.header.identifier, codec
+            )
+            content = self.storage.encode(artifact.model_dump())
+            self.storage.write_bytes_to_file(path, content)
+            self._update_manifest(
+                model_id,
+                version_id,
+                state,
+                {
+                    artifact.header.identifier: _manifest_entry(
+                        artifact.header, content, codec
+                    )
+                },
+            )
+            if previous is not None:
+                # An overwritten artifact may have been stored with another
+                # codec, and so in a file with another extension.
+                previous_path = self._artifact_path(
+                    model_id,
+                    version_id,
+                    artifact.header.identifier,
+                    previous.codec,
+                )
+                if previous_path != path:
+                    self.storage.delete_file(previous_path)
         return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactResult]:
+        # The whole batch is flushed to disk once.
+        with self.group_commit():
+            return super().write_artifacts(
+                model_id,
+                version_id,
+                artifacts,
+                force=force,
+                parents=parents,
+            )
+
     def read_artifact(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
-        artifacts = self._get_version_artifacts(model_id, version_id)
+        manifest = self._read_manifest(model_id, version_id)
 
-        self._ensure_artifact_exists(artifact_id, artifacts)
-        return ArtifactModel(
-            **self.storage.read_json_file(
-                self._artifact_path(model_id, version_id, artifact_id)
-            )
+        self._ensure_artifact_exists(artifact_id, manifest)
+        return self._read_artifact_file(
+            model_id, version_id, artifact_id, manifest.entries[artifact_id]
         )
 
     def read_artifacts(
@@ -237,16 +508,17 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ArtifactModel]:
-        artifacts = self._get_version_artifacts(model_id, version_id)
-        return [
-            ArtifactModel(
-                **self.storage.read_json_file(
-                    self._artifact_path(model_id, version_id, artifact_id)
-                )
-            )
-            for artifact_id in artifacts
-        ][offset : offset + limit]
+        manifest = self._read_manifest(model_id, version_id)
+        artifacts = manifest.identifiers()
+        if cursor is not None:
+            # Artifacts are listed in sorted order, so the cursor position can
+            # be found even if that artifact was deleted in the meantime.
+            offset = bisect.bisect_right(artifacts, cursor)
+        return self._read_artifact_files(
+            model_id, version_id, manifest, artifacts[offset : offset + limit]
+        )
 
     def search_artifacts(
         self,
@@ -254,10 +526,20 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        artifacts = self.read_artifacts(model_id, version_id)
-        return [
-            artifact for artifact in artifacts if query.filter.match(artifact)
-        ]
+        # Filters only look at headers, so only matching artifacts are opened.
+        manifest = self._read_manifest(model_id, version_id)
+        return self._read_artifact_files(
+            model_id,
+            version_id,
+            manifest,
+            [
+                artifact_id
+                for artifact_id in manifest.identifiers()
+                if query.filter.match_header(
+                    manifest.entries[artifact_id].header
+                )
+            ],
+        )
 
     def delete_artifact(
         self,
@@ -265,44 +547,405 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         version_id: str,
         artifact_id: str,
     ) -> ArtifactModel:
-        artifact = self.read_artifact(model_id, version_id, artifact_id)
-        self.storage.delete_file(
-            self._artifact_path(
-                model_id, version_id, artifact.header.identifier
+        with self._lock_version(model_id, version_id):
+            state = self._load_manifest(model_id, version_id)
+            self._ensure_artifact_exists(artifact_id, state.manifest)
+
+            entry = state.manifest.entries[artifact_id]
+            artifact = self._read_artifact_file(
+                model_id, version_id, artifact_id, entry
+            )
+            # Readers do not lock, so the artifact leaves the manifest before
+            # its file is removed.
+            self._update_manifest(
+                model_id, version_id, state, {artifact_id: None}
+            )
+            self.storage.delete_file(
+                self._artifact_path(
+                    model_id, version_id, artifact_id, entry.codec
+                )
             )
-        )
         return artifact
 
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, content: bytes) -> str:
+        digest = blob_digest(content)
+        path = self._blob_path(digest)
+        if not path.exists():
+            try:
+                self.storage.create_folder(path.parent)
+            except FileExistsError:
+                pass
+            self.storage.write_bytes_to_file(path, content)
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        path = self._blob_path(digest)
+        if not path.exists():
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return self.storage.read_bytes_from_file(path)
+
+    def write_blob_chunks(self, chunks: Iterable[bytes], digest: str) -> str:
+        path = self._blob_path(digest)
+        if not path.exists():
+            try:
+                self.storage.create_folder(path.parent)
+            except FileExistsError:
+                pass
+            # A blob that does not match its digest is never renamed in place.
+            self.storage.write_chunks_to_file(
+                path, checked_chunks(chunks, digest)
+            )
+        return digest
+
+    def read_blob_chunks(self, digest: str) -> Tuple[int, Iterator[bytes]]:
+        path = self._blob_path(digest)
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return os.fstat(f.fileno()).st_size, _file_chunks(f)
+
+    # -------------------------------------------------------------------------
+    # Manifests
+    # -------------------------------------------------------------------------
+
+    def rebuild_manifest(
+        self, model_id: str, version_id: str
+    ) -> VersionManifest:
+        """
+        Rebuild the manifest of a version from the artifact files in it.
+
+        This repairs a manifest that no longer matches the folder contents,
+        for example after artifact files were added or removed by hand.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :raises ErrorNotFound: If the required structural elements are not present
+        :return: The rebuilt manifest
+        """
+        with self._lock_version(model_id, version_id):
+            generation = self._stored_generation(model_id, version_id) + 1
+            manifest = VersionManifest()
+            for path in self.storage.list_json_files(
+                self._base_artifact_path(model_id, version_id)
+            ):
+                codec = codec_for_path(path)
+                assert codec is not None, "Listed file has no codec."
+                content = self.storage.read_bytes_from_file(path)
+                artifact = ArtifactModel(**codec.decode(content))
+                manifest.entries[artifact.header.identifier] = _manifest_entry(
+                    artifact.header, content, codec.name
+                )
+
+            self._write_manifest(model_id, version_id, manifest, generation)
+            return manifest
+
+    def rebuild_manifests(self) -> int:
+        """
+        Rebuild the manifests of all versions of all models in the store.
+        :return: The number of manifests rebuilt
+        """
+        count = 0
+        for model_id in self.list_models():
+            for version_id in self.list_versions(model_id):
+                self.rebuild_manifest(model_id, version_id)
+                count += 1
+        return count
+
     # -------------------------------------------------------------------------
     # Internal helpers.
     # -------------------------------------------------------------------------
 
     def _ensure_artifact_exists(
-        self, artifact_id: str, artifacts: List[str]
+        self, artifact_id: str, manifest: VersionManifest
     ) -> None:
         """Throws an ErrorNotFound if the given artifact does not exist."""
-        if artifact_id not in artifacts:
+        if artifact_id not in manifest.entries:
             raise errors.ErrorNotFound(f"Artifact {artifact_id}")
 
-    def _get_version_artifacts(
+    def _read_manifest(self, model_id: str, version_id: str) -> VersionManifest:
+        """
+        Get the manifest of the artifacts of a version.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :raises ErrorNotFound: If the required structural elements are not present
+        :return: The version manifest, which must not be modified
+        """
+        return self._load_manifest(model_id, version_id).manifest
+
+    def _load_manifest(self, model_id: str, version_id: str) -> _ManifestState:
+        """
+        Bring the manifest of a version held in memory up to date.
+
+        The snapshot is only parsed again when its file changed, and only the
+        journal records appended since the last read are parsed. Versions
+        created before manifests were introduced do not have one, so it is
+        built from the artifact files the first time it is needed.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :raises ErrorNotFound: If the required structural elements are not present
+        :return: The up to date manifest state
+        """
+        self._ensure_model_exists(model_id)
+        self._ensure_version_exists(model_id, version_id)
+
+        folder = self._base_artifact_path(model_id, version_id)
+        path = self._manifest_path(model_id, version_id)
+        while True:
+            try:
+                key = _snapshot_key(path.stat())
+            except FileNotFoundError:
+                with self._lock_version(model_id, version_id):
+                    # Another writer may have created it while we waited.
+                    if not path.exists():
+                        self.rebuild_manifest(model_id, version_id)
+                continue
+
+            state = self.manifests.get(folder)
+            if state is None or state.snapshot_key != key:
+                try:
+                    data = self.storage.read_json_file(path)
+                except FileNotFoundError:
+                    continue
+                state = _ManifestState(
+                    VersionManifest(**data), data.get("generation", 0), key
+                )
+            updated = self._read_journal(model_id, version_id, state)
+            # Without an update, the snapshot was replaced while being read.
+            if updated is not None:
+                self.manifests[folder] = updated
+                return updated
+
+    def _read_journal(
+        self, model_id: str, version_id: str, state: _ManifestState
+    ) -> Optional[_ManifestState]:
+        """
+        Apply the journal records not read yet to a manifest state.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :param state: The manifest state
+        :return: The updated state, or None if the journal is newer than the
+        snapshot of the state
+        """
+        try:
+            f = self._journal_path(model_id, version_id).open("rb")
+        except FileNotFoundError:
+            return state
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            offset = state.journal_offset
+            if inode != state.journal_inode:
+                # A new journal, read from its start
+                state = _ManifestState(
+                    state.manifest, state.generation, state.snapshot_key
+                )
+                offset = 0
+            f.seek(offset)
+            content = f.read()
+
+        # A record still being appended is read once it is complete.
+        content = content[: content.rfind(b"\n") + 1]
+        lines = content.splitlines()
+        if offset == 0:
+            if not lines:
+                return state
+            generation = json.loads(lines.pop(0))["generation"]
+            if generation > state.generation:
+                return None
+            if generation < state.generation:
+                # Left by a merge that did not complete; the snapshot has it.
+                return state
+
+        changes: Dict[str, Optional[ManifestEntry]] = {}
+        for line in lines:
+            record = json.loads(line)
+            entry = record["entry"]
+            changes[record["id"]] = (
+                ManifestEntry(**entry) if entry is not None else None
+            )
+        return state.advanced(changes, inode, offset + len(content), len(lines))
+
+    def _update_manifest(
+        self,
+        model_id: str,
+        version_id: str,
+        state: _ManifestState,
+        changes: Dict[str, Optional[ManifestEntry]],
+    ) -> None:
+        """
+        Record updates to the manifest of a version in its journal, merging
+        the journal into the snapshot once it is large enough. The version
+        must be locked, and the state up to date.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :param state: The current manifest state
+        :param changes: Artifact identifier - new entry, or None to remove it
+        """
+        content = b"".join(
+            _journal_record(
+                {
+                    "id": identifier,
+                    "entry": entry.to_json() if entry is not None else None,
+                }
+            )
+            for identifier, entry in changes.items()
+        )
+        path = self._journal_path(model_id, version_id)
+        if state.journal_inode is None:
+            content = (
+                _journal_record({"generation": state.generation}) + content
+            )
+            self.storage.write_bytes_to_file(path, content)
+            offset = 0
+        else:
+            self.storage.append_bytes_to_file(
+                path, content, state.journal_offset
+            )
+            offset = state.journal_offset
+
+        state = state.advanced(
+            changes, path.stat().st_ino, offset + len(content), len(changes)
+        )
+        self.manifests[self._base_artifact_path(model_id, version_id)] = state
+        if state.journal_records >= max(
+            JOURNAL_COMPACTION_MIN, len(state.manifest.entries)
+        ):
+            self._write_manifest(
+                model_id, version_id, state.manifest, state.generation + 1
+            )
+
+    def _stored_generation(self, model_id: str, version_id: str) -> int:
+        """
+        Get the latest generation of the manifest files of a version, which
+        may be missing or damaged.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :return: The generation, or 0 if there is none
+        """
+        generation = 0
+        try:
+            data = self.storage.read_json_file(
+                self._manifest_path(model_id, version_id)
+            )
+            generation = data.get("generation", 0)
+        except (OSError, ValueError):
+            pass
+        try:
+            with self._journal_path(model_id, version_id).open("rb") as f:
+                header = json.loads(f.readline())
+            generation = max(generation, header["generation"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return generation
+
+    def _lock_version(
         self, model_id: str, version_id: str
-    ) -> List[str]:
+    ) -> ContextManager[None]:
         """
-        Get artifacts for a version from storage.
-         :param model_id: The identifier for the model
+        Lock a version folder, to serialize updates to its manifest across
+        sessions, threads and processes.
+        :param model_id: The identifier for the model
         :param version_id: The identifier for the version
         :raises ErrorNotFound: If the required structural elements are not present
-        :return: The associated artifacts
+        :return: The lock, to be used as a context manager
         """
         self._ensure_model_exists(model_id)
         self._ensure_version_exists(model_id, version_id)
+        return self.storage.lock_folder(
+            self._base_artifact_path(model_id, version_id)
+        )
 
-        return [
-            a.stem
-            for a in self.storage.list_json_files(
-                self._base_artifact_path(model_id, version_id)
+    def _write_manifest(
+        self,
+        model_id: str,
+        version_id: str,
+        manifest: VersionManifest,
+        generation: int,
+    ) -> None:
+        """
+        Atomically replace the manifest of a version, then start an empty
+        journal for it. The version must be locked.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the version
+        :param manifest: The new manifest
+        :param generation: The generation of the new manifest, later than any
+        stored one
+        """
+        path = self._manifest_path(model_id, version_id)
+        self.storage.write_compact_json_to_file(
+            path, {"generation": generation, **manifest.to_json()}
+        )
+        key = _snapshot_key(path.stat())
+
+        # Until the journal is replaced, readers skip it as too old.
+        journal = self._journal_path(model_id, version_id)
+        header = _journal_record({"generation": generation})
+        self.storage.write_bytes_to_file(journal, header)
+
+        state = _ManifestState(manifest, generation, key)
+        state.journal_inode = journal.stat().st_ino
+        state.journal_offset = len(header)
+        self.manifests[self._base_artifact_path(model_id, version_id)] = state
+
+    def _read_artifact_file(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+        entry: ManifestEntry,
+    ) -> ArtifactModel:
+        """
+        Read and parse an artifact file.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :param artifact_id: The artifact identifier
+        :param entry: The manifest entry of the artifact
+        :raises ErrorNotFound: If the artifact was deleted in the meantime
+        :return: The artifact
+        """
+        try:
+            data = self.storage.read_json_file(
+                self._artifact_path(
+                    model_id, version_id, artifact_id, entry.codec
+                )
             )
-        ]
+        except FileNotFoundError:
+            raise errors.ErrorNotFound(f"Artifact {artifact_id}")
+        return ArtifactModel(**data)
+
+    def _read_artifact_files(
+        self,
+        model_id: str,
+        version_id: str,
+        manifest: VersionManifest,
+        artifact_ids: List[str],
+    ) -> List[ArtifactModel]:
+        """
+        Read and parse artifact files, skipping artifacts deleted since the
+        manifest was read.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :param manifest: The manifest of the version
+        :param artifact_ids: The artifact identifiers
+        :return: The artifacts
+        """
+        artifacts = []
+        for artifact_id in artifact_ids:
+            try:
+                artifacts.append(
+                    self._read_artifact_file(
+                        model_id,
+                        version_id,
+                        artifact_id,
+                        manifest.entries[artifact_id],
+                    )
+                )
+            except errors.ErrorNotFound:
+                continue
+        return artifacts
 
     def _base_artifact_path(self, model_id: str, version_id: str) -> Path:
         """
@@ -313,20 +956,54 @@ class LocalFileSystemStoreSession(ArtifactStoreSession):
         """
         return Path(self._base_path(), model_id, version_id)
 
+    def _manifest_path(self, model_id: str, version_id: str) -> Path:
+        """
+        Format a local FS path to the manifest of a version of a model.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :return: The formatted path
+        """
+        return Path(
+            self._base_artifact_path(model_id, version_id), MANIFEST_FILENAME
+        )
+
+    def _journal_path(self, model_id: str, version_id: str) -> Path:
+        """
+        Format a local FS path to the manifest journal of a version of a model.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        :return: The formatted path
+        """
+        return Path(
+            self._base_artifact_path(model_id, version_id), JOURNAL_FILENAME
+        )
+
+    def _blob_path(self, digest: str) -> Path:
+        """
+        Formats a local FS path to a blob.
+        :param digest: The blob digest
+        :raises ValueError: If the digest is malformed
+        :return: The formatted path
+        """
+        hash = check_digest(digest)
+        return Path(self.root, BASE_BLOBS_FOLDER, hash[:2], hash)
+
     def _artifact_path(
         self,
         model_id: str,
         version_id: str,
         artifact_id: str,
-    ):
+        codec: str,
+    ) -> Path:
         """
         Formats a local FS path to an artifact.
         :param model_id: The model identifier
         :param version_id: The version identifier
         :param artifact_id: The artifact identifier
+        :param codec: The name of the codec the artifact is stored with
         :return: The formatted path
         """
         return Path(
             self._base_artifact_path(model_id, version_id),
-            self.storage.add_extension(artifact_id),
+            self.storage.add_extension(artifact_id, CODECS[codec]),
         )
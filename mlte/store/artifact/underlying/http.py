@@ -6,17 +6,55 @@ Implementation of HTTP artifact store.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import time
 import typing
-from typing import List
-
+import urllib.parse
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import mlte.backend.api.codes as codes
+import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
-from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.api.model import (
+    BatchArtifactsResponse,
+    ReadArtifactsRequest,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
 from mlte.backend.core.config import settings
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.blob import (
+    blob_digest,
+    blob_payload,
+    check_digest,
+    checked_chunks,
+    content_chunks,
+    offload_blobs,
+    with_blob,
+)
 from mlte.store.artifact.query import Query
-from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
-from mlte.store.base import StoreURI
-from mlte.store.common.http_clients import OAuthHttpClient, RequestsClient
+from mlte.store.artifact.store import (
+    ArtifactResult,
+    ArtifactStore,
+    ArtifactStoreSession,
+)
+from mlte.store.base import Store, StoreSession, StoreURI
+from mlte.store.common.http_clients import (
+    AsyncHttpxClient,
+    OAuthHttpClient,
+    RequestsClient,
+    ValidatorCache,
+)
 
 # -----------------------------------------------------------------------------
 # HttpArtifactStore
@@ -27,10 +65,13 @@ class HttpArtifactStore(ArtifactStore):
     """A HTTP implementation of the MLTE artifact store."""
 
     def __init__(
-        self, uri: StoreURI, client: OAuthHttpClient = RequestsClient()
+        self, uri: StoreURI, client: Optional[OAuthHttpClient] = None
     ) -> None:
-        self.client = client
-        """The client for requests."""
+        self.client = client if client is not None else RequestsClient()
+        """The client for requests, shared by all sessions of the store."""
+
+        self.cache = ValidatorCache()
+        """The artifacts read through the store, revalidated before reuse."""
 
         # Get credentials, if any, from the uri and into the client.
         uri.uri = self.client.process_credentials(uri.uri)
@@ -41,7 +82,9 @@ class HttpArtifactStore(ArtifactStore):
         Return a session handle for the store instance.
         :return: The session handle
         """
-        return HttpArtifactStoreSession(url=self.uri.uri, client=self.client)
+        return HttpArtifactStoreSession(
+            url=self.uri.uri, client=self.client, cache=self.cache
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -52,15 +95,24 @@ class HttpArtifactStore(ArtifactStore):
 class HttpArtifactStoreSession(ArtifactStoreSession):
     """An HTTP implementation of the MLTE artifact store session."""
 
-    def __init__(self, *, url: str, client: OAuthHttpClient) -> None:
+    def __init__(
+        self,
+        *,
+        url: str,
+        client: OAuthHttpClient,
+        cache: Optional[ValidatorCache] = None,
+    ) -> None:
         self.url = url
         """The remote artifact store URL."""
 
         self.client = client
         """The client for HTTP requests."""
 
-        # Authenticate.
-        self.client.authenticate(
+        self.cache = cache if cache is not None else ValidatorCache()
+        """The cache of artifacts read, revalidated with their ETag."""
+
+        # Authenticate, unless the client already holds a valid token.
+        self.client.ensure_authenticated(
             f"{self.url}{settings.API_PREFIX}",
         )
 
@@ -142,6 +194,9 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         force: bool = False,
         parents: bool = False,
     ) -> ArtifactModel:
+        # Upload large payloads first, so that they are only sent once.
+        artifact = offload_blobs(artifact, self.write_blob)
+
         url = f"{_url(self.url, model_id, version_id)}/artifact"
         res = self.client.post(
             url,
@@ -153,6 +208,30 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
         return ArtifactModel(**(res.json()["artifact"]))
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactResult]:
+        artifacts = [
+            offload_blobs(artifact, self.write_blob) for artifact in artifacts
+        ]
+
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch"
+        res = self.client.post(
+            url,
+            json=WriteArtifactsRequest(
+                artifacts=artifacts, force=force, parents=parents
+            ).model_dump(),
+        )
+        self.client.raise_for_response(res)
+
+        return _batch_results(res.json(), self.client)
+
     def read_artifact(
         self,
         model_id: str,
@@ -160,10 +239,10 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         artifact_id: str,
     ) -> ArtifactModel:
         url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
-        res = self.client.get(url)
-        self.client.raise_for_response(res)
+        cached = self.cache.lookup(url)
+        res = self.client.get(url, headers=self.cache.headers(cached))
 
-        return ArtifactModel(**res.json())
+        return ArtifactModel(**self.cache.resolve(url, res, cached))
 
     def read_artifacts(
         self,
@@ -171,12 +250,41 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ArtifactModel]:
         url = f"{_url(self.url, model_id, version_id)}/artifact?limit={limit}&offset={offset}"
-        res = self.client.get(url)
+        if cursor is not None:
+            url = f"{url}&cursor={urllib.parse.quote(cursor)}"
+        cached = self.cache.lookup(url)
+        res = self.client.get(url, headers=self.cache.headers(cached))
+
+        return [
+            ArtifactModel(**object)
+            for object in self.cache.resolve(url, res, cached)
+        ]
+
+    def _iter_artifacts(
+        self, model_id: str, version_id: str, batch_size: int
+    ) -> Iterator[ArtifactModel]:
+        # Artifacts are parsed one at a time, as the export streams in.
+        url = f"{_url(self.url, model_id, version_id)}/export?batch_size={batch_size}"
+        for line in self.client.stream_lines(url):
+            yield ArtifactModel.model_validate_json(line)
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+    ) -> List[ArtifactResult]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch/read"
+        res = self.client.post(
+            url,
+            json=ReadArtifactsRequest(artifact_ids=artifact_ids).model_dump(),
+        )
         self.client.raise_for_response(res)
 
-        return [ArtifactModel(**object) for object in res.json()]
+        return _batch_results(res.json(), self.client)
 
     def search_artifacts(
         self,
@@ -203,6 +311,501 @@ class HttpArtifactStoreSession(ArtifactStoreSession):
 
         return ArtifactModel(**res.json())
 
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, content: bytes) -> str:
+        digest = blob_digest(content)
+        url = f"{self.url}{settings.API_PREFIX}/blob/{digest}"
+        res = self.client.put(url, data=content)
+        self.client.raise_for_response(res)
+
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        check_digest(digest)
+        url = f"{self.url}{settings.API_PREFIX}/blob/{digest}"
+        res = self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return res.content
+
+    def write_blob_chunks(self, chunks: Iterable[bytes], digest: str) -> str:
+        check_digest(digest)
+        return self.write_blob(b"".join(checked_chunks(chunks, digest)))
+
+    def read_blob_chunks(self, digest: str) -> Tuple[int, Iterator[bytes]]:
+        content = self.read_blob(digest)
+        return len(content), content_chunks(content)
+
+
+# -----------------------------------------------------------------------------
+# AsyncHttpArtifactStore
+# -----------------------------------------------------------------------------
+
+
+class AsyncHttpArtifactStore(Store):
+    """
+    A HTTP implementation of the MLTE artifact store, with awaitable operations.
+
+    Its sessions mirror the artifact store session interface, with every
+    operation a coroutine, so that many artifacts can be moved concurrently.
+    """
+
+    def __init__(
+        self, uri: StoreURI, client: Optional[AsyncHttpxClient] = None
+    ) -> None:
+        self.client = client if client is not None else AsyncHttpxClient()
+        """The client for requests, shared by all sessions of the store."""
+
+        self.cache = ValidatorCache()
+        """The artifacts read through the store, revalidated before reuse."""
+
+        # Get credentials, if any, from the uri and into the client.
+        uri.uri = self.client.process_credentials(uri.uri)
+        super().__init__(uri=uri)
+
+    def session(self) -> AsyncHttpArtifactStoreSession:  # type: ignore[override]
+        """
+        Return a session handle for the store instance.
+
+        The session authenticates when entered with `async with`.
+        :return: The session handle
+        """
+        return AsyncHttpArtifactStoreSession(
+            url=self.uri.uri, client=self.client, cache=self.cache
+        )
+
+    async def close(self) -> None:
+        """Close the pooled connections of the store."""
+        await self.client.close()
+
+
+# -----------------------------------------------------------------------------
+# AsyncHttpArtifactStoreSession
+# -----------------------------------------------------------------------------
+
+
+class AsyncHttpArtifactStoreSession(StoreSession):
+    """An HTTP implementation of the MLTE artifact store session, with awaitable operations."""
+
+    DEFAULT_CONCURRENCY = 8
+    """The default bound on the requests in flight in gather operations."""
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        client: AsyncHttpxClient,
+        cache: Optional[ValidatorCache] = None,
+    ) -> None:
+        self.url = url
+        """The remote artifact store URL."""
+
+        self.client = client
+        """The client for HTTP requests."""
+
+        self.cache = cache if cache is not None else ValidatorCache()
+        """The cache of artifacts read, revalidated with their ETag."""
+
+    async def open(self) -> None:
+        """Open the session, authenticating unless the client already holds a valid token."""
+        await self.client.ensure_authenticated(
+            f"{self.url}{settings.API_PREFIX}",
+        )
+
+    def close(self) -> None:
+        """Close the session."""
+        # Closing a remote HTTP session is a no-op.
+        pass
+
+    async def __aenter__(self) -> AsyncHttpArtifactStoreSession:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Structural Elements
+    # -------------------------------------------------------------------------
+
+    async def create_model(self, model: ModelCreate) -> Model:
+        url = f"{self.url}{settings.API_PREFIX}/model"
+        res = await self.client.post(url, json=model.model_dump())
+        self.client.raise_for_response(res)
+
+        return Model(**res.json())
+
+    async def read_model(self, model_id: str) -> Model:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}"
+        res = await self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return Model(**res.json())
+
+    async def list_models(self) -> List[str]:
+        url = f"{self.url}{settings.API_PREFIX}/model"
+        res = await self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return typing.cast(List[str], res.json())
+
+    async def delete_model(self, model_id: str) -> Model:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}"
+        res = await self.client.delete(url)
+        self.client.raise_for_response(res)
+
+        return Model(**res.json())
+
+    async def create_version(
+        self, model_id: str, version: VersionCreate
+    ) -> Version:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}/version"
+        res = await self.client.post(url, json=version.model_dump())
+        self.client.raise_for_response(res)
+
+        return Version(**res.json())
+
+    async def read_version(self, model_id: str, version_id: str) -> Version:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}/version/{version_id}"
+        res = await self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return Version(**res.json())
+
+    async def list_versions(self, model_id: str) -> List[str]:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}/version"
+        res = await self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return typing.cast(List[str], res.json())
+
+    async def delete_version(self, model_id: str, version_id: str) -> Version:
+        url = f"{self.url}{settings.API_PREFIX}/model/{model_id}/version/{version_id}"
+        res = await self.client.delete(url)
+        self.client.raise_for_response(res)
+
+        return Version(**res.json())
+
+    # -------------------------------------------------------------------------
+    # Artifacts
+    # -------------------------------------------------------------------------
+
+    async def write_artifact_with_header(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact: ArtifactModel,
+        *,
+        force: bool = False,
+        parents: bool = False,
+        user: Optional[str] = None,
+    ) -> ArtifactModel:
+        artifact.header.timestamp = int(time.time())
+        artifact.header.creator = user
+        return await self.write_artifact(
+            model_id,
+            version_id,
+            artifact,
+            force=force,
+            parents=parents,
+        )
+
+    async def write_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact: ArtifactModel,
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> ArtifactModel:
+        # Upload large payloads first, so that they are only sent once.
+        artifact = await self._offload_blobs(artifact)
+
+        url = f"{_url(self.url, model_id, version_id)}/artifact"
+        res = await self.client.post(
+            url,
+            json=WriteArtifactRequest(
+                artifact=artifact, force=force, parents=parents
+            ).model_dump(),
+        )
+        self.client.raise_for_response(res)
+
+        return ArtifactModel(**(res.json()["artifact"]))
+
+    async def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactResult]:
+        artifacts = [
+            await self._offload_blobs(artifact) for artifact in artifacts
+        ]
+
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch"
+        res = await self.client.post(
+            url,
+            json=WriteArtifactsRequest(
+                artifacts=artifacts, force=force, parents=parents
+            ).model_dump(),
+        )
+        self.client.raise_for_response(res)
+
+        return _batch_results(res.json(), self.client)
+
+    async def read_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+    ) -> ArtifactModel:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
+        cached = self.cache.lookup(url)
+        res = await self.client.get(url, headers=self.cache.headers(cached))
+
+        return ArtifactModel(**self.cache.resolve(url, res, cached))
+
+    async def read_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> List[ArtifactModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact?limit={limit}&offset={offset}"
+        if cursor is not None:
+            url = f"{url}&cursor={urllib.parse.quote(cursor)}"
+        cached = self.cache.lookup(url)
+        res = await self.client.get(url, headers=self.cache.headers(cached))
+
+        return [
+            ArtifactModel(**object)
+            for object in self.cache.resolve(url, res, cached)
+        ]
+
+    async def iter_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        batch_size: int = 100,
+    ) -> AsyncIterator[ArtifactModel]:
+        if batch_size < 1:
+            raise ValueError("The batch size must be at least 1.")
+        url = f"{_url(self.url, model_id, version_id)}/export?batch_size={batch_size}"
+        async for line in self.client.stream_lines(url):
+            yield ArtifactModel.model_validate_json(line)
+
+    async def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+    ) -> List[ArtifactResult]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/batch/read"
+        res = await self.client.post(
+            url,
+            json=ReadArtifactsRequest(artifact_ids=artifact_ids).model_dump(),
+        )
+        self.client.raise_for_response(res)
+
+        return _batch_results(res.json(), self.client)
+
+    async def search_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        query: Query = Query(),
+    ) -> List[ArtifactModel]:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/search"
+        res = await self.client.post(url, json=query.model_dump())
+        self.client.raise_for_response(res)
+
+        return [ArtifactModel(**object) for object in res.json()]
+
+    async def delete_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_id: str,
+    ) -> ArtifactModel:
+        url = f"{_url(self.url, model_id, version_id)}/artifact/{artifact_id}"
+        res = await self.client.delete(url)
+        self.client.raise_for_response(res)
+
+        return ArtifactModel(**res.json())
+
+    # -------------------------------------------------------------------------
+    # Concurrent Operations
+    # -------------------------------------------------------------------------
+
+    async def gather_read(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[ArtifactResult]:
+        """
+        Read artifacts with concurrent requests, one per artifact.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifact_ids: The artifact identifiers
+        :param concurrency: The bound on the requests in flight
+        :return: The artifact, or the store error, for each identifier, in order
+        """
+        return await _gather(
+            [
+                functools.partial(
+                    self.read_artifact, model_id, version_id, artifact_id
+                )
+                for artifact_id in artifact_ids
+            ],
+            concurrency,
+        )
+
+    async def gather_write(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> List[ArtifactResult]:
+        """
+        Write artifacts with concurrent requests, one per artifact.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifacts: The artifacts
+        :param force: Overwrite artifacts if they already exist
+        :param parents: Indicates whether organizational elements
+        for artifacts should be implictly created (default: False)
+        :param concurrency: The bound on the requests in flight
+        :return: The artifact, or the store error, for each artifact, in order
+        """
+        if parents:
+            # Create parents once, rather than racing to create them.
+            await self._create_parents(model_id, version_id)
+
+        return await _gather(
+            [
+                functools.partial(
+                    self.write_artifact,
+                    model_id,
+                    version_id,
+                    artifact,
+                    force=force,
+                )
+                for artifact in artifacts
+            ],
+            concurrency,
+        )
+
+    async def _create_parents(self, model_id: str, version_id: str) -> None:
+        """
+        Create organizational elements within the store. If they exist, this operation is a noop.
+        :param model_id: The model identifier
+        :param version_id: The version identifier
+        """
+        try:
+            await self.create_model(ModelCreate(identifier=model_id))
+        except errors.ErrorAlreadyExists:
+            pass
+
+        try:
+            await self.create_version(
+                model_id, VersionCreate(identifier=version_id)
+            )
+        except errors.ErrorAlreadyExists:
+            pass
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    async def write_blob(self, content: bytes) -> str:
+        digest = blob_digest(content)
+        url = f"{self.url}{settings.API_PREFIX}/blob/{digest}"
+        res = await self.client.put(url, data=content)
+        self.client.raise_for_response(res)
+
+        return digest
+
+    async def read_blob(self, digest: str) -> bytes:
+        check_digest(digest)
+        url = f"{self.url}{settings.API_PREFIX}/blob/{digest}"
+        res = await self.client.get(url)
+        self.client.raise_for_response(res)
+
+        return res.content
+
+    async def _offload_blobs(self, artifact: ArtifactModel) -> ArtifactModel:
+        """
+        Move the large value payloads of an artifact to the blob area of the store.
+        :param artifact: The artifact
+        :return: The artifact, with its payloads replaced by blob digests
+        """
+        content = blob_payload(artifact)
+        if content is None:
+            return artifact
+        return with_blob(artifact, await self.write_blob(content))
+
+
+async def _gather(
+    operations: List[Callable[[], Awaitable[ArtifactModel]]],
+    concurrency: int,
+) -> List[ArtifactResult]:
+    """
+    Run operations concurrently, with a bound on how many are in flight.
+    :param operations: The operations
+    :param concurrency: The bound on the operations in flight
+    :return: The artifact, or the store error, for each operation, in order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(
+        operation: Callable[[], Awaitable[ArtifactModel]]
+    ) -> ArtifactResult:
+        async with semaphore:
+            try:
+                return await operation()
+            except (errors.ErrorNotFound, errors.ErrorAlreadyExists) as e:
+                return e
+
+    return list(
+        await asyncio.gather(*(run(operation) for operation in operations))
+    )
+
+
+def _batch_results(
+    body: typing.Any, client: OAuthHttpClient
+) -> List[ArtifactResult]:
+    """
+    Convert the response to a batch request to the result of each item.
+    :param body: The response body
+    :param client: The client that received the response
+    :return: The artifact, or the error, of each item
+    """
+    results: List[ArtifactResult] = []
+    for item in BatchArtifactsResponse(**body).results:
+        if item.status_code == codes.OK and item.artifact is not None:
+            results.append(item.artifact)
+        else:
+            results.append(
+                client.error_for_status(item.status_code, f"{item.detail}")
+            )
+    return results
+
 
 def _url(base: str, model_id: str, version_id: str) -> str:
     """
@@ -6,14 +6,23 @@ Implementation of in-memory artifact store.
 
 from __future__ import annotations
 
+import bisect
 from collections import OrderedDict
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
-from mlte.artifact.model import ArtifactModel
+from mlte.artifact.model import ArtifactHeaderModel, ArtifactModel
+from mlte.artifact.type import ArtifactType
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
-from mlte.store.artifact.query import Query
+from mlte.store.artifact.blob import (
+    blob_digest,
+    check_digest,
+    checked_chunks,
+    content_chunks,
+    offload_blobs,
+)
+from mlte.store.artifact.query import ArtifactIndex, Query, index_candidates
 from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
 from mlte.store.base import StoreURI
 
@@ -22,6 +31,105 @@ from mlte.store.base import StoreURI
 # -----------------------------------------------------------------------------
 
 
+class VersionIndex(ArtifactIndex):
+    """Secondary indexes over the artifacts of a version."""
+
+    def __init__(self) -> None:
+        self.order: List[str] = []
+        """Artifact identifiers, in insertion order."""
+
+        self.sequence: List[int] = []
+        """The insertion sequence numbers of the artifacts in `order`."""
+
+        self.positions: Dict[str, int] = {}
+        """Artifact identifier - insertion sequence number of the artifact."""
+
+        self.removed: Dict[str, int] = {}
+        """Removed artifact identifier - its former sequence number, so that
+        cursors naming a removed artifact can be placed."""
+
+        self.sorted_ids: List[str] = []
+        """Artifact identifiers, in sorted order, for prefix lookups."""
+
+        self.types: Dict[str, ArtifactType] = {}
+        """Artifact identifier - artifact type."""
+
+        self.by_type: Dict[ArtifactType, Set[str]] = {}
+        """Artifact type - identifiers of the artifacts of that type."""
+
+        self._next_sequence = 0
+        """The sequence number of the next inserted artifact."""
+
+    def add(self, header: ArtifactHeaderModel) -> None:
+        """
+        Index an artifact, or update the index of an overwritten one.
+        :param header: The header of the artifact
+        """
+        id = header.identifier
+        if id in self.positions:
+            # Overwritten artifacts keep their position, but may change type.
+            self.by_type[self.types[id]].discard(id)
+        else:
+            self.positions[id] = self._next_sequence
+            self.removed.pop(id, None)
+            self.order.append(id)
+            self.sequence.append(self._next_sequence)
+            self._next_sequence += 1
+            bisect.insort(self.sorted_ids, id)
+
+        self.types[id] = header.type
+        self.by_type.setdefault(header.type, set()).add(id)
+
+    def remove(self, artifact_id: str) -> None:
+        """
+        Remove an artifact from the index.
+        :param artifact_id: The artifact identifier
+        """
+        sequence = self.positions.pop(artifact_id)
+        self.removed[artifact_id] = sequence
+        position = bisect.bisect_left(self.sequence, sequence)
+        del self.order[position]
+        del self.sequence[position]
+        del self.sorted_ids[bisect.bisect_left(self.sorted_ids, artifact_id)]
+        self.by_type[self.types.pop(artifact_id)].discard(artifact_id)
+
+    def after(self, artifact_id: str) -> int:
+        """
+        Get the insertion-order offset of the artifacts after the given one,
+        which may have been removed.
+        :param artifact_id: The artifact identifier
+        :raises KeyError: If the artifact was never indexed
+        :return: The offset
+        """
+        sequence = self.positions.get(artifact_id)
+        if sequence is None:
+            sequence = self.removed[artifact_id]
+        return bisect.bisect_right(self.sequence, sequence)
+
+    def in_order(self, artifact_ids: Set[str]) -> List[str]:
+        """
+        Sort artifact identifiers by insertion order.
+        :param artifact_ids: The artifact identifiers
+        :return: The sorted identifiers
+        """
+        return sorted(artifact_ids, key=self.positions.__getitem__)
+
+    def with_identifier(self, artifact_id: str) -> Set[str]:
+        return {artifact_id} if artifact_id in self.positions else set()
+
+    def with_identifier_prefix(self, prefix: str) -> Set[str]:
+        start = bisect.bisect_left(self.sorted_ids, prefix)
+        end = start
+        while end < len(self.sorted_ids):
+            if not self.sorted_ids[end].startswith(prefix):
+                break
+            end += 1
+        return set(self.sorted_ids[start:end])
+
+    def with_type(self, artifact_type: ArtifactType) -> Set[str]:
+        return set(self.by_type.get(artifact_type, set()))
+
+
 class VersionWithArtifacts:
     """A structure that combines a version with the artifacts it contains."""
 
@@ -32,6 +140,9 @@ class VersionWithArtifacts:
         self.artifacts: OrderedDict[str, ArtifactModel] = OrderedDict()
         """The artifacts associated with the version."""
 
+        self.index = VersionIndex()
+        """Secondary indexes over the artifacts, kept on write and delete."""
+
 
 class ModelWithVersions:
     """A structure that combines a model with the versions it contains."""
@@ -50,6 +161,9 @@ class MemoryStorage:
     def __init__(self) -> None:
         self.models: Dict[str, ModelWithVersions] = {}
 
+        self.blobs: Dict[str, bytes] = {}
+        """Blob digest - blob content, shared by all models and versions."""
+
 
 # -----------------------------------------------------------------------------
 # InMemoryStoreSession
@@ -192,7 +306,9 @@ class InMemoryStoreSession(ArtifactStoreSession):
             raise errors.ErrorAlreadyExists(
                 f"Artifact '{artifact.header.identifier}'"
             )
+        artifact = offload_blobs(artifact, self.write_blob)
         version.artifacts[artifact.header.identifier] = artifact
+        version.index.add(artifact.header)
         return artifact
 
     def read_artifact(
@@ -213,10 +329,17 @@ class InMemoryStoreSession(ArtifactStoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ArtifactModel]:
         version = self._get_version_with_artifacts(model_id, version_id)
-        return [artifact for artifact in version.artifacts.values()][
-            offset : offset + limit
+        if cursor is not None:
+            try:
+                offset = version.index.after(cursor)
+            except KeyError:
+                raise errors.ErrorNotFound(f"Artifact '{cursor}'")
+        return [
+            version.artifacts[artifact_id]
+            for artifact_id in version.index.order[offset : offset + limit]
         ]
 
     def search_artifacts(
@@ -226,10 +349,18 @@ class InMemoryStoreSession(ArtifactStoreSession):
         query: Query = Query(),
     ) -> List[ArtifactModel]:
         version = self._get_version_with_artifacts(model_id, version_id)
+
+        # Only scan all artifacts if no index narrows down the filter.
+        candidates = index_candidates(query.filter, version.index)
+        if candidates is None:
+            artifacts = list(version.artifacts.values())
+        else:
+            artifacts = [
+                version.artifacts[artifact_id]
+                for artifact_id in version.index.in_order(candidates)
+            ]
         return [
-            artifact
-            for artifact in version.artifacts.values()
-            if query.filter.match(artifact)
+            artifact for artifact in artifacts if query.filter.match(artifact)
         ]
 
     def delete_artifact(
@@ -244,8 +375,32 @@ class InMemoryStoreSession(ArtifactStoreSession):
             raise errors.ErrorNotFound(f"Artifact '{artifact_id}'")
         artifact = version.artifacts[artifact_id]
         del version.artifacts[artifact_id]
+        version.index.remove(artifact_id)
         return artifact
 
+    # -------------------------------------------------------------------------
+    # Blob
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, content: bytes) -> str:
+        digest = blob_digest(content)
+        self.storage.blobs.setdefault(digest, content)
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        check_digest(digest)
+        if digest not in self.storage.blobs:
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return self.storage.blobs[digest]
+
+    def write_blob_chunks(self, chunks: Iterable[bytes], digest: str) -> str:
+        check_digest(digest)
+        return self.write_blob(b"".join(checked_chunks(chunks, digest)))
+
+    def read_blob_chunks(self, digest: str) -> Tuple[int, Iterator[bytes]]:
+        content = self.read_blob(digest)
+        return len(content), content_chunks(content)
+
     def _get_version_with_artifacts(
         self, model_id: str, version_id: str
     ) -> VersionWithArtifacts:
@@ -157,3 +157,22 @@ def create_artifact_from_db(
         )
 
     return ArtifactModel(header=artifact_header, body=body)
+
+
+def create_artifacts_from_db(
+    artifact_header_objs: typing.Iterable[DBArtifactHeader], session: Session
+) -> typing.List[ArtifactModel]:
+    """
+    Creates Artifact models from a whole result set of DB headers.
+
+    The headers are expected to have been loaded with the eager-loading options
+    in the loading module, so that the conversion does not issue further queries.
+
+    :param artifact_header_objs: DBArtifactHeader objects from the DB with header info.
+    :param session: The DB session to use.
+    :return: the DB data converted into a list of ArtifactModels.
+    """
+    return [
+        create_artifact_from_db(artifact_header_obj, session)
+        for artifact_header_obj in artifact_header_objs
+    ]
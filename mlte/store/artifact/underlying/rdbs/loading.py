@@ -0,0 +1,141 @@
+"""
+mlte/store/artifact/underlying/rdbs/loading.py
+
+Eager-loading strategies used when hydrating artifacts from the DB.
+
+Artifact bodies are spread over many tables. Relying on lazy loading means that
+every relationship walked by the factories triggers its own SELECT, for every
+artifact. These option sets load a whole result set of artifact headers, with
+their bodies and all their sub-elements, in a fixed number of queries.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+from mlte.artifact.type import ArtifactType
+from mlte.store.artifact.underlying.rdbs.metadata import DBArtifactHeader
+from mlte.store.artifact.underlying.rdbs.metadata_nc import (
+    DBDataDescriptor,
+    DBGoalDescriptor,
+    DBNegotiationCard,
+    DBReport,
+)
+from mlte.store.artifact.underlying.rdbs.metadata_spec import (
+    DBProperty,
+    DBResult,
+    DBSpec,
+    DBValidatedSpec,
+)
+from mlte.store.artifact.underlying.rdbs.metadata_value import DBValue
+
+# -------------------------------------------------------------------------
+# Shared sub-element option sets.
+# -------------------------------------------------------------------------
+
+
+def _spec_options() -> List[_AbstractLoad]:
+    """Options to load the properties and conditions of a DBSpec."""
+    return [selectinload(DBSpec.properties).selectinload(DBProperty.conditions)]
+
+
+def _goal_options() -> List[_AbstractLoad]:
+    """Options to load the metrics of a DBGoalDescriptor."""
+    return [selectinload(DBGoalDescriptor.metrics)]
+
+
+def _data_descriptor_options() -> List[_AbstractLoad]:
+    """Options to load the sub-elements of a DBDataDescriptor."""
+    return [
+        joinedload(DBDataDescriptor.classification),
+        selectinload(DBDataDescriptor.labels),
+        selectinload(DBDataDescriptor.fields),
+    ]
+
+
+# -------------------------------------------------------------------------
+# Per artifact type option sets.
+# -------------------------------------------------------------------------
+
+
+def _spec_body_options() -> _AbstractLoad:
+    return joinedload(DBArtifactHeader.body_spec).options(*_spec_options())
+
+
+def _validated_spec_body_options() -> _AbstractLoad:
+    return joinedload(DBArtifactHeader.body_validated_spec).options(
+        selectinload(DBValidatedSpec.results).options(
+            selectinload(DBResult.evidence_metadata),
+            joinedload(DBResult.property),
+        ),
+        selectinload(DBValidatedSpec.spec).options(
+            joinedload(DBSpec.artifact_header), *_spec_options()
+        ),
+    )
+
+
+def _negotiation_card_body_options() -> _AbstractLoad:
+    return joinedload(DBArtifactHeader.body_negotiation_card).options(
+        joinedload(DBNegotiationCard.sys_problem_type),
+        selectinload(DBNegotiationCard.sys_goals).options(*_goal_options()),
+        selectinload(DBNegotiationCard.data_descriptors).options(
+            *_data_descriptor_options()
+        ),
+        joinedload(DBNegotiationCard.model_dev_resources),
+        joinedload(DBNegotiationCard.model_prod_interface_input_desc),
+        joinedload(DBNegotiationCard.model_prod_interface_output_desc),
+        joinedload(DBNegotiationCard.model_prod_resources),
+        selectinload(DBNegotiationCard.system_requirements),
+    )
+
+
+def _report_body_options() -> _AbstractLoad:
+    return joinedload(DBArtifactHeader.body_report).options(
+        joinedload(DBReport.summary_problem_type),
+        selectinload(DBReport.validated_spec).joinedload(
+            DBValidatedSpec.artifact_header
+        ),
+        selectinload(DBReport.performance_goals).options(*_goal_options()),
+        joinedload(DBReport.intended_reqs_model_prod_interface_input_desc),
+        joinedload(DBReport.intended_reqs_model_prod_interface_output_desc),
+        joinedload(DBReport.intended_reqs_model_prod_resources),
+        selectinload(DBReport.data_descriptors).options(
+            *_data_descriptor_options()
+        ),
+        selectinload(DBReport.comments),
+    )
+
+
+def _value_body_options() -> _AbstractLoad:
+    return joinedload(DBArtifactHeader.body_value).selectinload(
+        DBValue.evidence_metadata
+    )
+
+
+ARTIFACT_BODY_OPTIONS: Dict[ArtifactType, _AbstractLoad] = {
+    ArtifactType.SPEC: _spec_body_options(),
+    ArtifactType.VALIDATED_SPEC: _validated_spec_body_options(),
+    ArtifactType.NEGOTIATION_CARD: _negotiation_card_body_options(),
+    ArtifactType.REPORT: _report_body_options(),
+    ArtifactType.VALUE: _value_body_options(),
+}
+"""Artifact Type - eager-loading options for its body, starting from DBArtifactHeader."""
+
+
+def artifact_header_options(
+    artifact_types: Iterable[ArtifactType] = ArtifactType,
+) -> List[_AbstractLoad]:
+    """
+    Get the options to eagerly load artifact headers of the given types.
+
+    Bodies are joined to the header row, since they are one-to-one, while
+    collections are loaded with one SELECT ... IN per relationship. The number
+    of queries therefore does not depend on the number of artifacts loaded.
+    :param artifact_types: The artifact types that may be present in the result
+    :return: The loader options to apply to a select of DBArtifactHeader
+    """
+    return [joinedload(DBArtifactHeader.type)] + [
+        ARTIFACT_BODY_OPTIONS[artifact_type] for artifact_type in artifact_types
+    ]
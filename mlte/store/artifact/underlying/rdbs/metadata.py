@@ -7,7 +7,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, select
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    UniqueConstraint,
+    select,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -123,10 +130,52 @@ class DBArtifactHeader(DBBase):
         back_populates="artifact_header", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_artifact_header_version_order", "version_id", "timestamp", "id"
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"ArtifactHeader(id={self.id!r}, identifier={self.identifier!r}, timestamp={self.timestamp!r}, type={self.type!r})"
 
 
+class DBDeletedArtifact(DBBase):
+    """The position of a deleted artifact, for cursors that name it."""
+
+    __tablename__ = "deleted_artifact"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    identifier: Mapped[str]
+    timestamp: Mapped[int] = mapped_column(BigInteger)
+    header_id: Mapped[int]
+    version_id: Mapped[int] = mapped_column(
+        ForeignKey("version.id", ondelete="CASCADE")
+    )
+
+    __table_args__ = (
+        Index("ix_deleted_artifact_identifier", "version_id", "identifier"),
+    )
+
+    def __repr__(self) -> str:
+        return f"DeletedArtifact(id={self.id!r}, identifier={self.identifier!r}, timestamp={self.timestamp!r})"
+
+
+# -------------------------------------------------------------------------
+# Blob Elements
+# -------------------------------------------------------------------------
+
+
+class DBBlob(DBBase):
+    __tablename__ = "blob"
+
+    digest: Mapped[str] = mapped_column(primary_key=True)
+    content: Mapped[bytes] = mapped_column(LargeBinary)
+
+    def __repr__(self) -> str:
+        return f"Blob(digest={self.digest!r})"
+
+
 # -------------------------------------------------------------------------
 # Pre-filled table functions.
 # -------------------------------------------------------------------------
@@ -0,0 +1,53 @@
+"""
+mlte/store/artifact/underlying/rdbs/query.py
+
+Compilation of artifact store queries into SQL clauses.
+"""
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, and_, false, func, or_, true
+
+from mlte.store.artifact.query import (
+    AllFilter,
+    AndFilter,
+    ArtifactIdentifierFilter,
+    ArtifactIdentifierPrefixFilter,
+    ArtifactTypeFilter,
+    Filter,
+    NoneFilter,
+    OrFilter,
+)
+from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactHeader,
+    DBArtifactType,
+)
+
+
+def compile_filter(filter: Filter) -> ColumnElement[bool]:
+    """
+    Compile a query filter into an equivalent SQL WHERE clause.
+
+    The resulting clause references columns of DBArtifactHeader and
+    DBArtifactType, so the statement it is applied to must join both tables.
+    :param filter: The filter to compile
+    :return: The SQL expression that matches the same artifacts as the filter
+    """
+    if isinstance(filter, AllFilter):
+        return true()
+    if isinstance(filter, NoneFilter):
+        return false()
+    if isinstance(filter, ArtifactIdentifierFilter):
+        return DBArtifactHeader.identifier == filter.artifact_id
+    if isinstance(filter, ArtifactIdentifierPrefixFilter):
+        # Not LIKE, which ignores case on SQLite, unlike the other stores.
+        return (
+            func.substr(DBArtifactHeader.identifier, 1, len(filter.prefix))
+            == filter.prefix
+        )
+    if isinstance(filter, ArtifactTypeFilter):
+        return DBArtifactType.name == filter.artifact_type.value
+    if isinstance(filter, AndFilter):
+        return and_(true(), *[compile_filter(f) for f in filter.filters])
+    if isinstance(filter, OrFilter):
+        return or_(false(), *[compile_filter(f) for f in filter.filters])
+    raise Exception(f"Unsupported filter type for SQL compilation: {filter}")
@@ -5,9 +5,9 @@ DB utils for getting artifact related data from the DB.
 """
 from __future__ import annotations
 
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
-from sqlalchemy import ScalarResult, select
+from sqlalchemy import ColumnElement, ScalarResult, and_, or_, select, true
 from sqlalchemy.orm import Session
 
 import mlte.store.error as errors
@@ -16,9 +16,11 @@ from mlte.artifact.type import ArtifactType
 from mlte.context.model.model import Model, Version
 from mlte.model.shared import DataClassification, ProblemType
 from mlte.store.artifact.underlying.rdbs import factory
+from mlte.store.artifact.underlying.rdbs.loading import artifact_header_options
 from mlte.store.artifact.underlying.rdbs.metadata import (
     DBArtifactHeader,
     DBArtifactType,
+    DBDeletedArtifact,
     DBModel,
     DBVersion,
 )
@@ -125,32 +127,24 @@ class DBReader:
         Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue],
     ]:
         """Reads the artifact with the given identifier using the provided session, and returns an internal object."""
-        # First get the class of the artifact we are trying to read, so we can use the ORM by passing the DB object type.
-        artifact_header_obj = DBReader.get_artifact_header(artifact_id, session)
-        artifact_type = ArtifactType(artifact_header_obj.type.name)
-
-        # Get artifact.
-        artifact_class = DBReader.get_artifact_class(artifact_type)
-        artifact_obj: Union[
-            DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue
-        ] = session.scalar(
-            select(artifact_class)
-            .where(DBVersion.model_id == DBModel.id)
+        artifact_header_obj = session.scalar(
+            select(DBArtifactHeader)
+            .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+            .join(DBModel, DBVersion.model_id == DBModel.id)
             .where(DBVersion.name == version_id)
             .where(DBModel.name == model_id)
-            .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
             .where(DBArtifactHeader.identifier == artifact_id)
-            .where(DBArtifactHeader.version_id == DBVersion.id)
+            .options(*artifact_header_options())
         )
 
-        if artifact_obj is None:
+        if artifact_header_obj is None:
             raise errors.ErrorNotFound(
                 f"Artifact with identifier {artifact_id}  and associated to model {model_id}, and version {version_id} was not found in the artifact store."
             )
         else:
             return (
                 factory.create_artifact_from_db(artifact_header_obj, session),
-                artifact_obj,
+                DBReader.get_artifact_body(artifact_header_obj),
             )
 
     @staticmethod
@@ -161,26 +155,116 @@ class DBReader:
         session: Session,
     ) -> List[ArtifactModel]:
         """Loads and returns a list with all the artifacts of the given type, for the given model/version."""
-        artifact_class = DBReader.get_artifact_class(artifact_type)
-        artifact_objs: ScalarResult[
-            Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]
-        ] = session.scalars(
+        artifact_header_objs: ScalarResult[DBArtifactHeader] = session.scalars(
             (
-                select(artifact_class)
-                .where(DBVersion.model_id == DBModel.id)
+                select(DBArtifactHeader)
+                .join(
+                    DBArtifactType,
+                    DBArtifactHeader.type_id == DBArtifactType.id,
+                )
+                .join(DBVersion, DBArtifactHeader.version_id == DBVersion.id)
+                .join(DBModel, DBVersion.model_id == DBModel.id)
                 .where(DBVersion.name == version_id)
                 .where(DBModel.name == model_id)
-                .where(DBArtifactHeader.id == artifact_class.artifact_header_id)
-                .where(DBArtifactHeader.version_id == DBVersion.id)
+                .where(DBArtifactType.name == artifact_type.value)
+                .order_by(DBArtifactHeader.timestamp, DBArtifactHeader.id)
+                .options(*artifact_header_options([artifact_type]))
+            )
+        )
+        return factory.create_artifacts_from_db(artifact_header_objs, session)
+
+    @staticmethod
+    def get_artifacts(
+        version_id: int,
+        session: Session,
+        where: ColumnElement[bool] = true(),
+        limit: Optional[int] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> List[ArtifactModel]:
+        """
+        Loads and returns a list with the artifacts in the given version that satisfy the given SQL clause.
+
+        Artifacts are ordered by (timestamp, id). If a cursor is provided, the offset is ignored and the
+        page starts right after the artifact it identifies, seeking through the index instead of skipping rows.
+        A deleted artifact is placed where it was, from the position kept when it was deleted.
+        """
+        statement = (
+            select(DBArtifactHeader)
+            .join(DBArtifactType, DBArtifactHeader.type_id == DBArtifactType.id)
+            .where(DBArtifactHeader.version_id == version_id)
+            .where(where)
+            .order_by(DBArtifactHeader.timestamp, DBArtifactHeader.id)
+            .options(*artifact_header_options())
+        )
+
+        if cursor is not None:
+            cursor_row = session.execute(
+                select(DBArtifactHeader.timestamp, DBArtifactHeader.id)
+                .where(DBArtifactHeader.version_id == version_id)
+                .where(DBArtifactHeader.identifier == cursor)
+            ).first()
+            if cursor_row is None:
+                cursor_row = session.execute(
+                    select(
+                        DBDeletedArtifact.timestamp, DBDeletedArtifact.header_id
+                    )
+                    .where(DBDeletedArtifact.version_id == version_id)
+                    .where(DBDeletedArtifact.identifier == cursor)
+                    .order_by(DBDeletedArtifact.id.desc())
+                ).first()
+            if cursor_row is None:
+                raise errors.ErrorNotFound(
+                    f"Artifact with identifier {cursor} was not found in the artifact store."
+                )
+            timestamp, id = cursor_row
+            statement = statement.where(
+                or_(
+                    DBArtifactHeader.timestamp > timestamp,
+                    and_(
+                        DBArtifactHeader.timestamp == timestamp,
+                        DBArtifactHeader.id > id,
+                    ),
+                )
             )
+        elif offset > 0:
+            statement = statement.offset(offset)
+
+        if limit is not None:
+            statement = statement.limit(limit)
+
+        artifact_header_objs: ScalarResult[DBArtifactHeader] = session.scalars(
+            statement
         )
-        artifacts = []
-        for artifact_obj in artifact_objs:
-            artifact = factory.create_artifact_from_db(
-                artifact_obj.artifact_header, session
+        return factory.create_artifacts_from_db(artifact_header_objs, session)
+
+    @staticmethod
+    def get_artifact_body(
+        artifact_header_obj: DBArtifactHeader,
+    ) -> Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]:
+        """Gets the body DB object associated to the artifact header provided."""
+        artifact_type = ArtifactType(artifact_header_obj.type.name)
+        artifact_obj: Optional[
+            Union[DBSpec, DBValidatedSpec, DBNegotiationCard, DBReport, DBValue]
+        ]
+        if artifact_type == ArtifactType.SPEC:
+            artifact_obj = artifact_header_obj.body_spec
+        elif artifact_type == ArtifactType.VALIDATED_SPEC:
+            artifact_obj = artifact_header_obj.body_validated_spec
+        elif artifact_type == ArtifactType.NEGOTIATION_CARD:
+            artifact_obj = artifact_header_obj.body_negotiation_card
+        elif artifact_type == ArtifactType.REPORT:
+            artifact_obj = artifact_header_obj.body_report
+        elif artifact_type == ArtifactType.VALUE:
+            artifact_obj = artifact_header_obj.body_value
+        else:
+            raise Exception(f"Unsupported artifact type: {artifact_type.value}")
+
+        if artifact_obj is None:
+            raise errors.InternalError(
+                f"Artifact with identifier {artifact_header_obj.identifier} has no body in the artifact store."
             )
-            artifacts.append(artifact)
-        return artifacts
+        return artifact_obj
 
     @staticmethod
     def get_artifact_header(
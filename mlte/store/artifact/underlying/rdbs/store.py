@@ -5,23 +5,38 @@ Implementation of relational database system artifact store.
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-import sqlalchemy
-import sqlalchemy.orm
 import sqlalchemy_utils
-from sqlalchemy import Engine, select
+from sqlalchemy import Engine, LargeBinary, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 import mlte.store.artifact.util as storeutil
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.context.model import Model, ModelCreate, Version, VersionCreate
+from mlte.store.artifact.blob import (
+    BLOB_CHUNK_SIZE,
+    blob_digest,
+    check_digest,
+    checked_chunks,
+    offload_blobs,
+)
 from mlte.store.artifact.query import Query
-from mlte.store.artifact.store import ArtifactStore, ArtifactStoreSession
+from mlte.store.artifact.store import (
+    ArtifactResult,
+    ArtifactStore,
+    ArtifactStoreSession,
+    find_duplicates,
+)
 from mlte.store.artifact.underlying.rdbs import factory
 from mlte.store.artifact.underlying.rdbs.metadata import (
+    DBArtifactHeader,
     DBBase,
+    DBBlob,
+    DBDeletedArtifact,
     DBModel,
     DBVersion,
     init_artifact_types,
@@ -31,8 +46,10 @@ from mlte.store.artifact.underlying.rdbs.metadata_nc import (
     init_problem_types,
 )
 from mlte.store.artifact.underlying.rdbs.metadata_value import init_value_types
+from mlte.store.artifact.underlying.rdbs.query import compile_filter
 from mlte.store.artifact.underlying.rdbs.reader import DBReader
 from mlte.store.base import StoreURI
+from mlte.store.common import rdbs
 
 # -----------------------------------------------------------------------------
 # RelationalDBStore
@@ -45,8 +62,8 @@ class RelationalDBStore(ArtifactStore):
     def __init__(self, uri: StoreURI, **kwargs) -> None:
         super().__init__(uri=uri)
 
-        self.engine = sqlalchemy.create_engine(uri.uri, **kwargs)
-        """The underlying storage for the store."""
+        self.engine = rdbs.create_engine(uri.uri, **kwargs)
+        """The underlying storage for the store, which owns the connection pool."""
 
         # Create the DB if it doesn't exist already.
         if not sqlalchemy_utils.database_exists(self.engine.url):
@@ -92,7 +109,9 @@ class RelationalDBStoreSession(ArtifactStoreSession):
 
     def close(self) -> None:
         """Close the session."""
-        self.engine.dispose()
+        # Connections are returned to the store's pool after each operation;
+        # the engine is shared, so it must not be disposed here.
+        pass
 
     # -------------------------------------------------------------------------
     # Structural Elements
@@ -204,42 +223,117 @@ class RelationalDBStoreSession(ArtifactStoreSession):
                 # Ensure parents exist.
                 _ = DBReader.get_version(model_id, version_id, session)
 
-            # Check if artifact already exists.
-            try:
-                _, artifact_obj = DBReader.get_artifact(
-                    model_id,
-                    version_id,
-                    artifact.header.identifier,
-                    session,
-                )
-                if not force:
-                    raise errors.ErrorAlreadyExists(
-                        f"Artifact '{artifact.header.identifier}' already exists."
-                    )
-                else:
-                    # We have no edit functionality, nor any versioning system, so delete the previous version.
-                    # TODO: versioning? Keep previous versions?
-                    session.delete(artifact_obj)
-            except errors.ErrorNotFound:
-                # If artifact was not found, it is ok, force it or not we will create it.
-                pass
-
-            # Get type and parent version info.
-            artifact_type_obj = DBReader.get_artifact_type(
-                artifact.header.type, session
-            )
-            _, version_obj = DBReader.get_version(model_id, version_id, session)
-
-            # Create the actual object.
-            new_artifact_obj = factory.create_db_artifact(
-                artifact, artifact_type_obj, version_obj.id, session
+            artifact = self._write_artifact(
+                model_id, version_id, artifact, force, session
             )
-
-            # Use session to add object.
-            session.add(new_artifact_obj)
             session.commit()
             return artifact
 
+    def write_artifacts(
+        self,
+        model_id: str,
+        version_id: str,
+        artifacts: List[ArtifactModel],
+        *,
+        force: bool = False,
+        parents: bool = False,
+    ) -> List[ArtifactResult]:
+        duplicates = find_duplicates(artifacts)
+        with Session(self.engine) as session:
+            if parents:
+                storeutil.create_parents(self, model_id, version_id)
+            else:
+                # Ensure parents exist; if not, no artifact can be written.
+                try:
+                    _ = DBReader.get_version(model_id, version_id, session)
+                except errors.ErrorNotFound as e:
+                    return [
+                        duplicate if duplicate is not None else e
+                        for duplicate in duplicates
+                    ]
+
+            # The whole batch is written in a single transaction, with a
+            # savepoint per artifact, so that a failed one is undone alone,
+            # including the removal of the artifact it was to replace.
+            results: List[ArtifactResult] = []
+            for artifact, duplicate in zip(artifacts, duplicates):
+                if duplicate is not None:
+                    results.append(duplicate)
+                    continue
+                savepoint = session.begin_nested()
+                try:
+                    written = self._write_artifact(
+                        model_id, version_id, artifact, force, session
+                    )
+                    # Flush, so that blobs shared between artifacts are seen.
+                    session.flush()
+                except (errors.ErrorNotFound, errors.ErrorAlreadyExists) as e:
+                    savepoint.rollback()
+                    results.append(e)
+                    continue
+                savepoint.commit()
+                results.append(written)
+            session.commit()
+            return results
+
+    def _write_artifact(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact: ArtifactModel,
+        force: bool,
+        session: Session,
+    ) -> ArtifactModel:
+        """
+        Add an artifact to a DB session, replacing an existing one if forced.
+        :param model_id: The identifier for the model
+        :param version_id: The identifier for the model version
+        :param artifact: The artifact
+        :param force: Overwrite the artifact if it already exists
+        :param session: The DB session, which the caller commits
+        :raises ErrorAlreadyExists: If the artifact exists and force is not set
+        :return: The artifact as written
+        """
+        # Check if artifact already exists.
+        try:
+            _, artifact_obj = DBReader.get_artifact(
+                model_id,
+                version_id,
+                artifact.header.identifier,
+                session,
+            )
+            if not force:
+                raise errors.ErrorAlreadyExists(
+                    f"Artifact '{artifact.header.identifier}' already exists."
+                )
+            else:
+                # We have no edit functionality, nor any versioning system, so delete the previous version.
+                # TODO: versioning? Keep previous versions?
+                session.delete(artifact_obj)
+        except errors.ErrorNotFound:
+            # If artifact was not found, it is ok, force it or not we will create it.
+            pass
+
+        # Large payloads are stored out of line, in the same transaction.
+        artifact = offload_blobs(
+            artifact, lambda content: self._write_blob(content, session)
+        )
+
+        # Get type and parent version info.
+        artifact_type_obj = DBReader.get_artifact_type(
+            artifact.header.type, session
+        )
+        _, version_obj = DBReader.get_version(model_id, version_id, session)
+
+        # Create the actual object.
+        new_artifact_obj = factory.create_db_artifact(
+            artifact, artifact_type_obj, version_obj.id, session
+        )
+
+        # Use session to add object.
+        session.add(new_artifact_obj)
+        return artifact
+
     def read_artifact(
         self,
         model_id: str,
@@ -258,16 +352,51 @@ class RelationalDBStoreSession(ArtifactStoreSession):
         version_id: str,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[ArtifactModel]:
-        # TODO: not the best support of offset and limit, still loading everything from DB.
         with Session(self.engine) as session:
-            all_artifacts = []
-            for artifact_type in DBReader.SUPPORTED_ARTIFACT_DB_CLASSES.keys():
-                artifacts = DBReader.get_artifacts_for_type(
-                    model_id, version_id, artifact_type, session
+            _, version_obj = DBReader.get_version(model_id, version_id, session)
+            return DBReader.get_artifacts(
+                version_obj.id,
+                session,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+
+    def read_artifacts_by_ids(
+        self,
+        model_id: str,
+        version_id: str,
+        artifact_ids: List[str],
+    ) -> List[ArtifactResult]:
+        with Session(self.engine) as session:
+            try:
+                _, version_obj = DBReader.get_version(
+                    model_id, version_id, session
+                )
+            except errors.ErrorNotFound as e:
+                return [e for _ in artifact_ids]
+
+            # All artifacts are loaded with a single query.
+            found = {
+                artifact.header.identifier: artifact
+                for artifact in DBReader.get_artifacts(
+                    version_obj.id,
+                    session,
+                    where=DBArtifactHeader.identifier.in_(artifact_ids),
+                )
+            }
+            return [
+                (
+                    found[artifact_id]
+                    if artifact_id in found
+                    else errors.ErrorNotFound(
+                        f"Artifact with identifier {artifact_id} and associated to model {model_id}, and version {version_id} was not found in the artifact store."
+                    )
                 )
-                all_artifacts.extend(artifacts)
-            return all_artifacts[offset : offset + limit]
+                for artifact_id in artifact_ids
+            ]
 
     def search_artifacts(
         self,
@@ -275,11 +404,13 @@ class RelationalDBStoreSession(ArtifactStoreSession):
         version_id: str,
         query: Query = Query(),
     ) -> List[ArtifactModel]:
-        # TODO: not the most efficient way, since it loads all artifacts first, before filtering.
-        artifacts = self.read_artifacts(model_id, version_id)
-        return [
-            artifact for artifact in artifacts if query.filter.match(artifact)
-        ]
+        with Session(self.engine) as session:
+            _, version_obj = DBReader.get_version(model_id, version_id, session)
+
+            # Filter in the DB, so that only matching artifacts are hydrated.
+            return DBReader.get_artifacts(
+                version_obj.id, session, where=compile_filter(query.filter)
+            )
 
     def delete_artifact(
         self,
@@ -291,6 +422,111 @@ class RelationalDBStoreSession(ArtifactStoreSession):
             artifact, artifact_obj = DBReader.get_artifact(
                 model_id, version_id, artifact_id, session
             )
+            self._keep_position(artifact_obj.artifact_header, session)
             session.delete(artifact_obj)
             session.commit()
             return artifact
+
+    @staticmethod
+    def _keep_position(header_obj: DBArtifactHeader, session: Session) -> None:
+        """Keep the position of an artifact being deleted, for cursors that name it."""
+        session.execute(
+            delete(DBDeletedArtifact)
+            .where(DBDeletedArtifact.version_id == header_obj.version_id)
+            .where(DBDeletedArtifact.identifier == header_obj.identifier)
+        )
+        session.add(
+            DBDeletedArtifact(
+                identifier=header_obj.identifier,
+                timestamp=header_obj.timestamp,
+                header_id=header_obj.id,
+                version_id=header_obj.version_id,
+            )
+        )
+
+    # -------------------------------------------------------------------------
+    # Blobs
+    # -------------------------------------------------------------------------
+
+    def write_blob(self, content: bytes) -> str:
+        with Session(self.engine) as session:
+            digest = self._write_blob(content, session)
+            session.commit()
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        check_digest(digest)
+        with Session(self.engine) as session:
+            blob_obj = session.get(DBBlob, digest)
+            if blob_obj is None:
+                raise errors.ErrorNotFound(f"Blob {digest}")
+            return blob_obj.content
+
+    def write_blob_chunks(self, chunks: Iterable[bytes], digest: str) -> str:
+        check_digest(digest)
+        # A blob is a single column value, so it is written at once.
+        return self.write_blob(b"".join(checked_chunks(chunks, digest)))
+
+    def read_blob_chunks(self, digest: str) -> Tuple[int, Iterator[bytes]]:
+        check_digest(digest)
+        with Session(self.engine) as session:
+            size = session.scalar(
+                select(func.length(DBBlob.content)).where(
+                    DBBlob.digest == digest
+                )
+            )
+        if size is None:
+            raise errors.ErrorNotFound(f"Blob {digest}")
+        return size, self._blob_chunks(digest, size)
+
+    def _blob_chunks(self, digest: str, size: int) -> Iterator[bytes]:
+        """
+        Read a blob in chunks, each with a query of its own.
+        :param digest: The digest that addresses the blob
+        :param size: The size of the blob
+        :return: The blob content, in chunks
+        """
+        for start in range(0, size, BLOB_CHUNK_SIZE):
+            with Session(self.engine) as session:
+                chunk = session.scalar(
+                    select(
+                        func.substr(
+                            DBBlob.content,
+                            start + 1,
+                            BLOB_CHUNK_SIZE,
+                            type_=LargeBinary,
+                        )
+                    ).where(DBBlob.digest == digest)
+                )
+            if chunk is None:
+                raise errors.ErrorNotFound(f"Blob {digest}")
+            yield chunk
+
+    def _write_blob(self, content: bytes, session: Session) -> str:
+        """
+        Add a blob to a DB session, unless it is already stored.
+        :param content: The blob content
+        :param session: The DB session, which the caller commits
+        :return: The digest that addresses the blob
+        """
+        digest = blob_digest(content)
+        values = {"digest": digest, "content": content}
+        # Concurrent writers of the same blob must not fail each other.
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            session.execute(
+                postgresql.insert(DBBlob)
+                .values(values)
+                .on_conflict_do_nothing()
+            )
+        elif dialect == "sqlite":
+            session.execute(
+                sqlite.insert(DBBlob).values(values).on_conflict_do_nothing()
+            )
+        elif session.get(DBBlob, digest) is None:
+            try:
+                with session.begin_nested():
+                    session.add(DBBlob(**values))
+            except IntegrityError:
+                pass
+        return digest
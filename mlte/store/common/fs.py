@@ -5,10 +5,19 @@ Common functions for file-based stores.
 """
 from __future__ import annotations
 
+import contextlib
+import gzip
+import importlib
 import json
+import os
 import shutil
+import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from types import ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+from urllib.parse import parse_qs, urlsplit
 
 from mlte.store.base import StoreURIPrefix
 
@@ -23,18 +32,298 @@ def parse_root_path(uristr: str) -> Path:
         tuple(StoreURIPrefix.LOCAL_FILESYSTEM)
     ), "Not a valid file system URI."
 
-    # Remove any of the possible FS prefixes, and return a clean Path.
-    path = uristr
+    # Remove parameters and any of the possible FS prefixes, and return a
+    # clean Path.
+    path = uristr.split("?", 1)[0]
     for prefix in tuple(StoreURIPrefix.LOCAL_FILESYSTEM):
         path = path.replace(prefix, "")
     return Path(path)
 
 
+def parse_codec(uristr: str) -> FileCodec:
+    """
+    Parse the codec used to encode new files from the URI.
+
+    The codec is selected with the `codec` URI parameter, for example
+    `fs:///path/to/store?codec=gzip`; by default, pretty-printed JSON is used.
+    :param uristr: The URI
+    :raises ValueError: If the codec is not known
+    :raises RuntimeError: If packages required by the codec are missing
+    :return: The codec
+    """
+    params = parse_qs(urlsplit(uristr).query)
+    names = params.get("codec", [DEFAULT_CODEC])
+    return get_codec(names[-1])
+
+
+# -----------------------------------------------------------------------------
+# Low-level file helpers
+# -----------------------------------------------------------------------------
+
+
+def _lock_file(fd: int) -> None:
+    """Block until an exclusive advisory lock is held on an open file."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+def _unlock_file(fd: int) -> None:
+    """Release an advisory lock taken with _lock_file()."""
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush the contents of a file to disk."""
+    with path.open("rb") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_folder(path: Path) -> None:
+    """Flush a folder entry to disk, so that renames and deletes in it persist."""
+    if sys.platform == "win32":
+        # Folders cannot be opened on Windows; entries are flushed with files.
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _GroupCommit:
+    """The files and folders written during a group commit, pending a flush."""
+
+    def __init__(self) -> None:
+        self.files: Set[Path] = set()
+        """Files written in the batch."""
+
+        self.folders: Set[Path] = set()
+        """Folders with entries created or removed in the batch."""
+
+    def flush(self) -> None:
+        """Flush all files and folders in the batch to disk."""
+        for file in sorted(self.files):
+            # Files may have been deleted later in the same batch.
+            if file.exists():
+                _fsync_file(file)
+        for folder in sorted(self.folders):
+            if folder.exists():
+                _fsync_folder(folder)
+
+
+# -----------------------------------------------------------------------------
+# Codecs
+# -----------------------------------------------------------------------------
+
+
+def _import_optional(module: str, codec: str) -> ModuleType:
+    """Import a package that is only required by some codecs."""
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise RuntimeError(
+            f"Codec '{codec}' requires the '{module}' package to be installed."
+        )
+
+
+class FileCodec:
+    """
+    Encodes the documents stored in files of a file system store.
+
+    Each codec writes files with its own extension, so files written with
+    different codecs can be stored side by side and still be read back.
+    """
+
+    name: str = ""
+    """The name used to select the codec."""
+
+    extension: str = ""
+    """The extension of the files written by the codec."""
+
+    def check(self) -> None:
+        """
+        Check that the codec can be used.
+        :raises RuntimeError: If packages required by the codec are missing
+        """
+        pass
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encode a document into file content."""
+        raise NotImplementedError("Cannot invoke method on abstract codec.")
+
+    def decode(self, content: bytes) -> Dict[str, Any]:
+        """Decode a document from file content."""
+        raise NotImplementedError("Cannot invoke method on abstract codec.")
+
+
+class JsonCodec(FileCodec):
+    """Plain JSON, either pretty-printed or compact."""
+
+    extension = ".json"
+
+    def __init__(self, name: str, indent: Optional[int]) -> None:
+        self.name = name
+        self.indent = indent
+        """The JSON indentation, or None for compact JSON."""
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        if self.indent is None:
+            return json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return json.dumps(data, indent=self.indent).encode("utf-8")
+
+    def decode(self, content: bytes) -> Dict[str, Any]:
+        data: Dict[str, Any] = json.loads(content)
+        return data
+
+
+class GzipCodec(FileCodec):
+    """Gzip-compressed compact JSON."""
+
+    name = "gzip"
+    extension = ".json.gz"
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        # A fixed mtime keeps the content, and so its hash, deterministic.
+        return gzip.compress(_COMPACT_JSON.encode(data), mtime=0)
+
+    def decode(self, content: bytes) -> Dict[str, Any]:
+        return _COMPACT_JSON.decode(gzip.decompress(content))
+
+
+class ZstdCodec(FileCodec):
+    """Zstandard-compressed compact JSON; requires the `zstandard` package."""
+
+    name = "zstd"
+    extension = ".json.zst"
+
+    def check(self) -> None:
+        _import_optional("zstandard", self.name)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        zstandard = _import_optional("zstandard", self.name)
+        content: bytes = zstandard.ZstdCompressor().compress(
+            _COMPACT_JSON.encode(data)
+        )
+        return content
+
+    def decode(self, content: bytes) -> Dict[str, Any]:
+        zstandard = _import_optional("zstandard", self.name)
+        return _COMPACT_JSON.decode(
+            zstandard.ZstdDecompressor().decompress(content)
+        )
+
+
+class MsgpackCodec(FileCodec):
+    """MessagePack; requires the `msgpack` package."""
+
+    name = "msgpack"
+    extension = ".msgpack"
+
+    def check(self) -> None:
+        _import_optional("msgpack", self.name)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        msgpack = _import_optional("msgpack", self.name)
+        content: bytes = msgpack.packb(data, use_bin_type=True)
+        return content
+
+    def decode(self, content: bytes) -> Dict[str, Any]:
+        msgpack = _import_optional("msgpack", self.name)
+        data: Dict[str, Any] = msgpack.unpackb(content, raw=False)
+        return data
+
+
+_COMPACT_JSON = JsonCodec("json-compact", indent=None)
+
+DEFAULT_CODEC = "json"
+"""The codec used when none is selected; pretty-printed JSON."""
+
+CODECS: Dict[str, FileCodec] = {
+    codec.name: codec
+    for codec in [
+        JsonCodec(DEFAULT_CODEC, indent=4),
+        _COMPACT_JSON,
+        GzipCodec(),
+        ZstdCodec(),
+        MsgpackCodec(),
+    ]
+}
+"""All available codecs, by name."""
+
+
+def get_codec(name: str) -> FileCodec:
+    """
+    Get a codec by name.
+    :param name: The name of the codec
+    :raises ValueError: If the codec is not known
+    :raises RuntimeError: If packages required by the codec are missing
+    :return: The codec
+    """
+    if name not in CODECS:
+        raise ValueError(
+            f"Unknown codec '{name}', expected one of: {', '.join(CODECS)}."
+        )
+    codec = CODECS[name]
+    codec.check()
+    return codec
+
+
+def codec_for_path(path: Path) -> Optional[FileCodec]:
+    """
+    Get the codec that reads a file, based on its extension.
+    :param path: The path of the file
+    :return: The codec, or None if the file was not written by any codec
+    """
+    # Longer extensions first, so ".json.gz" is not taken for ".gz".
+    for codec in sorted(CODECS.values(), key=lambda c: -len(c.extension)):
+        if path.name.endswith(codec.extension):
+            return codec
+    return None
+
+
+# -----------------------------------------------------------------------------
+# JsonFileStorage
+# -----------------------------------------------------------------------------
+
+
 class JsonFileStorage:
-    """A simple JSON storage wrapper for a file system store."""
+    """
+    A simple JSON storage wrapper for a file system store.
+
+    Documents can be encoded with any of the available codecs; files are
+    decoded with the codec matching their extension, and extensionless files
+    (such as internal indexes) are always JSON.
+
+    Files are always replaced atomically: content is written to a temporary
+    file in the same folder, flushed to disk and then renamed over the target,
+    so a crash or a concurrent reader never sees a partially written file.
+    """
 
     JSON_EXT = ".json"
 
+    LOCK_FILENAME = ".lock"
+    """Name of the file used to hold advisory locks on a folder."""
+
+    def __init__(self, codec: Optional[FileCodec] = None) -> None:
+        self.codec = codec if codec is not None else CODECS[DEFAULT_CODEC]
+        """The codec used to encode documents written with encode()."""
+
+        self._local = threading.local()
+        """Per-thread held folder locks and group commit state."""
+
     def create_folder(self, path: Path) -> None:
         Path.mkdir(path, parents=True)
 
@@ -45,28 +334,195 @@ class JsonFileStorage:
         shutil.rmtree(path)
 
     def list_json_files(self, path: Path) -> List[Path]:
+        """List the files in a folder written by any codec."""
         return [
             x
             for x in sorted(path.iterdir())
-            if x.is_file() and x.suffix == self.JSON_EXT
+            if x.is_file() and codec_for_path(x) is not None
         ]
 
     def read_json_file(self, path: Path) -> Dict[str, Any]:
-        with path.open("r") as f:
-            data: Dict[str, Any] = json.load(f)
-        return data
+        codec = codec_for_path(path) or CODECS[DEFAULT_CODEC]
+        return codec.decode(self.read_bytes_from_file(path))
 
     def write_json_to_file(self, path: Path, data: Dict[str, Any]) -> None:
-        with path.open("w") as f:
-            json.dump(data, f, indent=4)
+        self.write_bytes_to_file(path, self.encode_json(data))
+
+    def encode_json(self, data: Dict[str, Any]) -> bytes:
+        return CODECS[DEFAULT_CODEC].encode(data)
+
+    def decode_json(self, content: bytes) -> Dict[str, Any]:
+        return CODECS[DEFAULT_CODEC].decode(content)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encode a document with the codec of the storage."""
+        return self.codec.encode(data)
+
+    def read_bytes_from_file(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def write_compact_json_to_file(
+        self, path: Path, data: Dict[str, Any]
+    ) -> None:
+        """Atomically replace the content of a file with compact JSON."""
+        self.write_bytes_to_file(path, _COMPACT_JSON.encode(data))
+
+    def write_bytes_to_file(self, path: Path, content: bytes) -> None:
+        """
+        Atomically replace the content of a file.
+
+        Outside of a group commit, the file and its folder entry are flushed
+        to disk before this returns.
+        :param path: The path of the file
+        :param content: The content to write
+        """
+        self.write_chunks_to_file(path, [content])
+
+    def write_chunks_to_file(self, path: Path, chunks: Iterable[bytes]) -> None:
+        """
+        Atomically replace the content of a file, written in chunks.
+
+        If iterating over the chunks fails, the file is left as it was.
+        :param path: The path of the file
+        :param chunks: The content to write, in chunks
+        """
+        batch = self._group_commit_batch()
+
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                if batch is None:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        if batch is None:
+            _fsync_folder(path.parent)
+        else:
+            batch.files.add(path)
+            batch.folders.add(path.parent)
+
+    def append_bytes_to_file(
+        self, path: Path, content: bytes, offset: int
+    ) -> None:
+        """
+        Append content to a file, after its first offset bytes.
+
+        Anything past the offset, such as a record left partially written by
+        a crash, is discarded. Unlike other writes, appends are not atomic, so
+        readers must tell complete records apart themselves. Outside of a
+        group commit, the file is flushed to disk before this returns.
+        :param path: The path of the file, which must exist
+        :param content: The content to append
+        :param offset: The size of the file content to keep
+        """
+        batch = self._group_commit_batch()
+        with path.open("r+b") as f:
+            f.truncate(offset)
+            f.seek(offset)
+            f.write(content)
+            if batch is None:
+                f.flush()
+                os.fsync(f.fileno())
+        if batch is not None:
+            batch.files.add(path)
 
     def delete_file(self, path: Path) -> None:
         if not path.exists():
             raise RuntimeError(f"Path {path} does not exist.")
         path.unlink()
 
-    def add_extension(self, filename: str) -> Path:
-        return Path(filename + self.JSON_EXT)
+        batch = self._group_commit_batch()
+        if batch is None:
+            _fsync_folder(path.parent)
+        else:
+            batch.folders.add(path.parent)
+
+    def add_extension(
+        self, filename: str, codec: Optional[FileCodec] = None
+    ) -> Path:
+        """
+        Add the extension of a codec to a filename.
+        :param filename: The filename, without extension
+        :param codec: The codec, or None for the codec of the storage
+        :return: The filename with its extension
+        """
+        codec = codec if codec is not None else self.codec
+        return Path(filename + codec.extension)
 
     def get_just_filename(self, path: Path) -> str:
-        return path.stem
+        codec = codec_for_path(path)
+        if codec is None:
+            return path.stem
+        return path.name[: -len(codec.extension)]
+
+    # -------------------------------------------------------------------------
+    # Concurrency and durability
+    # -------------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def lock_folder(self, path: Path) -> Iterator[None]:
+        """
+        Hold an exclusive advisory lock on a folder.
+
+        The lock is shared by all processes and threads that use this class on
+        the same folder. It is re-entrant within a thread.
+        :param path: The folder to lock, which must exist
+        """
+        held = self._held_locks()
+        key = path.resolve()
+        if key in held:
+            yield
+            return
+
+        fd = os.open(Path(path, self.LOCK_FILENAME), os.O_RDWR | os.O_CREAT)
+        try:
+            _lock_file(fd)
+            held.add(key)
+            try:
+                yield
+            finally:
+                held.discard(key)
+                _unlock_file(fd)
+        finally:
+            os.close(fd)
+
+    @contextlib.contextmanager
+    def group_commit(self) -> Iterator[None]:
+        """
+        Batch the disk flushes of all writes done in the current thread.
+
+        Writes are still atomic and immediately visible, but they are only
+        flushed to disk, all at once, when the batch ends. This makes bulk
+        writes much faster; once the batch ends, its writes are as durable as
+        individual ones. Nested batches are merged into the outermost one.
+        """
+        if self._group_commit_batch() is not None:
+            yield
+            return
+
+        batch = _GroupCommit()
+        self._local.batch = batch
+        try:
+            yield
+        finally:
+            self._local.batch = None
+            batch.flush()
+
+    def _group_commit_batch(self) -> Optional[_GroupCommit]:
+        """Return the group commit in progress in this thread, if any."""
+        return getattr(self._local, "batch", None)
+
+    def _held_locks(self) -> Set[Path]:
+        """Return the folders locked by this thread."""
+        if not hasattr(self._local, "held_locks"):
+            self._local.held_locks = set()
+        held: Set[Path] = self._local.held_locks
+        return held
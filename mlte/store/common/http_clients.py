@@ -6,8 +6,22 @@ HTTP clients that can be used by underlying stores to access remote HTTP stores.
 
 from __future__ import annotations
 
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
 import requests
@@ -26,10 +40,16 @@ class HttpClientType(Enum):
     TESTCLIENT = "testclient"
     """The fastapi TestClient HTTP client."""
 
+    HTTPX = "httpx"
+    """The httpx-based asynchronous HTTP client."""
+
 
 HttpResponse = Union[requests.Response, httpx.Response]
 """Standard HTTP response, both have same implicit interface."""
 
+ResponseType = TypeVar("ResponseType", requests.Response, httpx.Response)
+"""The response type of a specific client."""
+
 
 class HttpClient:
     """Interface for an HTTP client."""
@@ -38,7 +58,9 @@ class HttpClient:
         self.type = type
         self.headers: dict[str, str] = {}
 
-    def get(self, url: str, **kwargs) -> HttpResponse:
+    def get(
+        self, url: str, headers: Optional[dict[str, str]] = None, **kwargs
+    ) -> HttpResponse:
         raise NotImplementedError("get()")
 
     def post(
@@ -54,6 +76,15 @@ class HttpClient:
     def delete(self, url: str, **kwargs) -> HttpResponse:
         raise NotImplementedError("delete()")
 
+    def stream_lines(self, url: str, **kwargs) -> Iterator[str]:
+        """
+        Send a GET request, and iterate over the lines of the response as they arrive.
+        :param url: The URL
+        :raises: Error in the event the request failed
+        :return: An iterator over the non-empty lines of the response body
+        """
+        raise NotImplementedError("stream_lines()")
+
     @staticmethod
     def raise_for_response(response: HttpResponse) -> None:
         """
@@ -63,14 +94,26 @@ class HttpClient:
         """
         if response.status_code == codes.OK:
             return
-        if response.status_code == codes.NOT_FOUND:
-            raise errors.ErrorNotFound(f"{response.json()}")
-        if response.status_code == codes.ALREADY_EXISTS:
-            raise errors.ErrorAlreadyExists(f"{response.json()}")
-        if response.status_code == codes.UNAUTHORIZED:
-            raise errors.UnauthenticatedError(f"{response.json()}")
+        raise HttpClient.error_for_status(
+            response.status_code, f"{response.json()}"
+        )
+
+    @staticmethod
+    def error_for_status(status_code: int, detail: str) -> RuntimeError:
+        """
+        Get the error that corresponds to an unsuccessful status code.
+        :param status_code: The status code
+        :param detail: The error message
+        :return: The error
+        """
+        if status_code == codes.NOT_FOUND:
+            return errors.ErrorNotFound(detail)
+        if status_code == codes.ALREADY_EXISTS:
+            return errors.ErrorAlreadyExists(detail)
+        if status_code == codes.UNAUTHORIZED:
+            return errors.UnauthenticatedError(detail)
         else:
-            raise errors.InternalError(f"{response.json()}")
+            return errors.InternalError(detail)
 
 
 class OAuthHttpClient(HttpClient):
@@ -82,6 +125,8 @@ class OAuthHttpClient(HttpClient):
         "Accept": "application/json",
     }
     TOKEN_ENDPOINT = "/token"
+    TOKEN_EXPIRY_MARGIN = 30
+    """Seconds before its expiry at which a token is no longer reused."""
 
     def __init__(
         self,
@@ -94,6 +139,12 @@ class OAuthHttpClient(HttpClient):
         self.access_token: Optional[str] = None
         """The access token."""
 
+        self.token_expiry: Optional[float] = None
+        """The monotonic time at which the access token expires, if known."""
+
+        self.api_url: Optional[str] = None
+        """The API URL the token was obtained from, used to re-authenticate."""
+
         self.username = username
         """The username to use when authenticating."""
 
@@ -108,12 +159,58 @@ class OAuthHttpClient(HttpClient):
         payload.update({"username": username, "password": password})
         return payload
 
-    def _store_token(self, access_token: str):
-        """Stores the token and sets proper headers."""
+    def _store_token(self, access_token: str, expires_in: Optional[int] = None):
+        """Stores the token and its expiry, and sets proper headers."""
         if access_token is not None:
             self.access_token = access_token
+            self.token_expiry = (
+                time.monotonic() + expires_in
+                if expires_in is not None
+                else None
+            )
             self.headers = {"Authorization": f"Bearer {self.access_token}"}
 
+    def has_valid_token(self) -> bool:
+        """Returns True if a token is stored and is not about to expire."""
+        if self.access_token is None:
+            return False
+        if self.token_expiry is None:
+            return True
+        return time.monotonic() < self.token_expiry - self.TOKEN_EXPIRY_MARGIN
+
+    def ensure_authenticated(self, api_url: str):
+        """Authenticates against the API, unless a valid token is already stored for it."""
+        if self.api_url == api_url and self.has_valid_token():
+            return
+        self.authenticate(api_url)
+
+    def _send(
+        self,
+        send: Callable[[dict[str, str]], ResponseType],
+        headers: Optional[dict[str, str]] = None,
+    ) -> ResponseType:
+        """
+        Sends a request, re-authenticating and retrying once if the token was rejected.
+        :param send: Sends the request with the given headers
+        :param headers: Headers for this request, besides the client headers
+        :return: The response
+        """
+        response = send(self._request_headers(headers))
+        if (
+            response.status_code == codes.UNAUTHORIZED
+            and self.access_token is not None
+            and self.api_url is not None
+        ):
+            self.authenticate(self.api_url)
+            response = send(self._request_headers(headers))
+        return response
+
+    def _request_headers(
+        self, headers: Optional[dict[str, str]]
+    ) -> dict[str, str]:
+        """Returns the client headers, extended with those of a request."""
+        return {**self.headers, **headers} if headers else self.headers
+
     def authenticate(
         self,
         api_url: str,
@@ -121,6 +218,21 @@ class OAuthHttpClient(HttpClient):
         password: Optional[str] = None,
     ):
         """Sends an authentication request and retrieves and stores the token."""
+        payload = self._token_request_payload(username, password)
+
+        # Send authentication request to get token.
+        self.access_token = None
+        self.token_expiry = None
+        self.headers = self.TOKEN_REQ_HEADERS
+        url = f"{api_url}{self.TOKEN_ENDPOINT}"
+        response = self.post(url, data=payload)
+        self.headers = {}
+        self._process_token_response(response, api_url)
+
+    def _token_request_payload(
+        self, username: Optional[str], password: Optional[str]
+    ) -> dict[str, str]:
+        """Returns the payload for a token request, with the given or internal credentials."""
         # Validate we have a user and password.
         if username is None:
             username = self.username
@@ -134,15 +246,10 @@ class OAuthHttpClient(HttpClient):
                 raise Exception(
                     "Can't authenticate without password, no internal or argument password received."
                 )
+        return self._format_oauth_password_payload(username, password)
 
-        # Send authentication request to get token.
-        self.headers = self.TOKEN_REQ_HEADERS
-        url = f"{api_url}{self.TOKEN_ENDPOINT}"
-        response = self.post(
-            url,
-            data=self._format_oauth_password_payload(username, password),
-        )
-        self.headers = {}
+    def _process_token_response(self, response: HttpResponse, api_url: str):
+        """Checks the reply to a token request, and stores the token."""
         if response.status_code != codes.OK:
             reply = response.content.decode("utf-8")
             raise Exception(
@@ -157,7 +264,10 @@ class OAuthHttpClient(HttpClient):
             )
         if "access_token" not in response_data:
             raise Exception("Access token was not contained in response.")
-        self._store_token(response_data["access_token"])
+        self._store_token(
+            response_data["access_token"], response_data.get("expires_in")
+        )
+        self.api_url = api_url
 
     def process_credentials(self, uri: str) -> str:
         """Obtains user and password from uri for client auth, and returns cleaned up uri."""
@@ -179,30 +289,274 @@ class RequestsClient(OAuthHttpClient):
     ) -> None:
         super().__init__(HttpClientType.REQUESTS, username, password)
 
-    def get(self, url: str, **kwargs) -> requests.Response:
-        return requests.get(url, headers=self.headers, **kwargs)
+        self.session = requests.Session()
+        """The session, which keeps connections to the server alive between requests."""
+
+    def get(
+        self, url: str, headers: Optional[dict[str, str]] = None, **kwargs
+    ) -> requests.Response:
+        return self._send(
+            lambda headers: self.session.get(url, headers=headers, **kwargs),
+            headers,
+        )
 
     def post(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> requests.Response:
-        return requests.post(
-            url,
-            headers=self.headers,
-            data=data,
-            json=json,
-            **kwargs,
+        return self._send(
+            lambda headers: self.session.post(
+                url,
+                headers=headers,
+                data=data,
+                json=json,
+                **kwargs,
+            )
         )
 
     def put(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> requests.Response:
-        return requests.put(
-            url,
-            headers=self.headers,
-            data=data,
-            json=json,
-            **kwargs,
+        return self._send(
+            lambda headers: self.session.put(
+                url,
+                headers=headers,
+                data=data,
+                json=json,
+                **kwargs,
+            )
         )
 
     def delete(self, url: str, **kwargs) -> requests.Response:
-        return requests.delete(url, headers=self.headers, **kwargs)
+        return self._send(
+            lambda headers: self.session.delete(url, headers=headers, **kwargs)
+        )
+
+    def stream_lines(self, url: str, **kwargs) -> Iterator[str]:
+        response = self._send(
+            lambda headers: self.session.get(
+                url, headers=headers, stream=True, **kwargs
+            )
+        )
+        with response:
+            self.raise_for_response(response)
+            for line in response.iter_lines():
+                if line:
+                    yield line.decode("utf-8")
+
+    def close(self) -> None:
+        """Close the pooled connections of the client."""
+        self.session.close()
+
+
+class AsyncHttpxClient(OAuthHttpClient):
+    """
+    Client implementation with awaitable requests, using the httpx library.
+
+    Connections are pooled, and use HTTP/2 when the h2 package is installed.
+    """
+
+    def __init__(
+        self,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(HttpClientType.HTTPX, username, password)
+
+        self.client = (
+            client
+            if client is not None
+            else httpx.AsyncClient(http2=_http2_available())
+        )
+        """The underlying client, which pools connections to the server."""
+
+    async def get(  # type: ignore[override]
+        self, url: str, headers: Optional[dict[str, str]] = None, **kwargs
+    ) -> httpx.Response:
+        return await self._send(
+            lambda headers: self.client.get(url, headers=headers, **kwargs),
+            headers,
+        )
+
+    async def post(  # type: ignore[override]
+        self, url: str, data: Any = None, json: Any = None, **kwargs
+    ) -> httpx.Response:
+        return await self._send(
+            lambda headers: self.client.post(
+                url, headers=headers, data=data, json=json, **kwargs
+            )
+        )
+
+    async def put(  # type: ignore[override]
+        self, url: str, data: Any = None, json: Any = None, **kwargs
+    ) -> httpx.Response:
+        # Raw bodies are sent as content; httpx reserves data for forms.
+        if isinstance(data, bytes):
+            kwargs["content"] = data
+            data = None
+        return await self._send(
+            lambda headers: self.client.put(
+                url, headers=headers, data=data, json=json, **kwargs
+            )
+        )
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:  # type: ignore[override]
+        return await self._send(
+            lambda headers: self.client.delete(url, headers=headers, **kwargs)
+        )
+
+    async def stream_lines(  # type: ignore[override]
+        self, url: str, **kwargs
+    ) -> AsyncIterator[str]:
+        response = await self._send(
+            lambda headers: self.client.send(
+                self.client.build_request(
+                    "GET", url, headers=headers, **kwargs
+                ),
+                stream=True,
+            )
+        )
+        try:
+            if response.status_code != codes.OK:
+                await response.aread()
+                self.raise_for_response(response)
+            async for line in response.aiter_lines():
+                if line:
+                    yield line
+        finally:
+            await response.aclose()
+
+    async def authenticate(  # type: ignore[override]
+        self,
+        api_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        """Sends an authentication request and retrieves and stores the token."""
+        payload = self._token_request_payload(username, password)
+
+        # Headers are passed explicitly, as other requests may be in flight.
+        self.access_token = None
+        self.token_expiry = None
+        response = await self.client.post(
+            f"{api_url}{self.TOKEN_ENDPOINT}",
+            headers=self.TOKEN_REQ_HEADERS,
+            data=payload,
+        )
+        self._process_token_response(response, api_url)
+
+    async def ensure_authenticated(self, api_url: str):  # type: ignore[override]
+        """Authenticates against the API, unless a valid token is already stored for it."""
+        if self.api_url == api_url and self.has_valid_token():
+            return
+        await self.authenticate(api_url)
+
+    async def _send(  # type: ignore[override]
+        self,
+        send: Callable[[dict[str, str]], Awaitable[httpx.Response]],
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Sends a request, re-authenticating and retrying once if the token was rejected.
+        :param send: Sends the request with the given headers
+        :param headers: Headers for this request, besides the client headers
+        :return: The response
+        """
+        token = self.access_token
+        response = await send(self._request_headers(headers))
+        if (
+            response.status_code == codes.UNAUTHORIZED
+            and token is not None
+            and self.api_url is not None
+        ):
+            # Concurrent requests share the token; renew it only once.
+            if self.access_token == token:
+                await self.authenticate(self.api_url)
+            response = await send(self._request_headers(headers))
+        return response
+
+    async def close(self) -> None:
+        """Close the pooled connections of the client."""
+        await self.client.aclose()
+
+
+def _http2_available() -> bool:
+    """Returns True if the optional package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class ValidatorCache:
+    """
+    A bounded cache of response bodies, keyed by URL, for conditional GETs.
+
+    A cached body is reused only after the server confirms, with a 304 reply
+    to a request carrying its ETag, that it is still current.
+    """
+
+    DEFAULT_CAPACITY = 256
+    """The default number of responses kept."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity = capacity
+        """The number of responses kept."""
+
+        self._entries: OrderedDict[str, Tuple[str, Any]] = OrderedDict()
+        """The ETag and decoded body of each cached URL, least recent first."""
+
+        self._lock = threading.Lock()
+        """Protects the entries, as stores may be used from many threads."""
+
+    def lookup(self, url: str) -> Optional[Tuple[str, Any]]:
+        """
+        Get the cached ETag and body of a URL, to make a GET conditional on.
+        :param url: The URL
+        :return: The ETag and decoded body, or None if the URL is not cached
+        """
+        with self._lock:
+            return self._entries.get(url)
+
+    @staticmethod
+    def headers(entry: Optional[Tuple[str, Any]]) -> dict[str, str]:
+        """
+        Get the headers that make a GET conditional on a cached body.
+        :param entry: The cached ETag and body, from lookup()
+        :return: The headers, empty if nothing is cached
+        """
+        return {} if entry is None else {"If-None-Match": entry[0]}
+
+    def resolve(
+        self,
+        url: str,
+        response: HttpResponse,
+        entry: Optional[Tuple[str, Any]],
+    ) -> Any:
+        """
+        Get the body of a response to a GET, from the cache if not modified.
+        :param url: The URL that was requested
+        :param response: The response
+        :param entry: The cached ETag and body the GET was conditional on
+        :raises: Error in the event the request failed
+        :return: The decoded JSON body
+        """
+        if response.status_code == codes.NOT_MODIFIED and entry is not None:
+            # The entry may have been evicted meanwhile; it is current again.
+            self._store(url, entry)
+            return entry[1]
+
+        HttpClient.raise_for_response(response)
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag is None:
+            with self._lock:
+                self._entries.pop(url, None)
+        else:
+            self._store(url, (etag, body))
+        return body
+
+    def _store(self, url: str, entry: Tuple[str, Any]) -> None:
+        """Cache the ETag and body of a URL, evicting the least recent."""
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
@@ -6,9 +6,6 @@ Top-level functions for artifact store creation.
 
 from mlte.store.base import StoreType, StoreURI
 from mlte.store.user.store import UserStore
-from mlte.store.user.underlying.fs import FileSystemUserStore
-from mlte.store.user.underlying.memory import InMemoryUserStore
-from mlte.store.user.underlying.rdbs.store import RelationalDBUserStore
 
 
 def create_store(uri: str) -> UserStore:
@@ -19,10 +16,16 @@ def create_store(uri: str) -> UserStore:
     """
     parsed_uri = StoreURI.from_string(uri)
     if parsed_uri.type == StoreType.LOCAL_MEMORY:
+        from mlte.store.user.underlying.memory import InMemoryUserStore
+
         return InMemoryUserStore(parsed_uri)
     if parsed_uri.type == StoreType.RELATIONAL_DB:
+        from mlte.store.user.underlying.rdbs.store import RelationalDBUserStore
+
         return RelationalDBUserStore(parsed_uri)
     if parsed_uri.type == StoreType.LOCAL_FILESYSTEM:
+        from mlte.store.user.underlying.fs import FileSystemUserStore
+
         return FileSystemUserStore(parsed_uri)
     else:
         raise Exception(
@@ -6,7 +6,7 @@ Implementation of local file system artifact store.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Union
+from typing import ContextManager, List, Union
 
 import mlte.store.error as errors
 from mlte.store.base import StoreURI
@@ -80,18 +80,19 @@ class FileSystemUserStoreSession(UserStoreSession):
     # -------------------------------------------------------------------------
 
     def create_user(self, user: UserCreate) -> User:
-        if self._user_path(user.username).exists():
-            raise errors.ErrorAlreadyExists(f"User '{user.username}'")
-
         new_user = convert_to_hashed_user(user)
-        return self._write_user(new_user)
+        with self._lock_users():
+            if self._user_path(user.username).exists():
+                raise errors.ErrorAlreadyExists(f"User '{user.username}'")
+            return self._write_user(new_user)
 
     def edit_user(self, user: Union[UserCreate, BasicUser]) -> User:
-        if not self._user_path(user.username).exists():
-            raise errors.ErrorNotFound(f"User '{user.username}'")
+        with self._lock_users():
+            if not self._user_path(user.username).exists():
+                raise errors.ErrorNotFound(f"User '{user.username}'")
 
-        updated_user = update_user(self._read_user(user.username), user)
-        return self._write_user(updated_user)
+            updated_user = update_user(self._read_user(user.username), user)
+            return self._write_user(updated_user)
 
     def read_user(self, username: str) -> User:
         return self._read_user(username)
@@ -103,10 +104,10 @@ class FileSystemUserStoreSession(UserStoreSession):
         ]
 
     def delete_user(self, username: str) -> User:
-        self._ensure_user_exists(username)
-        user = self._read_user(username)
-        self.storage.delete_file(self._user_path(username))
-        return user
+        with self._lock_users():
+            user = self._read_user(username)
+            self.storage.delete_file(self._user_path(username))
+            return user
 
     # -------------------------------------------------------------------------
     # Internal helpers.
@@ -128,7 +129,21 @@ class FileSystemUserStoreSession(UserStoreSession):
         :return: The user object
         """
         self._ensure_user_exists(username)
-        return User(**self.storage.read_json_file(self._user_path(username)))
+        try:
+            return User(
+                **self.storage.read_json_file(self._user_path(username))
+            )
+        except FileNotFoundError:
+            # Deleted by another process since the check.
+            raise errors.ErrorNotFound(f"User {username}")
+
+    def _lock_users(self) -> ContextManager[None]:
+        """
+        Lock the users folder, to serialize changes to users across sessions,
+        threads and processes.
+        :return: The lock, to be used as a context manager
+        """
+        return self.storage.lock_folder(self._base_path())
 
     def _write_user(self, user: User) -> User:
         """Writes a user to storage."""
@@ -7,14 +7,13 @@ from __future__ import annotations
 
 from typing import List, Union
 
-import sqlalchemy
-import sqlalchemy.orm
 import sqlalchemy_utils
 from sqlalchemy import Engine, select
 from sqlalchemy.orm import Session
 
 import mlte.store.error as errors
 from mlte.store.base import StoreURI
+from mlte.store.common import rdbs
 from mlte.store.user.store import UserStore, UserStoreSession
 from mlte.store.user.underlying.rdbs.metadata import DBBase, DBUser
 from mlte.store.user.underlying.rdbs.reader import DBReader
@@ -32,8 +31,8 @@ class RelationalDBUserStore(UserStore):
     def __init__(self, uri: StoreURI, **kwargs) -> None:
         super().__init__(uri=uri)
 
-        self.engine = sqlalchemy.create_engine(uri.uri, **kwargs)
-        """The underlying storage for the store."""
+        self.engine = rdbs.create_engine(uri.uri, **kwargs)
+        """The underlying storage for the store, which owns the connection pool."""
 
         # Create the DB if it doesn't exist already.
         if not sqlalchemy_utils.database_exists(self.engine.url):
@@ -69,7 +68,9 @@ class RelationalDBUserStoreSession(UserStoreSession):
 
     def close(self) -> None:
         """Close the session."""
-        self.engine.dispose()
+        # Connections are returned to the store's pool after each operation;
+        # the engine is shared, so it must not be disposed here.
+        pass
 
     # -------------------------------------------------------------------------
     # User CRUD Elements
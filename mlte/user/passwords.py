@@ -5,6 +5,34 @@ Handling of passwords.
 """
 import bcrypt
 
+DEFAULT_WORK_FACTOR = 12
+"""The default bcrypt work factor, the log2 of the number of hashing rounds."""
+
+MIN_WORK_FACTOR = 4
+MAX_WORK_FACTOR = 31
+"""The range of work factors supported by bcrypt."""
+
+_work_factor = DEFAULT_WORK_FACTOR
+"""The work factor used for new hashes."""
+
+
+def set_work_factor(work_factor: int) -> None:
+    """
+    Sets the work factor used for new hashes. Existing hashes keep the work
+    factor they were created with, and can still be verified.
+    """
+    global _work_factor
+    if not MIN_WORK_FACTOR <= work_factor <= MAX_WORK_FACTOR:
+        raise ValueError(
+            f"Work factor must be between {MIN_WORK_FACTOR} and {MAX_WORK_FACTOR}, got {work_factor}."
+        )
+    _work_factor = work_factor
+
+
+def get_work_factor() -> int:
+    """Gets the work factor used for new hashes."""
+    return _work_factor
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies that a plain password matches a hashed one."""
@@ -18,6 +46,6 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def hash_password(password: str) -> str:
     """Gets the hash of a given plain password."""
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_work_factor)
     hashed_password = bcrypt.hashpw(password=pwd_bytes, salt=salt)
     return hashed_password.decode("utf-8")
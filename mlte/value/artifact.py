@@ -16,6 +16,7 @@ from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata
+from mlte.session.state import session
 from mlte.store.artifact.store import ArtifactStore
 from mlte.value.model import ValueModel
 
@@ -67,8 +68,7 @@ class Value(Artifact, metaclass=abc.ABCMeta):
     @staticmethod
     def load_all() -> list[Value]:
         """Loads all artifact models of the given type for the current session."""
-        value_models = Value.load_all_models(ArtifactType.VALUE)
-        return Value._load_from_models(value_models)
+        return Value.load_all_with(session().context, session().store)
 
     @staticmethod
     def load_all_with(context: Context, store: ArtifactStore) -> list[Value]:
@@ -76,11 +76,15 @@ class Value(Artifact, metaclass=abc.ABCMeta):
         value_models = Value.load_all_models_with(
             ArtifactType.VALUE, context, store
         )
-        return Value._load_from_models(value_models)
+        return Value._load_from_models(value_models, context, store)
 
     @staticmethod
-    def _load_from_models(value_models: list[ArtifactModel]) -> list[Value]:
-        """Converts a list of value models (as Artifact Models) into values."""
+    def _load_from_models(
+        value_models: list[ArtifactModel],
+        context: Context,
+        store: ArtifactStore,
+    ) -> list[Value]:
+        """Converts a list of value models (as Artifact Models) loaded from a store into values."""
         values = []
         for artifact_model in value_models:
             value_model: ValueModel = typing.cast(
@@ -90,6 +94,7 @@ class Value(Artifact, metaclass=abc.ABCMeta):
                 Value, load_class(value_model.value_class)
             )
             value = value_type.from_model(artifact_model)
+            value.post_load_hook(context, store)
             values.append(value)
         return values
 
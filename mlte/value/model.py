@@ -7,7 +7,7 @@ Model implementation for MLTE value types.
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import Field
 
@@ -93,8 +93,11 @@ class ImageValueModel(BaseModel):
     value_type: Literal[ValueType.IMAGE] = ValueType.IMAGE
     """An identitifier for the value type."""
 
-    data: str
-    """The image data as base64-encoded string."""
+    data: Optional[str] = None
+    """The image data as base64-encoded string, if stored inline."""
+
+    blob: Optional[str] = None
+    """The digest of the image data in the store blob area, if stored out of line."""
 
 
 class ArrayValueModel(BaseModel):
@@ -103,8 +106,11 @@ class ArrayValueModel(BaseModel):
     value_type: Literal[ValueType.ARRAY] = ValueType.ARRAY
     """An identitifier for the value type."""
 
-    data: List[Any]
-    """The array to capture."""
+    data: Optional[List[Any]] = None
+    """The array to capture, if stored inline."""
+
+    blob: Optional[str] = None
+    """The digest of the JSON-encoded array in the store blob area, if stored out of line."""
 
 
 ValueModel.model_rebuild()
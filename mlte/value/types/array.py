@@ -6,12 +6,16 @@ Implementation of Array value.
 
 from __future__ import annotations
 
+import json
 import typing
-from typing import Any, List
+from typing import Any, List, Optional, Union
 
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
+from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata
+from mlte.store.artifact.blob import LazyBlob
+from mlte.store.artifact.store import ArtifactStore
 from mlte.value.artifact import Value
 from mlte.value.model import ArrayValueModel, ValueModel, ValueType
 from mlte.value.types.integer import Integer
@@ -23,16 +27,50 @@ class Array(Value):
     Array implements the Value interface for a numpy array of values.
     """
 
-    def __init__(self, metadata: EvidenceMetadata, array: List[Any]):
+    def __init__(
+        self, metadata: EvidenceMetadata, array: Union[List[Any], LazyBlob]
+    ):
         """
         Initialize an Array instance.
         :param metadata: The generating measurement's metadata
-        :param array: The numpy array.
+        :param array: The numpy array, or the JSON-encoded array stored in the
+        blob area of a store.
         """
         super().__init__(self, metadata)
 
-        self.array: List[Any] = array
+        # Stores keep large arrays out of line, so those are only fetched
+        # from the store when first accessed.
+        self._blob: Optional[LazyBlob] = (
+            array if isinstance(array, LazyBlob) else None
+        )
+        """The blob holding the JSON-encoded array, if not yet fetched."""
+
+        self._array: Optional[List[Any]] = (
+            None if isinstance(array, LazyBlob) else array
+        )
+        """Underlying values represented as numpy array, once available."""
+
+    @property
+    def array(self) -> List[Any]:
         """Underlying values represented as numpy array."""
+        if self._array is None:
+            assert self._blob is not None, "Broken invariant."
+            self._array = json.loads(self._blob.read())
+        return self._array
+
+    @array.setter
+    def array(self, array: List[Any]) -> None:
+        self._array = array
+        self._blob = None
+
+    def post_load_hook(self, context: Context, store: ArtifactStore) -> None:
+        """
+        Bind a large array to the store it was loaded from.
+        :param context: The context from which the array was loaded
+        :param store: The store from which the array was loaded
+        """
+        if self._blob is not None:
+            self._blob.bind(store)
 
     def to_model(self) -> ArtifactModel:
         """
@@ -59,6 +97,11 @@ class Array(Value):
         body = typing.cast(ValueModel, model.body)
 
         assert body.value.value_type == ValueType.ARRAY, "Broken Precondition."
+        if body.value.blob is not None:
+            return Array(
+                metadata=body.metadata, array=LazyBlob(body.value.blob)
+            )
+        assert body.value.data is not None, "Broken Precondition."
         return Array(
             metadata=body.metadata,
             array=body.value.data,
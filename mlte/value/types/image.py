@@ -9,12 +9,15 @@ from __future__ import annotations
 import base64
 import typing
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
+from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata
 from mlte.spec.condition import Condition
+from mlte.store.artifact.blob import LazyBlob
+from mlte.store.artifact.store import ArtifactStore
 from mlte.validation.result import Ignore
 from mlte.value.artifact import Value
 from mlte.value.model import ImageValueModel, ValueModel, ValueType
@@ -28,12 +31,13 @@ class Image(Value):
     def __init__(
         self,
         metadata: EvidenceMetadata,
-        image: Union[str, Path, bytes],
+        image: Union[str, Path, bytes, LazyBlob],
     ):
         """
         Initialize an Image instance.
         :param metadata: The generating measurement's metadata
-        :param image: The path to the image (str, Path) or raw image data (bytes)
+        :param image: The path to the image (str, Path), raw image data (bytes)
+        or image data stored in the blob area of a store (LazyBlob)
         """
         if isinstance(image, str):
             image = Path(image)
@@ -41,15 +45,42 @@ class Image(Value):
         if isinstance(image, Path):
             with image.open("rb") as f:
                 image = f.read()
-        assert isinstance(image, bytes), "Broken invariant."
 
         super().__init__(self, metadata)
 
-        # TODO(Kyle): Unsure if storing media inline is the
-        # right way to go here (not scalable); reassess this.
+        # Stores keep images out of line, so loaded images are only fetched
+        # from the store when their data is first accessed.
+        self._blob: Optional[LazyBlob] = (
+            image if isinstance(image, LazyBlob) else None
+        )
+        """The blob holding the image data, if not yet fetched."""
+
+        self._image: Optional[bytes] = (
+            image if isinstance(image, bytes) else None
+        )
+        """The data of the referenced image, once available."""
 
-        self.image: bytes = image
+    @property
+    def image(self) -> bytes:
         """The data of the referenced image."""
+        if self._image is None:
+            assert self._blob is not None, "Broken invariant."
+            self._image = self._blob.read()
+        return self._image
+
+    @image.setter
+    def image(self, image: bytes) -> None:
+        self._image = image
+        self._blob = None
+
+    def post_load_hook(self, context: Context, store: ArtifactStore) -> None:
+        """
+        Bind the image data to the store it was loaded from.
+        :param context: The context from which the image was loaded
+        :param store: The store from which the image was loaded
+        """
+        if self._blob is not None:
+            self._blob.bind(store)
 
     def to_model(self) -> ArtifactModel:
         """
@@ -78,6 +109,11 @@ class Image(Value):
         body = typing.cast(ValueModel, model.body)
 
         assert body.value.value_type == ValueType.IMAGE, "Broken Precondition."
+        if body.value.blob is not None:
+            return Image(
+                metadata=body.metadata, image=LazyBlob(body.value.blob)
+            )
+        assert body.value.data is not None, "Broken Precondition."
         return Image(
             metadata=body.metadata,
             image=base64.decodebytes(body.value.data.encode("utf-8")),
@@ -9,7 +9,12 @@ import pytest
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.backend.api import codes
-from mlte.backend.api.model import WriteArtifactRequest
+from mlte.backend.api.model import (
+    BatchArtifactsResponse,
+    ReadArtifactsRequest,
+    WriteArtifactRequest,
+    WriteArtifactsRequest,
+)
 from mlte.backend.core.config import settings
 from mlte.context.model import ModelCreate, VersionCreate
 from mlte.store.artifact.query import Query
@@ -17,6 +22,7 @@ from mlte.store.artifact.query import Query
 from ...fixture.artifact import ArtifactFactory
 from ..fixture.http import (  # noqa
     FastAPITestHttpClient,
+    clients,
     clients_and_types,
     mem_store_and_test_http_client,
 )
@@ -85,6 +91,83 @@ def test_read(
     assert read == created
 
 
+@pytest.mark.parametrize("client_fixture,artifact_type", clients_and_types())
+def test_read_conditional(
+    client_fixture: str,
+    artifact_type: ArtifactType,
+    request: pytest.FixtureRequest,
+) -> None:  # noqa
+    """Artifact reads carry an ETag, and honour If-None-Match."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+
+    model_id, version_id = "0", "0"
+    create_context(model_id, version_id, client)
+    url = (
+        f"{settings.API_PREFIX}/model/{model_id}/version/{version_id}/artifact"
+    )
+
+    a = ArtifactFactory.make(artifact_type, id="id0", complete=True)
+    res = client.post(url, json=WriteArtifactRequest(artifact=a).model_dump())
+    assert res.status_code == codes.OK
+
+    for read_url in [f"{url}/id0", url]:
+        res = client.get(read_url)
+        assert res.status_code == codes.OK
+        etag = res.headers["ETag"]
+        # Weak, as the body may be sent compressed.
+        assert etag.startswith('W/"')
+
+        res = client.get(read_url, headers={"If-None-Match": etag})
+        assert res.status_code == codes.NOT_MODIFIED
+        assert res.headers["ETag"] == etag
+        assert res.content == b""
+
+        # Tags are compared weakly.
+        res = client.get(read_url, headers={"If-None-Match": etag[2:]})
+        assert res.status_code == codes.NOT_MODIFIED
+
+        res = client.get(read_url, headers={"If-None-Match": '"stale"'})
+        assert res.status_code == codes.OK
+
+    # The ETag changes with the content.
+    res = client.post(
+        url, json=WriteArtifactRequest(artifact=a, force=True).model_dump()
+    )
+    assert res.status_code == codes.OK
+    res = client.get(f"{url}/id0", headers={"If-None-Match": etag})
+    assert res.status_code == codes.OK
+
+
+@pytest.mark.parametrize("client_fixture", clients())
+def test_read_compressed(
+    client_fixture: str, request: pytest.FixtureRequest
+) -> None:  # noqa
+    """Large responses are compressed for clients that accept it."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+
+    model_id, version_id = "0", "0"
+    create_context(model_id, version_id, client)
+    url = (
+        f"{settings.API_PREFIX}/model/{model_id}/version/{version_id}/artifact"
+    )
+    for i in range(10):
+        a = ArtifactFactory.make(
+            ArtifactType.NEGOTIATION_CARD, id=f"id{i}", complete=True
+        )
+        res = client.post(
+            url, json=WriteArtifactRequest(artifact=a).model_dump()
+        )
+        assert res.status_code == codes.OK
+
+    res = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert res.status_code == codes.OK
+    assert res.headers["Content-Encoding"] in ["gzip", "br"]
+    assert len(res.json()) == 10
+
+    res = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in res.headers
+
+
 @pytest.mark.parametrize("client_fixture,artifact_type", clients_and_types())
 def test_search(
     client_fixture: str,
@@ -156,6 +239,46 @@ def test_delete(
     assert res.status_code == 404
 
 
+@pytest.mark.parametrize("client_fixture,artifact_type", clients_and_types())
+def test_batch(
+    client_fixture: str,
+    artifact_type: ArtifactType,
+    request: pytest.FixtureRequest,
+) -> None:  # noqa
+    """Artifacts can be written and read in batches."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+
+    model_id, version_id = "0", "0"
+    create_context(model_id, version_id, client)
+    url = f"{settings.API_PREFIX}/model/{model_id}/version/{version_id}/artifact/batch"
+
+    artifacts = [
+        ArtifactFactory.make(artifact_type, id=f"id{i}") for i in [0, 1, 0]
+    ]
+    res = client.post(
+        url, json=WriteArtifactsRequest(artifacts=artifacts).model_dump()
+    )
+    assert res.status_code == codes.OK
+    results = BatchArtifactsResponse(**res.json()).results
+    assert [r.status_code for r in results] == [
+        codes.OK,
+        codes.OK,
+        codes.ALREADY_EXISTS,
+    ]
+    assert results[0].artifact is not None
+    assert results[0].artifact.header.creator is not None
+
+    res = client.post(
+        f"{url}/read",
+        json=ReadArtifactsRequest(artifact_ids=["id1", "id2"]).model_dump(),
+    )
+    assert res.status_code == codes.OK
+    results = BatchArtifactsResponse(**res.json()).results
+    assert [r.status_code for r in results] == [codes.OK, codes.NOT_FOUND]
+    assert results[0].artifact is not None
+    assert results[0].artifact.header.identifier == "id1"
+
+
 def create_context(
     model_id: str, version_id: str, client: FastAPITestHttpClient
 ) -> None:
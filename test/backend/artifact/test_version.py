@@ -6,10 +6,14 @@ Test the HTTP interface for version operations.
 
 import pytest
 
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
 from mlte.backend.api import codes
+from mlte.backend.api.model import WriteArtifactRequest
 from mlte.backend.core.config import settings
 from mlte.context.model import ModelCreate, Version, VersionCreate
 
+from ...fixture.artifact import ArtifactFactory
 from ..fixture.http import (  # noqa
     FastAPITestHttpClient,
     clients,
@@ -125,6 +129,49 @@ def test_delete(
     assert len(res.json()) == 0
 
 
+@pytest.mark.parametrize("client_fixture", clients())
+def test_export(
+    client_fixture: str, request: pytest.FixtureRequest
+) -> None:  # noqa
+    """Versions can be exported as NDJSON, one artifact per line."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+    model_id = "0"
+    version_id = "0"
+    url = f"{settings.API_PREFIX}/model/{model_id}/version/{version_id}"
+
+    res = client.get(f"{url}/export")
+    assert res.status_code == codes.NOT_FOUND
+
+    create_model(model_id, client)
+    res = client.post(
+        f"{settings.API_PREFIX}/model/{model_id}/version",
+        json=VersionCreate(identifier=version_id).model_dump(),
+    )
+    assert res.status_code == codes.OK
+
+    written = [
+        ArtifactFactory.make(ArtifactType.VALUE, f"value{i}") for i in range(5)
+    ]
+    for artifact in written:
+        res = client.post(
+            f"{url}/artifact",
+            json=WriteArtifactRequest(artifact=artifact).model_dump(),
+        )
+        assert res.status_code == codes.OK
+
+    res = client.get(f"{url}/export?batch_size=0")
+    assert res.status_code == codes.UNPROCESSABLE_ENTITY
+
+    res = client.get(f"{url}/export?batch_size=2")
+    assert res.status_code == codes.OK
+    assert res.headers["Content-Type"] == "application/x-ndjson"
+    lines = res.text.splitlines()
+    assert [
+        ArtifactModel.model_validate_json(line).header.identifier
+        for line in lines
+    ] == [artifact.header.identifier for artifact in written]
+
+
 def create_model(model_id: str, client: FastAPITestHttpClient) -> None:
     """Create a model with the given identifier."""
     res = client.post(
@@ -4,12 +4,15 @@ test/backend/auth/test_authentication.py
 Test the authentication operations
 """
 
+import asyncio
+import threading
 
 import pytest
 
 from mlte.backend.api import dependencies
 from mlte.backend.api.auth import authentication
 from mlte.store.user.store import UserStoreSession
+from mlte.user import passwords
 from mlte.user.model import UserCreate
 from test.store.user.fixture import (  # noqa
     fs_store,
@@ -98,3 +101,40 @@ def test_authenticate_wrong_password(
         )
 
         assert not success
+
+
+@pytest.mark.parametrize("store_fixture_name", user_stores())
+def test_authenticate_async(
+    store_fixture_name: str,
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Checks that passwords are verified in the password pool."""
+    username = "myuser"
+    password = "mypassword"
+
+    # Set user store in state before each test.
+    api_setup.set_user_store_in_state(store_fixture_name, request)
+
+    verifying_threads = []
+    verify_password = passwords.verify_password
+
+    def recording_verify(*args) -> bool:
+        verifying_threads.append(threading.current_thread().name)
+        return verify_password(*args)
+
+    monkeypatch.setattr(passwords, "verify_password", recording_verify)
+    with dependencies.user_store_session() as user_store_sesion:
+        set_test_user(username, password, user_store_sesion)
+
+        async def authenticate(password: str) -> bool:
+            return await authentication.authenticate_user_async(
+                username, password, user_store_sesion
+            )
+
+        assert asyncio.run(authenticate(password))
+        assert not asyncio.run(authenticate("wrong_password"))
+        assert len(verifying_threads) == 2
+        assert all(
+            name.startswith("mlte-password") for name in verifying_threads
+        )
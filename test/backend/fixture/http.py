@@ -6,16 +6,21 @@ Fixtures for artifact store HTTP unit tests.
 
 from __future__ import annotations
 
-from typing import Any, Generator, Optional, Tuple
+from typing import Any, Generator, Iterator, Optional, Tuple
 
 import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+import mlte.backend.api.codes as codes
 import test.backend.fixture.api as api_helpers
 from mlte.artifact.type import ArtifactType
 from mlte.backend.core.config import settings
-from mlte.store.common.http_clients import HttpClientType, OAuthHttpClient
+from mlte.store.common.http_clients import (
+    AsyncHttpxClient,
+    HttpClientType,
+    OAuthHttpClient,
+)
 
 """
 This list contains the global collection of test clients.
@@ -25,6 +30,9 @@ a fixture function, we specify via strings and then use the
 """
 _CLIENTS = ["mem_store_and_test_http_client"]
 
+TEST_BASE_URL = "http://testserver"
+"""The base URL of the app in test clients."""
+
 # -----------------------------------------------------------------------------
 # Test HTTP client based on FastAPI's TestClient.
 # -----------------------------------------------------------------------------
@@ -44,25 +52,55 @@ class FastAPITestHttpClient(OAuthHttpClient):
         self.client = client
         """The underlying client."""
 
-    def get(self, url: str, **kwargs) -> httpx.Response:
-        return self.client.get(url, headers=self.headers, **kwargs)
+    def get(
+        self, url: str, headers: Optional[dict[str, str]] = None, **kwargs
+    ) -> httpx.Response:
+        return self._send(
+            lambda headers: self.client.get(url, headers=headers, **kwargs),
+            headers,
+        )
 
     def post(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> httpx.Response:
-        return self.client.post(
-            url, headers=self.headers, data=data, json=json, **kwargs
+        return self._send(
+            lambda headers: self.client.post(
+                url, headers=headers, data=data, json=json, **kwargs
+            )
         )
 
     def put(
         self, url: str, data: Any = None, json: Any = None, **kwargs
     ) -> httpx.Response:
-        return self.client.put(
-            url, headers=self.headers, data=data, json=json, **kwargs
+        return self._send(
+            lambda headers: self.client.put(
+                url, headers=headers, data=data, json=json, **kwargs
+            )
         )
 
     def delete(self, url: str, **kwargs) -> httpx.Response:
-        return self.client.delete(url, headers=self.headers, **kwargs)
+        return self._send(
+            lambda headers: self.client.delete(url, headers=headers, **kwargs)
+        )
+
+    def stream_lines(self, url: str, **kwargs) -> Iterator[str]:
+        response = self._send(
+            lambda headers: self.client.send(
+                self.client.build_request(
+                    "GET", url, headers=headers, **kwargs
+                ),
+                stream=True,
+            )
+        )
+        try:
+            if response.status_code != codes.OK:
+                response.read()
+                self.raise_for_response(response)
+            for line in response.iter_lines():
+                if line:
+                    yield line
+        finally:
+            response.close()
 
 
 # -----------------------------------------------------------------------------
@@ -92,6 +130,19 @@ def setup_API_and_test_client() -> FastAPITestHttpClient:
     return client
 
 
+def setup_API_and_async_client() -> AsyncHttpxClient:
+    """
+    Configure API for memory stores and return an async HTTP client for it.
+    :return: The client, not yet authenticated
+    """
+    app = api_helpers.setup_api_with_mem_stores()
+    return AsyncHttpxClient(
+        api_helpers.TEST_API_USER,
+        api_helpers.TEST_API_PASS,
+        client=httpx.AsyncClient(app=app, base_url=TEST_BASE_URL),
+    )
+
+
 def clients() -> Generator[str, None, None]:
     """
     Yield test clients.
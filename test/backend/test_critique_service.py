@@ -0,0 +1,305 @@
+"""
+test/backend/test_critique_service.py
+
+Unit tests for incremental critiques of requirements.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import mlte.backend.api.endpoints.critique as critique_endpoints
+from mlte.backend.db.models import (
+    Artifact,
+    Category,
+    Requirement,
+    RequirementCategory,
+)
+from mlte.backend.db.session import Base, get_db
+from mlte.backend.dto.critique import CritiqueStats
+from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.llm.base import BaseLLMProvider
+from mlte.backend.services.llm.llm_service import LLMService
+from mlte.backend.services.requirement_service import RequirementService
+
+QUALITIES = CritiqueService.individual_qualities
+
+
+class RatingProvider(BaseLLMProvider):
+    """Rates every requirement medium, with one critique, counting requests."""
+
+    def __init__(self) -> None:
+        self.requests: List[str] = []
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        self.requests.append(user_prompt)
+        if "critiques" in system_prompt:
+            return json.dumps({"critiques": ["Too vague."]})
+        return json.dumps({"eval_result": "medium", "explanation": "Vague."})
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine: Engine) -> Iterator[Session]:
+    session = sessionmaker(bind=engine)()
+
+    artifact = Artifact(name="card", project_description="A classifier.")
+    session.add(artifact)
+    session.commit()
+    requirement = Requirement(
+        artifact_id=artifact.artifact_id,
+        card_index=0,
+        content="The model should be accurate.",
+    )
+    category = Category(name="Accuracy")
+    session.add_all([requirement, category])
+    session.commit()
+    session.add(
+        RequirementCategory(
+            requirement_id=requirement.requirement_id,
+            category_id=category.category_id,
+        )
+    )
+    session.commit()
+
+    yield session
+    session.close()
+
+
+def critique(
+    db: Session, provider: RatingProvider, use_cache: bool = True
+) -> CritiqueStats:
+    """Critique the requirement, returning the stats."""
+    service = CritiqueService(
+        db, LLMService(provider), RequirementService(db), use_cache=use_cache
+    )
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+    requirement_id = db.query(Requirement.requirement_id).scalar()
+    return asyncio.run(
+        service.critique_requirement(artifact_id, requirement_id)
+    )
+
+
+def test_unchanged_not_critiqued(db: Session) -> None:
+    """An unchanged requirement is answered with its stored critique."""
+    provider = RatingProvider()
+    stats = critique(db, provider)
+    assert sorted(stats.warnings) == sorted(QUALITIES)
+    # A rating and a critique for each quality
+    assert len(provider.requests) == 2 * len(QUALITIES)
+
+    provider.requests.clear()
+    assert critique(db, provider) == stats
+    assert provider.requests == []
+
+    # Bypassing the cache critiques everything again.
+    assert sorted(critique(db, provider, use_cache=False).warnings) == sorted(
+        QUALITIES
+    )
+    assert len(provider.requests) == 2 * len(QUALITIES)
+
+
+def test_missing_requirement(db: Session) -> None:
+    """Critiquing a missing artifact or requirement is an error."""
+    provider = RatingProvider()
+    service = CritiqueService(db, LLMService(provider), RequirementService(db))
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+    requirement_id = db.query(Requirement.requirement_id).scalar()
+    with pytest.raises(ValueError):
+        asyncio.run(
+            service.critique_requirement(artifact_id + 1, requirement_id)
+        )
+    with pytest.raises(ValueError):
+        asyncio.run(
+            service.critique_requirement(artifact_id, requirement_id + 1)
+        )
+    assert provider.requests == []
+
+
+@pytest.mark.parametrize("change", ["content", "context", "category", "prompt"])
+def test_changed_critiqued(
+    db: Session, change: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A change to any input of the critique has it critiqued again."""
+    provider = RatingProvider()
+    critique(db, provider)
+
+    if change == "content":
+        db.query(Requirement).update({"content": "The model should be fast."})
+    elif change == "context":
+        db.query(Artifact).update({"ml_task": "Classification"})
+    elif change == "category":
+        category = Category(name="Robustness")
+        db.add(category)
+        db.commit()
+        db.add(
+            RequirementCategory(
+                requirement_id=db.query(Requirement).one().requirement_id,
+                category_id=category.category_id,
+            )
+        )
+    else:
+        monkeypatch.setattr(CritiqueService, "prompt_version", 2)
+    db.commit()
+    db.expire_all()
+
+    provider.requests.clear()
+    stats = critique(db, provider)
+    assert len(provider.requests) == 2 * len(QUALITIES)
+    # Feedback is replaced, not added to.
+    assert sorted(stats.warnings) == sorted(QUALITIES)
+
+
+def add_requirements(db: Session, count: int) -> None:
+    """Add requirements to the artifact."""
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+    db.add_all(
+        Requirement(
+            artifact_id=artifact_id,
+            card_index=i + 1,
+            content=f"The model should do {i}.",
+        )
+        for i in range(count)
+    )
+    db.commit()
+
+
+def critique_all(
+    db: Session, provider: BaseLLMProvider, max_concurrency: int = 4
+) -> List[Dict[str, Any]]:
+    """Critique all requirements of the artifact, returning the events."""
+    service = CritiqueService(
+        db, LLMService(provider, max_concurrency), RequirementService(db)
+    )
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+
+    async def run() -> List[Dict[str, Any]]:
+        return [e async for e in service.critique_requirements(artifact_id)]
+
+    return asyncio.run(run())
+
+
+class SlowProvider(RatingProvider):
+    """Rates requirements after a while, failing for one of them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_tasks = 0
+
+    async def achat(
+        self, system_prompt: str, user_prompt: str, **kwargs
+    ) -> str:
+        self.max_tasks = max(self.max_tasks, len(asyncio.all_tasks()))
+        if "do 0." in user_prompt:
+            raise RuntimeError("Unavailable.")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.chat(system_prompt, user_prompt)
+
+
+def test_bulk(db: Session) -> None:
+    """All requirements are critiqued together, reporting each result."""
+    critique(db, RatingProvider())
+    add_requirements(db, 2)
+
+    provider = SlowProvider()
+    events = critique_all(db, provider, max_concurrency=4)
+    assert provider.max_in_flight == 4
+    # Critiques are taken by a pool of workers, not all started at once.
+    assert provider.max_tasks <= 1 + 4
+
+    assert events[0] == {
+        "event": "start",
+        "artifact_id": db.query(Artifact.artifact_id).scalar(),
+        "requirements": 3,
+        "tasks": 2 * len(QUALITIES),
+    }
+    assert events[-1] == {
+        "event": "done",
+        "completed": len(QUALITIES),
+        "failed": len(QUALITIES),
+    }
+
+    qualities = [e for e in events if e["event"] == "quality"]
+    assert len(qualities) == 2 * len(QUALITIES)
+    assert sum("error" in e for e in qualities) == len(QUALITIES)
+    assert all(
+        e["level"] == "warning" and e["critiques"] == ["Too vague."]
+        for e in qualities
+        if "error" not in e
+    )
+
+    # Each requirement is reported once, after all of its qualities.
+    requirements = [e for e in events if e["event"] == "requirement"]
+    assert [e["cached"] for e in requirements] == [True, False, False]
+    for requirement in requirements[1:]:
+        position = events.index(requirement)
+        assert all(
+            events.index(e) < position
+            for e in qualities
+            if e["requirement_id"] == requirement["requirement_id"]
+        )
+    stats = {e["requirement_id"]: e["stats"] for e in requirements}
+    assert sorted(len(s["warnings"]) for s in stats.values()) == [
+        0,
+        len(QUALITIES),
+        len(QUALITIES),
+    ]
+
+    # Only the failed critiques are tried again.
+    provider = SlowProvider()
+    events = critique_all(db, provider)
+    assert events[0]["tasks"] == len(QUALITIES)
+
+
+def test_bulk_endpoint(
+    engine: Engine, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Bulk critiques are streamed as Server-Sent Events."""
+    monkeypatch.setattr(
+        critique_endpoints, "SessionLocal", sessionmaker(bind=engine)
+    )
+    monkeypatch.setattr(
+        critique_endpoints, "llm_service", LLMService(RatingProvider())
+    )
+    app = FastAPI()
+    app.include_router(critique_endpoints.router, prefix="/critiques")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+    response = client.post("/critiques/bulk", json={"artifact_id": artifact_id})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    messages = response.text.strip().split("\n\n")
+    names = [m.split("\n")[0] for m in messages]
+    assert names[0] == "event: start" and names[-1] == "event: done"
+    assert names.count("event: quality") == len(QUALITIES)
+    data = json.loads(messages[-1].split("\n")[1][len("data: ") :])
+    assert data == {"event": "done", "completed": len(QUALITIES), "failed": 0}
+
+    response = client.post("/critiques/bulk", json={"artifact_id": 0})
+    assert response.status_code == 404
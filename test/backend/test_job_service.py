@@ -0,0 +1,286 @@
+"""
+test/backend/test_job_service.py
+
+Unit tests for critiques of requirement sets run as background jobs.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import mlte.backend.api.endpoints.critique as critique_endpoints
+from mlte.backend.db.models import Artifact, CritiqueJob, Requirement
+from mlte.backend.db.session import Base, get_db
+from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.job_service import CritiqueJobQueue
+from mlte.backend.services.llm.base import BaseLLMProvider
+from mlte.backend.services.llm.llm_service import LLMService
+
+TIMEOUT = 5.0
+"""The time to wait for a job, in seconds."""
+
+
+class GatedProvider(BaseLLMProvider):
+    """Finds an issue with every set, once the gate is opened."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.requests = 0
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        self.requests += 1
+        self.gate.wait(TIMEOUT)
+        return json.dumps(
+            {
+                "summary": "Overlapping.",
+                "critiques": [
+                    {
+                        "requirement_ids": [1, 2],
+                        "issue": "Overlap",
+                        "explanation": "Both say the same.",
+                    }
+                ],
+            }
+        )
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    # Workers use sessions of their own, from other threads.
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine: Engine) -> Iterator[Session]:
+    session = sessionmaker(bind=engine)()
+    artifact = Artifact(name="card", project_description="A classifier.")
+    session.add(artifact)
+    session.commit()
+    session.add_all(
+        Requirement(
+            artifact_id=artifact.artifact_id,
+            card_index=i,
+            content=f"The model should do {i}.",
+        )
+        for i in range(2)
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def provider() -> Iterator[GatedProvider]:
+    provider = GatedProvider()
+    yield provider
+    # Release blocked requests, so that their threads finish
+    provider.gate.set()
+
+
+@pytest.fixture
+def client(
+    engine: Engine,
+    db: Session,
+    provider: GatedProvider,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[TestClient]:
+    queue = CritiqueJobQueue(
+        sessionmaker(bind=engine), LLMService(provider), workers=1, timeout=60
+    )
+    monkeypatch.setattr(critique_endpoints, "job_queue", queue)
+    app = FastAPI()
+    app.include_router(critique_endpoints.router, prefix="/critiques")
+    app.dependency_overrides[get_db] = lambda: db
+    # The context keeps the event loop, and so the workers, running
+    with TestClient(app) as client:
+        yield client
+
+
+def submit(client: TestClient, db: Session) -> Dict[str, Any]:
+    """Submit a critique of all requirements, returning the job."""
+    artifact_id = db.query(Artifact.artifact_id).scalar()
+    response = client.post(
+        "/critiques/jobs",
+        json={"artifact_id": artifact_id, "filter_criteria": "All"},
+    )
+    assert response.status_code == 202
+    job: Dict[str, Any] = response.json()
+    return job
+
+
+def wait_for(client: TestClient, job_id: int, *statuses: str) -> Dict[str, Any]:
+    """Poll a job until it has one of the statuses, returning it."""
+    deadline = time.monotonic() + TIMEOUT
+    while True:
+        response = client.get(f"/critiques/jobs/{job_id}")
+        assert response.status_code == 200
+        job: Dict[str, Any] = response.json()
+        if job["status"] in statuses:
+            return job
+        assert time.monotonic() < deadline, job
+        time.sleep(0.02)
+
+
+def test_job(client: TestClient, db: Session, provider: GatedProvider) -> None:
+    """A job runs in the background, and reports its stats when done."""
+    job = submit(client, db)
+    assert job["status"] == "queued" and not job["deduplicated"]
+    wait_for(client, job["job_id"], "running")
+
+    # The same set is not critiqued twice at once.
+    again = submit(client, db)
+    assert again["job_id"] == job["job_id"] and again["deduplicated"]
+
+    provider.gate.set()
+    job = wait_for(client, job["job_id"], "succeeded")
+    assert sorted(job["stats"]["issues"]) == sorted(
+        CritiqueService.set_qualities
+    )
+    assert job["started_at"] is not None and job["finished_at"] is not None
+    assert provider.requests == len(CritiqueService.set_qualities)
+
+    # A finished job does not hold back a new one.
+    assert submit(client, db)["job_id"] != job["job_id"]
+
+
+def add_requirement(db: Session, card_index: int) -> None:
+    """Add a requirement to the artifact."""
+    db.add(
+        Requirement(
+            artifact_id=db.query(Artifact.artifact_id).scalar(),
+            card_index=card_index,
+            content="The model should be fast.",
+        )
+    )
+    db.commit()
+
+
+def test_changed_set(
+    client: TestClient, db: Session, provider: GatedProvider
+) -> None:
+    """A changed set is critiqued again, superseding queued critiques."""
+    running = submit(client, db)
+    wait_for(client, running["job_id"], "running")
+    add_requirement(db, 2)
+    superseded = submit(client, db)
+    add_requirement(db, 3)
+    queued = submit(client, db)
+    assert not superseded["deduplicated"] and not queued["deduplicated"]
+
+    job = client.get(f"/critiques/jobs/{superseded['job_id']}").json()
+    assert job["status"] == "cancelled"
+    assert job["error"] == "Superseded by a newer job."
+
+    provider.gate.set()
+    wait_for(client, running["job_id"], "succeeded")
+    wait_for(client, queued["job_id"], "succeeded")
+
+
+def test_cancel(client: TestClient, db: Session) -> None:
+    """Running jobs can be cancelled, and stay cancelled."""
+    job = submit(client, db)
+    wait_for(client, job["job_id"], "running")
+
+    response = client.delete(f"/critiques/jobs/{job['job_id']}")
+    assert response.status_code == 200
+    assert response.json()["status"] == "cancelled"
+    assert wait_for(client, job["job_id"], "cancelled")["stats"] is None
+
+    # The next job is run by the same worker.
+    assert submit(client, db)["job_id"] != job["job_id"]
+
+
+def test_not_found(client: TestClient) -> None:
+    """Missing jobs and artifacts are reported as such."""
+    assert client.get("/critiques/jobs/0").status_code == 404
+    assert client.delete("/critiques/jobs/0").status_code == 404
+    response = client.post(
+        "/critiques/jobs", json={"artifact_id": 0, "filter_criteria": "All"}
+    )
+    assert response.status_code == 404
+
+
+def add_job(db: Session, status: str, **kwargs: Any) -> int:
+    """Add a job for all requirements, as left by another process."""
+    job = CritiqueJob(
+        artifact_id=db.query(Artifact.artifact_id).scalar(),
+        filter_criteria="All",
+        requirements_version="",
+        use_cache=True,
+        status=status,
+        **kwargs,
+    )
+    db.add(job)
+    db.commit()
+    return job.job_id
+
+
+def test_lost_jobs_fail(client: TestClient, db: Session) -> None:
+    """Jobs running past the timeout, e.g. in a stopped process, fail."""
+    started_at = datetime.now(timezone.utc) - timedelta(seconds=120)
+    for request in (client.get, client.delete):
+        job_id = add_job(db, "running", started_at=started_at)
+        response = request(f"/critiques/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        assert job["status"] == "failed"
+        assert job["error"] == "The job timed out."
+
+
+def test_workers_start_with_app(
+    db: Session, provider: GatedProvider, request: pytest.FixtureRequest
+) -> None:
+    """The workers start with the app, without waiting for a request."""
+    provider.gate.set()
+    job_id = add_job(db, "queued")
+    request.getfixturevalue("client")
+
+    deadline = time.monotonic() + TIMEOUT
+    while True:
+        db.expire_all()
+        status = db.query(CritiqueJob.status).filter_by(job_id=job_id).scalar()
+        if status == "succeeded":
+            break
+        assert time.monotonic() < deadline, status
+        time.sleep(0.02)
+
+
+def test_queued_jobs_resumed(
+    engine: Engine, db: Session, provider: GatedProvider
+) -> None:
+    """Jobs left queued, e.g. by a restart, run once the workers start."""
+    provider.gate.set()
+    job_id = add_job(db, "queued")
+
+    queue = CritiqueJobQueue(sessionmaker(bind=engine), LLMService(provider))
+
+    async def run() -> str:
+        queue.start()
+        deadline = time.monotonic() + TIMEOUT
+        while True:
+            db.expire_all()
+            status: str = (
+                db.query(CritiqueJob.status).filter_by(job_id=job_id).scalar()
+            )
+            if status not in ("queued", "running"):
+                return status
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.02)
+
+    assert asyncio.run(run()) == "succeeded"
@@ -0,0 +1,132 @@
+"""
+test/backend/test_llm_cache.py
+
+Unit tests for the persistent cache of LLM responses.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+from mlte.backend.db.llm_cache import LLMResponseCache, make_key
+from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.llm.base import BaseLLMProvider
+from mlte.backend.services.llm.llm_service import LLMService
+
+
+class ScriptedProvider(BaseLLMProvider):
+    """A provider that gives scripted responses, and records its requests."""
+
+    model = "scripted"
+
+    def __init__(self, responses: List[str]) -> None:
+        self.responses = responses
+        self.requests: List[str] = []
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        self.requests.append(user_prompt)
+        return self.responses[min(len(self.requests), len(self.responses)) - 1]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LLMResponseCache:
+    return LLMResponseCache(
+        f"sqlite:///{tmp_path / 'cache.db'}", ttl=60, max_entries=100
+    )
+
+
+def test_key() -> None:
+    """Keys differ in every part of the request."""
+    key = make_key("p", "m", "system", "user", {"temperature": 0})
+    assert key == make_key("p", "m", "system", "user", {"temperature": 0})
+    assert key != make_key("q", "m", "system", "user", {"temperature": 0})
+    assert key != make_key("p", "n", "system", "user", {"temperature": 0})
+    assert key != make_key("p", "m", "other", "user", {"temperature": 0})
+    assert key != make_key("p", "m", "system", "other", {"temperature": 0})
+    assert key != make_key("p", "m", "system", "user", {"temperature": 1})
+
+
+def test_persistent(tmp_path: Path) -> None:
+    """Responses outlive the cache object, and are counted as hits."""
+    url = f"sqlite:///{tmp_path / 'cache.db'}"
+    LLMResponseCache(url, ttl=60, max_entries=10).put("k", "p", "m", "r")
+
+    cache = LLMResponseCache(url, ttl=60, max_entries=10)
+    assert cache.get("k") == "r"
+    assert cache.get("missing") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    cache.invalidate("k")
+    assert cache.get("k") is None
+
+
+def test_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Entries expire after their time to live."""
+    now = 1000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache = LLMResponseCache(
+        f"sqlite:///{tmp_path / 'cache.db'}", ttl=60, max_entries=10
+    )
+    cache.put("k", "p", "m", "r")
+    now += 59
+    assert cache.get("k") == "r"
+    now += 1
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_size(tmp_path: Path) -> None:
+    """The least recently used entries are evicted when the cache is full."""
+    cache = LLMResponseCache(
+        f"sqlite:///{tmp_path / 'cache.db'}", ttl=60, max_entries=2
+    )
+    cache.put("a", "p", "m", "1")
+    cache.put("b", "p", "m", "2")
+    assert cache.get("a") == "1"
+
+    cache.put("c", "p", "m", "3")
+    assert cache.stats()["entries"] == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+
+
+def test_service(cache: LLMResponseCache) -> None:
+    """Repeated messages are answered from the cache, unless bypassed."""
+    provider = ScriptedProvider(["first", "second"])
+    service = LLMService(provider, cache=cache)
+
+    assert service.send_message("system", "user") == "first"
+    assert service.send_message("system", "user") == "first"
+    assert asyncio.run(service.asend_message("system", "user")) == "first"
+    assert len(provider.requests) == 1
+
+    # Other parameters are other requests.
+    service.send_message("system", "user", temperature=0)
+    assert len(provider.requests) == 2
+
+    # Bypassing the cache asks again, and refreshes the cached response.
+    assert service.send_message("system", "user", use_cache=False) == "second"
+    assert service.send_message("system", "user") == "second"
+    assert len(provider.requests) == 3
+
+    # Forgotten responses are asked for again.
+    asyncio.run(service.aforget("system", "user"))
+    provider.responses.append("third")
+    assert asyncio.run(service.asend_message("system", "user")) == "third"
+    assert len(provider.requests) == 4
+
+
+def test_unusable_response_not_kept(cache: LLMResponseCache) -> None:
+    """Responses that are not JSON are retried, and not served again."""
+    provider = ScriptedProvider(["not json", '{"critiques": ["c"]}'])
+    service = CritiqueService(None, LLMService(provider, cache=cache), None)  # type: ignore[arg-type]
+
+    async def query() -> Any:
+        return await service._safe_perform_query_return_json("user", "system")
+
+    assert asyncio.run(query()) == {"critiques": ["c"]}
+    assert asyncio.run(query()) == {"critiques": ["c"]}
+    assert len(provider.requests) == 2
@@ -0,0 +1,148 @@
+"""
+test/backend/test_llm_service.py
+
+Unit tests for concurrent requests to LLM providers.
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from mlte.backend.dto.critique import ProjectContext
+from mlte.backend.services.critique_service import CritiqueService
+from mlte.backend.services.llm.base import BaseLLMProvider
+from mlte.backend.services.llm.llm_service import LLMService
+from mlte.backend.services.llm.openai_provider import OpenAIProvider
+
+DELAY = 0.2
+"""The time each fake request takes, in seconds."""
+
+RATING = json.dumps({"eval_result": "high", "explanation": "Clear."})
+
+
+class BlockingProvider(BaseLLMProvider):
+    """A provider with only a blocking chat."""
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        time.sleep(DELAY)
+        return RATING
+
+
+class AsyncProvider(BaseLLMProvider):
+    """A provider with an asynchronous chat, which counts requests in flight."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def chat(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        raise AssertionError("The blocking chat should not be called.")
+
+    async def achat(
+        self, system_prompt: str, user_prompt: str, **kwargs
+    ) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(DELAY)
+        self.in_flight -= 1
+        return RATING
+
+
+def gather_messages(service: LLMService, count: int) -> List[str]:
+    """Send messages concurrently, returning the responses."""
+
+    async def run() -> List[str]:
+        return await asyncio.gather(
+            *(service.asend_message("system", f"user{i}") for i in range(count))
+        )
+
+    return asyncio.run(run())
+
+
+def test_blocking_provider_offloaded() -> None:
+    """Blocking providers run in threads, without blocking the event loop."""
+    service = LLMService(BlockingProvider())
+    start = time.perf_counter()
+    assert gather_messages(service, 4) == [RATING] * 4
+    assert time.perf_counter() - start < 4 * DELAY
+
+
+def test_concurrency_bound() -> None:
+    """No more requests than the bound are in flight at once."""
+    provider = AsyncProvider()
+    service = LLMService(provider, max_concurrency=2)
+    assert gather_messages(service, 6) == [RATING] * 6
+    assert provider.max_in_flight == 2
+
+    # The service can be used again from another event loop.
+    assert gather_messages(service, 2) == [RATING] * 2
+
+    with pytest.raises(ValueError):
+        LLMService(provider, max_concurrency=0)
+
+
+def test_critique_qualities_concurrent() -> None:
+    """The qualities of a requirement are critiqued at the same time."""
+    provider = AsyncProvider()
+    service = CritiqueService(None, LLMService(provider), None)  # type: ignore[arg-type]
+    context = ProjectContext(project_description="A classifier.")
+
+    async def run() -> List[Any]:
+        return await asyncio.gather(
+            *(
+                service._process_single_quality(
+                    quality,
+                    "The model shall be accurate.",
+                    "Functional",
+                    context,
+                )
+                for quality in CritiqueService.individual_qualities
+            )
+        )
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+
+    assert [r["rating"].rating for r in results] == ["high"] * len(results)
+    assert provider.max_in_flight == len(CritiqueService.individual_qualities)
+    assert elapsed < 3 * DELAY
+
+
+def test_openai_empty_content() -> None:
+    """Completions without content, e.g. refusals, are read as empty."""
+    completion = ChatCompletion(
+        id="0",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(role="assistant", content=None),
+            )
+        ],
+        created=0,
+        model="gpt-4-turbo",
+        object="chat.completion",
+    )
+
+    async def acreate(**kwargs) -> ChatCompletion:
+        return completion
+
+    provider = OpenAIProvider(api_key="sk-test")
+    provider._client = SimpleNamespace(  # type: ignore[assignment]
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(create=lambda **kwargs: completion)
+        )
+    )
+    provider._async_client = SimpleNamespace(  # type: ignore[assignment]
+        chat=SimpleNamespace(completions=SimpleNamespace(create=acreate))
+    )
+
+    assert provider.chat("system", "user") == ""
+    assert asyncio.run(provider.achat("system", "user")) == ""
@@ -0,0 +1,91 @@
+"""
+test/backend/test_main.py
+
+Test the setup of the backend application.
+"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+import mlte.backend.main as main
+from mlte.backend.core import config
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+from mlte.store.base import StoreURIPrefix
+from mlte.store.user.underlying.fs import FileSystemUserStore
+
+from .fixture import api as api_setup
+
+
+@pytest.fixture(autouse=True)
+def state_prep():
+    # Other suites may leave stores in the state, e.g. the HTTP store fixture.
+    api_setup.clear_state()
+    yield
+    # Reset state after every test.
+    api_setup.clear_state()
+
+
+def test_worker_app_initializes_stores(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A worker application opens the stores from the settings on startup."""
+    monkeypatch.setattr(
+        settings, "STORE_URI", f"{StoreURIPrefix.LOCAL_FILESYSTEM[0]}{tmp_path}"
+    )
+    app = main.create_app()
+    with pytest.raises(RuntimeError):
+        state.artifact_store
+
+    with TestClient(app) as client:
+        assert isinstance(state.artifact_store, LocalFileSystemStore)
+        assert isinstance(state.user_store, FileSystemUserStore)
+        assert state.token_key == settings.JWT_SECRET_KEY
+
+        res = client.post(
+            f"{settings.API_PREFIX}/token",
+            data={
+                "grant_type": "password",
+                "username": "admin",
+                "password": "admin1234",
+            },
+        )
+        assert res.status_code == 200
+
+
+def test_workers_require_shared_store() -> None:
+    """Several workers cannot share an in-memory store."""
+    with pytest.raises(RuntimeError):
+        main.run(
+            "localhost",
+            8080,
+            StoreURIPrefix.LOCAL_MEMORY[0],
+            [],
+            "secret",
+            workers=2,
+        )
+
+
+def test_workers_shorten_auth_cache_ttl(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Several workers cache users briefly, unless configured otherwise."""
+    monkeypatch.setattr(main.uvicorn, "run", lambda *args, **kwargs: None)
+    # Keep the configuration passed on to the workers out of this process.
+    environ = {k: v for k, v in os.environ.items() if k != "AUTH_CACHE_TTL"}
+    monkeypatch.setattr(os, "environ", environ)
+
+    main.run(
+        "localhost",
+        8080,
+        f"{StoreURIPrefix.LOCAL_FILESYSTEM[0]}{tmp_path}",
+        [],
+        "secret",
+        workers=2,
+    )
+    assert os.environ["AUTH_CACHE_TTL"] == str(
+        config.MULTI_WORKER_AUTH_CACHE_TTL
+    )
@@ -0,0 +1,91 @@
+"""
+test/backend/test_metrics.py
+
+Test the request and store operation metrics.
+"""
+
+import pytest
+
+from mlte.backend.api import codes, metrics
+from mlte.backend.core.config import settings
+from mlte.context.model import ModelCreate
+
+from .fixture.http import (  # noqa
+    FastAPITestHttpClient,
+    clients,
+    mem_store_and_test_http_client,
+)
+
+
+def test_histogram_render() -> None:
+    """Histograms are rendered with cumulative buckets."""
+    histogram = metrics.Histogram(
+        "latency_seconds", "Latency.", ("route",), buckets=(0.1, 1)
+    )
+    for value in [0.05, 0.5, 0.5, 5]:
+        histogram.observe(value, "/a")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 6.05',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_counter_render() -> None:
+    """Counters are rendered per label set, with escaped label values."""
+    counter = metrics.Counter("requests_total", "Requests.", ("route",))
+    counter.inc('/"quoted"')
+    counter.inc("/a", amount=2)
+
+    assert counter.render() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/\\"quoted\\""} 1',
+        'requests_total{route="/a"} 2',
+    ]
+
+
+@pytest.mark.parametrize("client_fixture", clients())
+def test_metrics(
+    client_fixture: str, request: pytest.FixtureRequest
+) -> None:  # noqa
+    """Requests and store operations are counted, timed and exposed."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+    route = f"{settings.API_PREFIX}/model/{{model_id}}"
+    requests = metrics.HTTP_REQUESTS.value("GET", route, "404")
+    reads = metrics.STORE_OPERATIONS.value("read_model", "ok")
+    failed_reads = metrics.STORE_OPERATIONS.value("read_model", "ErrorNotFound")
+
+    res = client.post(
+        f"{settings.API_PREFIX}/model",
+        json=ModelCreate(identifier="model").model_dump(),
+    )
+    assert res.status_code == codes.OK
+    assert client.get(f"{settings.API_PREFIX}/model/model").status_code == 200
+    assert client.get(f"{settings.API_PREFIX}/model/other").status_code == 404
+
+    # Requests are labelled with their route, not their path.
+    assert metrics.HTTP_REQUESTS.value("GET", route, "404") == requests + 1
+    assert metrics.HTTP_REQUEST_DURATION.count("GET", route) >= 2
+    assert metrics.STORE_OPERATIONS.value("read_model", "ok") == reads + 1
+    assert (
+        metrics.STORE_OPERATIONS.value("read_model", "ErrorNotFound")
+        == failed_reads + 1
+    )
+
+    res = client.get(f"{settings.API_PREFIX}/metrics")
+    assert res.status_code == codes.OK
+    assert res.headers["content-type"] == metrics.TEXT_MEDIA_TYPE
+    assert (
+        f'mlte_http_request_duration_seconds_count{{method="GET",route="{route}"}}'
+        in res.text
+    )
+    assert (
+        'mlte_store_operations_total{operation="read_model",outcome="ErrorNotFound"}'
+        in res.text
+    )
@@ -186,3 +186,42 @@ def test_delete(
     res = client.get(f"{settings.API_PREFIX}{USER_ENDPOINT}")
     assert res.status_code == codes.OK
     assert len(res.json()) == len(original_users.json())
+
+
+@pytest.mark.parametrize("client_fixture", clients())
+def test_edit_applies_to_authorization(
+    client_fixture: str, request: pytest.FixtureRequest
+) -> None:  # noqa
+    """Edits to a user are seen by later requests of that user."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+
+    res = client.get(f"{settings.API_PREFIX}{USER_ENDPOINT}/me")
+    assert res.status_code == codes.OK
+    current_user = BasicUser(**res.json())
+
+    # Disable the user making the requests.
+    current_user.disabled = True
+    res = client.put(
+        f"{settings.API_PREFIX}{USER_ENDPOINT}", json=current_user.model_dump()
+    )
+    assert res.status_code == codes.OK
+
+    res = client.get(f"{settings.API_PREFIX}{USER_ENDPOINT}/me")
+    assert res.status_code == codes.FORBIDDEN
+
+
+@pytest.mark.parametrize("client_fixture", clients())
+def test_delete_applies_to_authorization(
+    client_fixture: str, request: pytest.FixtureRequest
+) -> None:  # noqa
+    """Tokens of a deleted user are no longer accepted."""
+    client: FastAPITestHttpClient = request.getfixturevalue(client_fixture)
+
+    res = client.delete(
+        f"{settings.API_PREFIX}{USER_ENDPOINT}/{client.username}"
+    )
+    assert res.status_code == codes.OK
+
+    # The retry after the rejected request fails to log in.
+    with pytest.raises(Exception):
+        client.get(f"{settings.API_PREFIX}{USER_ENDPOINT}/me")
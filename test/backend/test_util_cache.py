@@ -0,0 +1,62 @@
+"""
+test/backend/test_util_cache.py
+
+Unit tests for the expiring cache.
+"""
+
+import time
+
+from mlte.backend.util.cache import TTLCache
+
+
+def test_capacity() -> None:
+    """The least recently used entry is evicted when the cache is full."""
+    cache: TTLCache[str, int] = TTLCache(capacity=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_expiry() -> None:
+    """Entries expire after their time to live."""
+    cache: TTLCache[str, int] = TTLCache(capacity=2, ttl=60)
+    cache.put("a", 1, ttl=0.01)
+    cache.put("b", 2, ttl=600)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    # An entry never outlives the default time to live, and a time to live
+    # that has already elapsed does not add an entry.
+    cache.put("c", 3, ttl=-1)
+    assert cache.get("c") is None
+
+
+def test_invalidate() -> None:
+    """Entries can be removed before they expire."""
+    cache: TTLCache[str, int] = TTLCache(capacity=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.invalidate("a")
+    cache.invalidate("missing")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_stale_put_dropped() -> None:
+    """A value read before an invalidation is not cached after it."""
+    cache: TTLCache[str, int] = TTLCache(capacity=2, ttl=60)
+    generation = cache.generation()
+    cache.invalidate("a")
+    cache.put("a", 1, generation=generation)
+    assert cache.get("a") is None
+
+    cache.put("a", 2, generation=cache.generation())
+    assert cache.get("a") == 2
@@ -0,0 +1,23 @@
+"""
+test/backend/test_util_logs.py
+
+Unit tests for logging utilities.
+"""
+
+import logging
+
+from mlte.backend.util.logs import SamplingFilter
+
+
+def _record(level: int) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, "message", (), None)
+
+
+def test_sampling_filter() -> None:
+    """Only a sample of debug messages is let through."""
+    assert not SamplingFilter(0).filter(_record(logging.DEBUG))
+    assert SamplingFilter(1).filter(_record(logging.DEBUG))
+
+    # Messages above the debug level are never dropped.
+    assert SamplingFilter(0).filter(_record(logging.INFO))
+    assert SamplingFilter(0).filter(_record(logging.ERROR))
@@ -31,3 +31,15 @@ def execute_cli() -> int:
 
 def test_cli():
     assert execute_cli() == 0
+
+
+def test_cli_imports_are_light():
+    """Importing the CLI does not load the backend or store dependencies."""
+    command = [
+        str(python()),
+        "-c",
+        "import sys, mlte.cli.cli; print(*sys.modules, sep='\\n')",
+    ]
+    p = subprocess.run(command, capture_output=True, text=True, check=True)
+    loaded = {name.split(".")[0] for name in p.stdout.splitlines()}
+    assert loaded.isdisjoint({"fastapi", "openai", "sqlalchemy", "uvicorn"})
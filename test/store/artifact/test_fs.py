@@ -0,0 +1,337 @@
+"""
+test/store/artifact/test_fs.py
+
+Unit tests for the local file system artifact store implementation.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import typing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import mlte.store.error as errors
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.factory import create_store
+from mlte.store.artifact.query import ArtifactTypeFilter, FilterType, Query
+from mlte.store.artifact.underlying import fs
+from mlte.store.artifact.underlying.fs import (
+    BASE_MODELS_FOLDER,
+    JOURNAL_FILENAME,
+    MANIFEST_FILENAME,
+    LocalFileSystemStore,
+    LocalFileSystemStoreSession,
+)
+from mlte.store.base import StoreURIPrefix
+from mlte.store.common.fs import get_codec
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import ArtifactFactory
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+def _create_store(tmp_path: Path) -> LocalFileSystemStore:
+    """Create a store with a model version holding a spec and two values."""
+    store = artifact_store_creators.create_fs_store(tmp_path)
+    with _session(store) as handle:
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        for type, id in [
+            (ArtifactType.SPEC, "spec0"),
+            (ArtifactType.VALUE, "value0"),
+            (ArtifactType.VALUE, "value1"),
+        ]:
+            handle.write_artifact(
+                MODEL_ID, VERSION_ID, ArtifactFactory.make(type, id)
+            )
+    return store
+
+
+@contextlib.contextmanager
+def _session(
+    store: LocalFileSystemStore,
+) -> Iterator[LocalFileSystemStoreSession]:
+    """Open a session on the store, typed as a file system session."""
+    session = store.session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _version_path(tmp_path: Path) -> Path:
+    return Path(tmp_path, BASE_MODELS_FOLDER, MODEL_ID, VERSION_ID)
+
+
+def test_manifest_tracks_artifacts(tmp_path) -> None:
+    """Writes and deletes keep the manifest in sync with the artifact files."""
+    store = _create_store(tmp_path)
+    with _session(store) as handle:
+        handle.delete_artifact(MODEL_ID, VERSION_ID, "value1")
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+
+    assert manifest.identifiers() == ["spec0", "value0"]
+    for id, entry in manifest.entries.items():
+        content = Path(_version_path(tmp_path), f"{id}.json").read_bytes()
+        assert entry.size == len(content)
+        assert entry.sha256 == hashlib.sha256(content).hexdigest()
+    assert manifest.entries["spec0"].header.type == ArtifactType.SPEC
+
+
+def test_reads_do_not_open_unneeded_files(tmp_path) -> None:
+    """Listing and type searches are served from the manifest."""
+    store = _create_store(tmp_path)
+
+    # Corrupt the spec file; only reads that need its body may fail.
+    Path(_version_path(tmp_path), "spec0.json").write_text("not json")
+
+    with _session(store) as handle:
+        values = handle.search_artifacts(
+            MODEL_ID,
+            VERSION_ID,
+            Query(
+                filter=ArtifactTypeFilter(
+                    type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+                )
+            ),
+        )
+        assert [a.header.identifier for a in values] == ["value0", "value1"]
+
+        page = handle.read_artifacts(MODEL_ID, VERSION_ID, cursor="spec0")
+        assert [a.header.identifier for a in page] == ["value0", "value1"]
+
+
+def test_manifest_created_for_existing_versions(tmp_path) -> None:
+    """Versions stored without a manifest get one on first access."""
+    store = _create_store(tmp_path)
+    manifest_path = Path(_version_path(tmp_path), MANIFEST_FILENAME)
+    manifest_path.unlink()
+
+    with _session(store) as handle:
+        artifacts = handle.read_artifacts(MODEL_ID, VERSION_ID)
+
+    assert len(artifacts) == 3
+    assert manifest_path.exists()
+
+
+def _write_values(store: LocalFileSystemStore, *ids: str) -> None:
+    with _session(store) as handle:
+        for id in ids:
+            handle.write_artifact(
+                MODEL_ID,
+                VERSION_ID,
+                ArtifactFactory.make(ArtifactType.VALUE, id),
+            )
+
+
+def _manifest_ids(store: LocalFileSystemStore) -> typing.List[str]:
+    with _session(store) as handle:
+        ids: typing.List[str] = handle._read_manifest(
+            MODEL_ID, VERSION_ID
+        ).identifiers()
+    return ids
+
+
+def test_writes_append_to_journal(tmp_path, monkeypatch) -> None:
+    """Writes are appended to a journal, merged into the manifest once large."""
+    monkeypatch.setattr(fs, "JOURNAL_COMPACTION_MIN", 8)
+    store = _create_store(tmp_path)
+    manifest_path = Path(_version_path(tmp_path), MANIFEST_FILENAME)
+    journal_path = Path(_version_path(tmp_path), JOURNAL_FILENAME)
+    snapshot = manifest_path.read_bytes()
+
+    # Another store, as in another process, has a manifest of its own.
+    other = artifact_store_creators.create_fs_store(tmp_path)
+    assert len(_manifest_ids(other)) == 3
+
+    _write_values(store, "value2", "value3", "value4", "value5")
+    assert manifest_path.read_bytes() == snapshot
+    # A header, and a record for each write
+    assert len(journal_path.read_bytes().splitlines()) == 1 + 7
+    assert len(_manifest_ids(other)) == 7
+
+    # The journal now holds as many records as the manifest has entries.
+    _write_values(store, "value6")
+    assert manifest_path.read_bytes() != snapshot
+    assert len(journal_path.read_bytes().splitlines()) == 1
+    assert _manifest_ids(other) == _manifest_ids(store)
+    assert len(_manifest_ids(other)) == 8
+
+
+def test_journal_partial_record(tmp_path) -> None:
+    """A record left partially written is ignored, then overwritten."""
+    store = _create_store(tmp_path)
+    journal_path = Path(_version_path(tmp_path), JOURNAL_FILENAME)
+    with journal_path.open("ab") as f:
+        f.write(b'{"id":"value9","entry":')
+
+    other = artifact_store_creators.create_fs_store(tmp_path)
+    assert _manifest_ids(other) == ["spec0", "value0", "value1"]
+
+    _write_values(other, "value2")
+    assert _manifest_ids(store) == ["spec0", "value0", "value1", "value2"]
+    with _session(store) as handle:
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+        assert manifest == handle.rebuild_manifest(MODEL_ID, VERSION_ID)
+
+
+def test_reads_racing_deletes(tmp_path) -> None:
+    """Artifacts deleted after the manifest was read are not found."""
+    store = _create_store(tmp_path)
+    with _session(store) as handle:
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+        handle.delete_artifact(MODEL_ID, VERSION_ID, "value1")
+
+        with pytest.raises(errors.ErrorNotFound):
+            handle._read_artifact_file(
+                MODEL_ID, VERSION_ID, "value1", manifest.entries["value1"]
+            )
+        artifacts = handle._read_artifact_files(
+            MODEL_ID, VERSION_ID, manifest, manifest.identifiers()
+        )
+    assert [a.header.identifier for a in artifacts] == ["spec0", "value0"]
+
+
+def test_rebuild_manifests(tmp_path) -> None:
+    """Rebuilding repairs manifests that drifted from the artifact files."""
+    store = _create_store(tmp_path)
+    Path(_version_path(tmp_path), "value1.json").unlink()
+
+    with _session(store) as handle:
+        assert handle.rebuild_manifests() == 1
+        artifacts = handle.read_artifacts(MODEL_ID, VERSION_ID)
+
+    assert [a.header.identifier for a in artifacts] == ["spec0", "value0"]
+
+
+def test_concurrent_writers(tmp_path) -> None:
+    """Concurrent sessions writing to the same version do not lose manifest updates."""
+    store = _create_store(tmp_path)
+
+    def write(i: int) -> None:
+        with _session(store) as handle:
+            handle.write_artifact(
+                MODEL_ID,
+                VERSION_ID,
+                ArtifactFactory.make(ArtifactType.VALUE, f"concurrent{i}"),
+            )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(write, range(32)))
+
+    with _session(store) as handle:
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+    assert len(manifest.entries) == 3 + 32
+    assert manifest == handle.rebuild_manifest(MODEL_ID, VERSION_ID)
+
+
+def _write_in_process(tmp_path: Path, process: int) -> None:
+    """Write artifacts to the test version, from a store of its own."""
+    store = artifact_store_creators.create_fs_store(tmp_path)
+    with _session(store) as handle:
+        for i in range(8):
+            handle.write_artifact(
+                MODEL_ID,
+                VERSION_ID,
+                ArtifactFactory.make(
+                    ArtifactType.VALUE, f"process{process}_{i}"
+                ),
+            )
+
+
+def test_concurrent_processes(tmp_path) -> None:
+    """Processes writing to the same version, as backend workers do, do not lose manifest updates."""
+    store = _create_store(tmp_path)
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_write_in_process, [tmp_path] * 4, range(4)))
+
+    with _session(store) as handle:
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+    assert len(manifest.entries) == 3 + 4 * 8
+    assert manifest == handle.rebuild_manifest(MODEL_ID, VERSION_ID)
+
+
+def test_writes_leave_no_temporary_files(tmp_path) -> None:
+    """Atomic writes clean up after themselves, also when batched."""
+    store = _create_store(tmp_path)
+    with _session(store) as handle:
+        with handle.group_commit():
+            for i in range(5):
+                handle.write_artifact(
+                    MODEL_ID,
+                    VERSION_ID,
+                    ArtifactFactory.make(ArtifactType.VALUE, f"batch{i}"),
+                )
+        assert len(handle.read_artifacts(MODEL_ID, VERSION_ID)) == 3 + 5
+
+    assert not list(_version_path(tmp_path).glob("*.tmp"))
+
+
+def test_codec_selected_by_uri(tmp_path) -> None:
+    """The codec URI parameter selects the encoding of new artifact files."""
+    store = typing.cast(
+        LocalFileSystemStore,
+        create_store(
+            f"{StoreURIPrefix.LOCAL_FILESYSTEM[1]}{tmp_path}?codec=gzip"
+        ),
+    )
+    artifact = ArtifactFactory.make(ArtifactType.VALUE, "value0")
+    with _session(store) as handle:
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        handle.write_artifact(MODEL_ID, VERSION_ID, artifact)
+
+        assert handle.read_artifact(MODEL_ID, VERSION_ID, "value0") == artifact
+    assert Path(_version_path(tmp_path), "value0.json.gz").exists()
+
+
+def test_mixed_codecs(tmp_path) -> None:
+    """Artifacts written with different codecs can all be read back."""
+    _create_store(tmp_path)
+    store = typing.cast(
+        LocalFileSystemStore,
+        create_store(
+            f"{StoreURIPrefix.LOCAL_FILESYSTEM[1]}{tmp_path}"
+            "?codec=json-compact"
+        ),
+    )
+    with _session(store) as handle:
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, "value2"),
+        )
+        store.storage.codec = get_codec("gzip")
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.VALUE, "value0"),
+            force=True,
+        )
+
+        manifest = handle._read_manifest(MODEL_ID, VERSION_ID)
+        assert len(handle.read_artifacts(MODEL_ID, VERSION_ID)) == 4
+
+        # Compact and pretty JSON files are told apart only by the manifest.
+        handle.rebuild_manifest(MODEL_ID, VERSION_ID)
+        assert len(handle.read_artifacts(MODEL_ID, VERSION_ID)) == 4
+
+    assert manifest.entries["value0"].codec == "gzip"
+    assert not Path(_version_path(tmp_path), "value0.json").exists()
+
+
+def test_unknown_codec(tmp_path) -> None:
+    """An unknown codec is rejected when the store is created."""
+    with pytest.raises(ValueError):
+        create_store(
+            f"{StoreURIPrefix.LOCAL_FILESYSTEM[1]}{tmp_path}?codec=xml"
+        )
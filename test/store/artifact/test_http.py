@@ -0,0 +1,247 @@
+"""
+test/store/artifact/test_http.py
+
+Unit tests for the HTTP artifact store implementation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import pytest
+
+import mlte.backend.api.codes as codes
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.backend.core.config import settings
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.blob import blob_digest
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.http import (
+    AsyncHttpArtifactStore,
+    HttpArtifactStore,
+)
+from mlte.store.base import StoreURI
+from mlte.store.common.http_clients import RequestsClient
+from mlte.value.model import ImageValueModel
+from mlte.value.types.image import Image
+from test.backend.fixture.http import (
+    TEST_BASE_URL,
+    FastAPITestHttpClient,
+    setup_API_and_async_client,
+)
+from test.store.artifact.artifact_store_creators import FAKE_URI
+
+from ...fixture.artifact import ArtifactFactory
+from .fixture import http_store  # noqa
+
+
+class AuthenticationCounter:
+    """Counts the token requests made by a client."""
+
+    def __init__(self, client: FastAPITestHttpClient) -> None:
+        self.count = 0
+        self._authenticate = client.authenticate
+        client.authenticate = self  # type: ignore[method-assign]
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+        self._authenticate(*args, **kwargs)
+
+
+def test_blob_digest_checked(http_store: HttpArtifactStore) -> None:  # noqa
+    """Blobs that do not match their digest are rejected."""
+    digest = blob_digest(b"content")
+    url = f"{http_store.uri.uri}{settings.API_PREFIX}/blob/{digest}"
+    res = http_store.client.put(url, data=b"other content")
+    assert res.status_code == codes.BAD_REQUEST
+
+    with ManagedArtifactSession(http_store.session()) as handle:
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob(digest)
+
+
+def test_token_reused(http_store: HttpArtifactStore) -> None:  # noqa
+    """Sessions of a store reuse the token while it is valid."""
+    client = typing.cast(FastAPITestHttpClient, http_store.client)
+    counter = AuthenticationCounter(client)
+
+    for i in range(3):
+        with ManagedArtifactSession(http_store.session()) as handle:
+            handle.create_model(ModelCreate(identifier=f"model{i}"))
+    assert counter.count == 1
+
+    # An expiring token is renewed before it is used.
+    client.token_expiry = 0
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.read_model("model0")
+    assert counter.count == 2
+
+
+def test_reauthenticate_on_unauthorized(
+    http_store: HttpArtifactStore,  # noqa
+) -> None:
+    """A rejected token is replaced, and the request retried once."""
+    client = typing.cast(FastAPITestHttpClient, http_store.client)
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.create_model(ModelCreate(identifier="model"))
+
+        counter = AuthenticationCounter(client)
+        client._store_token("invalid")
+        assert handle.read_model("model").identifier == "model"
+        assert counter.count == 1
+
+
+def test_conditional_reads(http_store: HttpArtifactStore) -> None:  # noqa
+    """Repeated reads of unchanged artifacts are revalidated, not resent."""
+    client = typing.cast(FastAPITestHttpClient, http_store.client)
+    statuses: typing.List[int] = []
+    get = client.client.get
+
+    def recording_get(*args, **kwargs):
+        response = get(*args, **kwargs)
+        statuses.append(response.status_code)
+        return response
+
+    client.client.get = recording_get  # type: ignore[method-assign]
+
+    spec = ArtifactFactory.make(ArtifactType.SPEC, "spec", complete=True)
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.write_artifact("model", "version", spec, parents=True)
+        first = handle.read_artifact("model", "version", "spec")
+        assert handle.read_artifacts("model", "version") == [first]
+
+    with ManagedArtifactSession(http_store.session()) as handle:
+        assert handle.read_artifact("model", "version", "spec") == first
+        assert handle.read_artifacts("model", "version") == [first]
+    assert statuses == [200, 200, 304, 304]
+
+    # A changed artifact is sent again.
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.write_artifact(
+            "model",
+            "version",
+            ArtifactFactory.make(ArtifactType.SPEC, "spec"),
+            force=True,
+        )
+        assert handle.read_artifact("model", "version", "spec") != first
+    assert statuses[-1] == 200
+
+
+def test_read_evicted(http_store: HttpArtifactStore) -> None:  # noqa
+    """A body evicted while its conditional read is in flight is still used."""
+    client = typing.cast(FastAPITestHttpClient, http_store.client)
+    statuses: typing.List[int] = []
+    get = client.client.get
+
+    def evicting_get(*args, **kwargs):
+        # Another thread fills the cache meanwhile.
+        http_store.cache._entries.clear()
+        response = get(*args, **kwargs)
+        statuses.append(response.status_code)
+        return response
+
+    spec = ArtifactFactory.make(ArtifactType.SPEC, "spec", complete=True)
+    with ManagedArtifactSession(http_store.session()) as handle:
+        handle.write_artifact("model", "version", spec, parents=True)
+        first = handle.read_artifact("model", "version", "spec")
+
+        client.client.get = evicting_get  # type: ignore[method-assign]
+        assert handle.read_artifact("model", "version", "spec") == first
+        assert handle.read_artifact("model", "version", "spec") == first
+    assert statuses == [304, 304]
+
+
+def test_default_client_not_shared() -> None:
+    """Each store gets its own pooled client by default."""
+    first = HttpArtifactStore(StoreURI.from_string(FAKE_URI))
+    second = HttpArtifactStore(StoreURI.from_string(FAKE_URI))
+    assert isinstance(first.client, RequestsClient)
+    assert first.client is not second.client
+
+
+def test_async_store() -> None:
+    """The async store supports the operations of the store session interface."""
+    store = AsyncHttpArtifactStore(
+        StoreURI.from_string(TEST_BASE_URL), setup_API_and_async_client()
+    )
+
+    async def run() -> None:
+        async with store.session() as handle:
+            await handle.create_model(ModelCreate(identifier="model"))
+            await handle.create_version(
+                "model", VersionCreate(identifier="version")
+            )
+            assert await handle.list_models() == ["model"]
+            assert await handle.list_versions("model") == ["version"]
+
+            spec = ArtifactFactory.make(ArtifactType.SPEC, "spec")
+            written = await handle.write_artifact("model", "version", spec)
+            assert (
+                await handle.read_artifact("model", "version", "spec")
+                == written
+            )
+
+            image = Image(
+                EvidenceMetadata(
+                    measurement_type="typename",
+                    identifier=Identifier(name="id"),
+                ),
+                b"image" * 1024,
+            ).to_model()
+            await handle.write_artifact("model", "version", image)
+            read = await handle.read_artifact(
+                "model", "version", image.header.identifier
+            )
+            value = read.body.value  # type: ignore[union-attr]
+            assert isinstance(value, ImageValueModel) and value.blob is not None
+            assert await handle.read_blob(value.blob) == b"image" * 1024
+
+            assert len(await handle.read_artifacts("model", "version")) == 2
+            assert [
+                artifact.header.identifier
+                async for artifact in handle.iter_artifacts("model", "version")
+            ] == ["spec", image.header.identifier]
+            await handle.delete_artifact("model", "version", "spec")
+            assert len(await handle.read_artifacts("model", "version")) == 1
+        await store.close()
+
+    asyncio.run(run())
+
+
+def test_async_gather() -> None:
+    """Concurrent reads and writes report the outcome of each artifact."""
+    store = AsyncHttpArtifactStore(
+        StoreURI.from_string(TEST_BASE_URL), setup_API_and_async_client()
+    )
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, f"card{i}")
+        for i in range(20)
+    ]
+
+    async def run() -> None:
+        async with store.session() as handle:
+            results = await handle.gather_write(
+                "model", "version", artifacts, parents=True, concurrency=4
+            )
+            assert all(isinstance(r, ArtifactModel) for r in results)
+
+            results = await handle.gather_write(
+                "model", "version", artifacts[:1]
+            )
+            assert isinstance(results[0], errors.ErrorAlreadyExists)
+
+            ids = ["missing"] + [a.header.identifier for a in artifacts]
+            results = await handle.gather_read("model", "version", ids)
+            assert isinstance(results[0], errors.ErrorNotFound)
+            assert [
+                r.header.identifier
+                for r in results[1:]
+                if isinstance(r, ArtifactModel)
+            ] == ids[1:]
+        await store.close()
+
+    asyncio.run(run())
@@ -11,11 +11,14 @@ from mlte.store.artifact.query import (
     AllFilter,
     AndFilter,
     ArtifactIdentifierFilter,
+    ArtifactIdentifierPrefixFilter,
     ArtifactTypeFilter,
     FilterType,
     NoneFilter,
     OrFilter,
+    index_candidates,
 )
+from mlte.store.artifact.underlying.memory import VersionIndex
 
 from ...fixture.artifact import ArtifactFactory, TypeUtil
 
@@ -65,6 +68,27 @@ def test_identifier_match(artifact_type: ArtifactType) -> None:
     assert not filter.match(b)
 
 
+def test_identifier_prefix() -> None:
+    """The identifier prefix filter can be serialized and deserialized."""
+    f = ArtifactIdentifierPrefixFilter(
+        type=FilterType.IDENTIFIER_PREFIX, prefix="id"
+    )
+    assert ArtifactIdentifierPrefixFilter(**f.model_dump()) == f
+
+
+@pytest.mark.parametrize("artifact_type", ArtifactType)
+def test_identifier_prefix_match(artifact_type: ArtifactType) -> None:
+    """The identifier prefix filter matches the expected artifacts."""
+    a = ArtifactFactory.make(artifact_type, "acc.value")
+    b = ArtifactFactory.make(artifact_type, "loss.value")
+
+    filter = ArtifactIdentifierPrefixFilter(
+        type=FilterType.IDENTIFIER_PREFIX, prefix="acc."
+    )
+    assert filter.match(a)
+    assert not filter.match(b)
+
+
 def test_type() -> None:
     """The type filter can be serialized and deserialized."""
     f = ArtifactTypeFilter(
@@ -125,3 +149,45 @@ def test_or() -> None:
 @pytest.mark.skip("Implement.")
 def test_or_match() -> None:
     assert True
+
+
+def test_index_candidates() -> None:
+    """Indexes narrow down filters wherever the filter tree allows it."""
+    index = VersionIndex()
+    for type, id in [
+        (ArtifactType.VALUE, "acc.value"),
+        (ArtifactType.VALUE, "loss.value"),
+        (ArtifactType.SPEC, "spec"),
+    ]:
+        index.add(ArtifactFactory.make(type, id).header)
+
+    all = AllFilter(type=FilterType.ALL)
+    values = ArtifactTypeFilter(
+        type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+    )
+    acc = ArtifactIdentifierPrefixFilter(
+        type=FilterType.IDENTIFIER_PREFIX, prefix="acc"
+    )
+    spec = ArtifactIdentifierFilter(
+        type=FilterType.IDENTIFIER, artifact_id="spec"
+    )
+
+    assert index_candidates(all, index) is None
+    assert index_candidates(NoneFilter(type=FilterType.NONE), index) == set()
+    assert index_candidates(values, index) == {"acc.value", "loss.value"}
+    assert index_candidates(
+        AndFilter(type=FilterType.AND, filters=[all, values, acc]), index
+    ) == {"acc.value"}
+    assert index_candidates(
+        OrFilter(type=FilterType.OR, filters=[acc, spec]), index
+    ) == {"acc.value", "spec"}
+    assert (
+        index_candidates(
+            OrFilter(type=FilterType.OR, filters=[acc, all]), index
+        )
+        is None
+    )
+
+    index.remove("acc.value")
+    assert index_candidates(values, index) == {"loss.value"}
+    assert index_candidates(acc, index) == set()
@@ -0,0 +1,173 @@
+"""
+test/store/artifact/test_rdbs.py
+
+Unit tests for the relational DB artifact store implementation.
+"""
+
+from __future__ import annotations
+
+import typing
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+import mlte.store.error as errors
+from mlte.artifact.model import ArtifactModel
+from mlte.artifact.type import ArtifactType
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.rdbs.store import RelationalDBStore
+from mlte.store.base import StoreURI
+from mlte.validation.model import ValidatedSpecModel
+from test.store.artifact import artifact_store_creators
+
+from ...fixture.artifact import (
+    ArtifactFactory,
+    make_complete_validated_spec_model,
+)
+
+MODEL_ID = "model0"
+VERSION_ID = "version0"
+
+
+class QueryCounter:
+    """Counts the SQL statements executed by an engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+def _make_artifacts(count: int) -> Iterator[ArtifactModel]:
+    """Make `count` complete artifacts of every type, with linked validated specs."""
+    for i in range(count):
+        for type in ArtifactType:
+            artifact = ArtifactFactory.make(
+                type, f"{type.value}{i}", complete=True
+            )
+            if type == ArtifactType.VALIDATED_SPEC:
+                validated_spec = make_complete_validated_spec_model()
+                validated_spec.spec_identifier = f"{ArtifactType.SPEC.value}{i}"
+                artifact.body = ValidatedSpecModel(**validated_spec.to_json())
+            yield artifact
+
+
+def _count_read_queries(count: int) -> int:
+    """Store `count` artifacts of each type, and count the queries needed to read them all back."""
+    store: RelationalDBStore = artifact_store_creators.create_rdbs_store()
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        written: List[ArtifactModel] = []
+        # Specs are written before the validated specs that reference them.
+        for artifact in sorted(
+            _make_artifacts(count),
+            key=lambda a: a.header.type != ArtifactType.SPEC,
+        ):
+            written.append(
+                handle.write_artifact(MODEL_ID, VERSION_ID, artifact)
+            )
+
+        counter = QueryCounter()
+        event.listen(store.engine, "before_cursor_execute", counter)
+        try:
+            read = handle.read_artifacts(MODEL_ID, VERSION_ID, limit=1000)
+        finally:
+            event.remove(store.engine, "before_cursor_execute", counter)
+
+        # The bulk-loaded artifacts are the same as the ones read one by one.
+        assert len(read) == len(written)
+        for artifact in read:
+            assert artifact == handle.read_artifact(
+                MODEL_ID, VERSION_ID, artifact.header.identifier
+            )
+
+    return counter.count
+
+
+@pytest.mark.parametrize("count", [3, 10])
+def test_read_artifacts_query_count(count: int) -> None:
+    """Reading artifacts uses a fixed number of queries, regardless of how many there are."""
+    assert _count_read_queries(count) == _count_read_queries(1)
+
+
+def test_pool_settings_from_uri(tmp_path) -> None:
+    """Connection pool settings are read from the store URI, and not passed to the driver."""
+    store = RelationalDBStore(
+        StoreURI.from_string(
+            f"sqlite:///{tmp_path}/store.db?pool_size=3&pool_recycle=60"
+        )
+    )
+    pool = typing.cast(QueuePool, store.engine.pool)
+    assert pool.size() == 3
+    assert pool._recycle == 60
+    assert store.engine.url.query == {}
+
+
+def test_session_close_keeps_pool(tmp_path) -> None:
+    """Closing a session returns its connections to the store pool instead of discarding it."""
+    store = RelationalDBStore(
+        StoreURI.from_string(f"sqlite:///{tmp_path}/store.db")
+    )
+    pool = typing.cast(QueuePool, store.engine.pool)
+
+    for _ in range(3):
+        with ManagedArtifactSession(store.session()) as handle:
+            _ = handle.list_models()
+
+    assert store.engine.pool is pool
+    assert pool.checkedout() == 0
+
+
+def _validated_spec(identifier: str, spec_identifier: str) -> ArtifactModel:
+    """Make a validated spec of the given spec."""
+    artifact = ArtifactFactory.make(
+        ArtifactType.VALIDATED_SPEC, identifier, complete=True
+    )
+    validated_spec = make_complete_validated_spec_model()
+    validated_spec.spec_identifier = spec_identifier
+    artifact.body = ValidatedSpecModel(**validated_spec.to_json())
+    return artifact
+
+
+def test_write_artifacts_partial_failure() -> None:
+    """A batch item that fails is undone alone, and the others are written."""
+    store: RelationalDBStore = artifact_store_creators.create_rdbs_store()
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=MODEL_ID))
+        handle.create_version(MODEL_ID, VersionCreate(identifier=VERSION_ID))
+        handle.write_artifact(
+            MODEL_ID,
+            VERSION_ID,
+            ArtifactFactory.make(ArtifactType.SPEC, "spec0", complete=True),
+        )
+        handle.write_artifact(
+            MODEL_ID, VERSION_ID, _validated_spec("validated0", "spec0")
+        )
+
+        # The replacement of validated0 refers to a missing spec.
+        results = handle.write_artifacts(
+            MODEL_ID,
+            VERSION_ID,
+            [
+                ArtifactFactory.make(ArtifactType.VALUE, "value0"),
+                _validated_spec("validated0", "missing"),
+                ArtifactFactory.make(ArtifactType.VALUE, "value1"),
+            ],
+            force=True,
+        )
+        assert isinstance(results[0], ArtifactModel)
+        assert isinstance(results[1], errors.ErrorNotFound)
+        assert isinstance(results[2], ArtifactModel)
+
+        # The forced overwrite of the failed item was undone.
+        validated = handle.read_artifact(MODEL_ID, VERSION_ID, "validated0")
+        assert validated.body.spec_identifier == "spec0"  # type: ignore[union-attr]
+        assert sorted(
+            a.header.identifier
+            for a in handle.read_artifacts(MODEL_ID, VERSION_ID)
+        ) == ["spec0", "validated0", "value0", "value1"]
@@ -4,17 +4,34 @@ test/store/test_underlying.py
 Unit tests for the underlying artifact store implementations.
 """
 
+import base64
+from typing import List
+
 import pytest
 
 import mlte.store.error as errors
 from mlte.artifact.model import ArtifactModel
 from mlte.artifact.type import ArtifactType
 from mlte.context.model import ModelCreate, VersionCreate
+from mlte.evidence.metadata import EvidenceMetadata, Identifier
+from mlte.store.artifact.blob import blob_digest
+from mlte.store.artifact.query import (
+    AndFilter,
+    ArtifactIdentifierFilter,
+    ArtifactIdentifierPrefixFilter,
+    ArtifactTypeFilter,
+    FilterType,
+    NoneFilter,
+    OrFilter,
+    Query,
+)
 from mlte.store.artifact.store import (
     ArtifactStore,
     ArtifactStoreSession,
     ManagedArtifactSession,
 )
+from mlte.value.model import ImageValueModel
+from mlte.value.types.image import Image
 from test.backend.fixture.api import TEST_API_USER
 from test.store.artifact import artifact_store_creators
 
@@ -183,6 +200,197 @@ def test_search(
         assert len(artifacts) == 2
 
 
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_search_filters(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store only returns the artifacts that match a filter."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=model_id))
+        handle.create_version(model_id, VersionCreate(identifier=version_id))
+
+        for artifact in [
+            ArtifactFactory.make(ArtifactType.VALUE, "value0"),
+            ArtifactFactory.make(ArtifactType.VALUE, "value1"),
+            ArtifactFactory.make(ArtifactType.SPEC, "spec0"),
+            ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "card0"),
+        ]:
+            handle.write_artifact(model_id, version_id, artifact)
+
+        def search(query: Query) -> List[str]:
+            return sorted(
+                artifact.header.identifier
+                for artifact in handle.search_artifacts(
+                    model_id, version_id, query
+                )
+            )
+
+        value_filter = ArtifactTypeFilter(
+            type=FilterType.TYPE, artifact_type=ArtifactType.VALUE
+        )
+        spec0_filter = ArtifactIdentifierFilter(
+            type=FilterType.IDENTIFIER, artifact_id="spec0"
+        )
+        value1_filter = ArtifactIdentifierFilter(
+            type=FilterType.IDENTIFIER, artifact_id="value1"
+        )
+
+        assert search(Query(filter=value_filter)) == ["value0", "value1"]
+        assert search(Query(filter=spec0_filter)) == ["spec0"]
+        assert search(
+            Query(
+                filter=AndFilter(
+                    type=FilterType.AND, filters=[value_filter, value1_filter]
+                )
+            )
+        ) == ["value1"]
+        assert search(
+            Query(
+                filter=OrFilter(
+                    type=FilterType.OR, filters=[value_filter, spec0_filter]
+                )
+            )
+        ) == ["spec0", "value0", "value1"]
+        assert search(
+            Query(
+                filter=ArtifactIdentifierPrefixFilter(
+                    type=FilterType.IDENTIFIER_PREFIX, prefix="value"
+                )
+            )
+        ) == ["value0", "value1"]
+        # Prefixes match case-sensitively in every store.
+        assert (
+            search(
+                Query(
+                    filter=ArtifactIdentifierPrefixFilter(
+                        type=FilterType.IDENTIFIER_PREFIX, prefix="VALUE"
+                    )
+                )
+            )
+            == []
+        )
+        assert search(Query(filter=NoneFilter(type=FilterType.NONE))) == []
+
+        # Searches stay consistent as artifacts are overwritten and deleted.
+        handle.write_artifact(
+            model_id,
+            version_id,
+            ArtifactFactory.make(ArtifactType.SPEC, "value1"),
+            force=True,
+        )
+        handle.delete_artifact(model_id, version_id, "spec0")
+        assert search(Query(filter=value_filter)) == ["value0"]
+        assert search(
+            Query(
+                filter=OrFilter(
+                    type=FilterType.OR, filters=[value_filter, spec0_filter]
+                )
+            )
+        ) == ["value0"]
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_read_artifacts_pages(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store can page through artifacts by offset or by cursor."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+    artifact_ids = [f"value{i}" for i in range(5)]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=model_id))
+        handle.create_version(model_id, VersionCreate(identifier=version_id))
+
+        for artifact_id in artifact_ids:
+            handle.write_artifact(
+                model_id,
+                version_id,
+                ArtifactFactory.make(ArtifactType.VALUE, artifact_id),
+            )
+
+        offset_pages = [
+            [
+                artifact.header.identifier
+                for artifact in handle.read_artifacts(
+                    model_id, version_id, limit=2, offset=offset
+                )
+            ]
+            for offset in range(0, len(artifact_ids), 2)
+        ]
+        assert offset_pages == [
+            ["value0", "value1"],
+            ["value2", "value3"],
+            ["value4"],
+        ]
+
+        cursor_pages: List[List[str]] = []
+        cursor = None
+        while True:
+            page = handle.read_artifacts(
+                model_id, version_id, limit=2, cursor=cursor
+            )
+            if len(page) == 0:
+                break
+            cursor_pages.append(
+                [artifact.header.identifier for artifact in page]
+            )
+            cursor = page[-1].header.identifier
+        assert cursor_pages == offset_pages
+
+        # A deleted cursor artifact, e.g. by a concurrent edit, is resumed after.
+        handle.delete_artifact(model_id, version_id, "value1")
+        assert [
+            artifact.header.identifier
+            for artifact in handle.read_artifacts(
+                model_id, version_id, limit=2, cursor="value1"
+            )
+        ] == ["value2", "value3"]
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_iter_artifacts(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """An artifact store can iterate lazily over all artifacts in a version."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    with ManagedArtifactSession(store.session()) as handle:
+        with pytest.raises(errors.ErrorNotFound):
+            next(handle.iter_artifacts(model_id, version_id))
+
+        handle.create_model(ModelCreate(identifier=model_id))
+        handle.create_version(model_id, VersionCreate(identifier=version_id))
+        assert list(handle.iter_artifacts(model_id, version_id)) == []
+
+        for i in range(7):
+            handle.write_artifact(
+                model_id,
+                version_id,
+                ArtifactFactory.make(ArtifactType.VALUE, f"value{i}"),
+            )
+
+        expected = handle.read_artifacts(model_id, version_id)
+        for batch_size in [2, 7, 100]:
+            assert (
+                list(handle.iter_artifacts(model_id, version_id, batch_size))
+                == expected
+            )
+
+        with pytest.raises(ValueError):
+            handle.iter_artifacts(model_id, version_id, 0)
+
+
 @pytest.mark.parametrize(
     "store_fixture_name,artifact_type,complete", artifact_stores_and_types()
 )
@@ -325,3 +533,164 @@ def test_artifact_overwrite(
 
         # Attempt to write with `force` succeeds
         _ = handle.write_artifact(model_id, version_id, artifact, force=True)
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_artifact_batch(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """A batch of artifacts can be written and read, with per-item results."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    version_id = "version0"
+
+    def image(identifier: str) -> ArtifactModel:
+        return Image(
+            EvidenceMetadata(
+                measurement_type="typename",
+                identifier=Identifier(name=identifier),
+            ),
+            b"shared image" * 1024,
+        ).to_model()
+
+    existing = ArtifactFactory.make(ArtifactType.SPEC, "existing")
+    artifacts = [
+        ArtifactFactory.make(ArtifactType.NEGOTIATION_CARD, "card"),
+        existing,
+        image("image0"),
+        image("image1"),
+        ArtifactFactory.make(ArtifactType.REPORT, "card"),
+    ]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        # Without parents, every item fails.
+        results = handle.write_artifacts(model_id, version_id, artifacts)
+        assert all(isinstance(r, errors.ErrorNotFound) for r in results[:4])
+        assert isinstance(results[4], errors.ErrorAlreadyExists)
+
+        handle.create_model(ModelCreate(identifier=model_id))
+        handle.create_version(model_id, VersionCreate(identifier=version_id))
+        handle.write_artifact(model_id, version_id, existing)
+
+        results = handle.write_artifacts(
+            model_id, version_id, artifacts, parents=True
+        )
+        assert len(results) == len(artifacts)
+        assert isinstance(results[0], ArtifactModel)
+        assert isinstance(results[1], errors.ErrorAlreadyExists)
+        assert isinstance(results[2], ArtifactModel)
+        assert isinstance(results[3], ArtifactModel)
+        assert isinstance(results[4], errors.ErrorAlreadyExists)
+
+        # With `force`, existing artifacts are overwritten.
+        results = handle.write_artifacts(
+            model_id, version_id, artifacts[:2], force=True
+        )
+        assert all(isinstance(r, ArtifactModel) for r in results)
+
+        ids = [
+            artifacts[3].header.identifier,
+            "missing",
+            "card",
+            "existing",
+            artifacts[2].header.identifier,
+        ]
+        results = handle.read_artifacts_by_ids(model_id, version_id, ids)
+        assert isinstance(results[1], errors.ErrorNotFound)
+        assert [
+            r.header.identifier if isinstance(r, ArtifactModel) else None
+            for r in results
+        ] == [ids[0], None, ids[2], ids[3], ids[4]]
+        assert results[2].header.type == ArtifactType.NEGOTIATION_CARD  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_blob(store_fixture_name: str, request: pytest.FixtureRequest) -> None:
+    """An artifact store supports content-addressed blob operations."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    content = bytes(range(256)) * 1024
+
+    with ManagedArtifactSession(store.session()) as handle:
+        digest = handle.write_blob(content)
+        assert digest == blob_digest(content)
+        assert handle.read_blob(digest) == content
+
+        # Writing the same content again is a no-op.
+        assert handle.write_blob(content) == digest
+
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob(blob_digest(b"missing"))
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_blob_chunks(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Blobs can be written and read in chunks, checked against their digest."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    content = bytes(range(256)) * 1024
+    digest = blob_digest(content)
+    chunks = [content[i : i + 1000] for i in range(0, len(content), 1000)]
+
+    with ManagedArtifactSession(store.session()) as handle:
+        with pytest.raises(ValueError):
+            handle.write_blob_chunks(chunks[:-1], digest)
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob(digest)
+
+        assert handle.write_blob_chunks(iter(chunks), digest) == digest
+        size, read = handle.read_blob_chunks(digest)
+        assert size == len(content)
+        assert b"".join(read) == content
+
+        with pytest.raises(errors.ErrorNotFound):
+            handle.read_blob_chunks(blob_digest(b"missing"))
+
+
+@pytest.mark.parametrize("store_fixture_name", artifact_stores())
+def test_artifact_blob(
+    store_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    """Image data is stored once, out of line, and referenced by digest."""
+    store: ArtifactStore = request.getfixturevalue(store_fixture_name)
+
+    model_id = "model0"
+    image = b"not really an image" * 1024
+    artifact = Image(
+        EvidenceMetadata(
+            measurement_type="typename", identifier=Identifier(name="id")
+        ),
+        image,
+    ).to_model()
+
+    with ManagedArtifactSession(store.session()) as handle:
+        handle.create_model(ModelCreate(identifier=model_id))
+        for version_id in ["version0", "version1"]:
+            handle.create_version(
+                model_id, VersionCreate(identifier=version_id)
+            )
+            handle.write_artifact(model_id, version_id, artifact)
+
+        digests = set()
+        for version_id in ["version0", "version1"]:
+            read = handle.read_artifact(
+                model_id, version_id, artifact.header.identifier
+            )
+            value = read.body.value  # type: ignore[union-attr]
+            assert isinstance(value, ImageValueModel)
+            assert value.data is None
+            assert value.blob is not None
+            digests.add(value.blob)
+
+        assert digests == {blob_digest(image)}
+        assert handle.read_blob(blob_digest(image)) == image
+
+
+def test_blob_inline_compatible() -> None:
+    """Artifacts with inline payloads written before blobs still load."""
+    model = ImageValueModel(data=base64.encodebytes(b"image").decode("utf-8"))
+    assert model.blob is None
+    assert ImageValueModel(**model.to_json()) == model
@@ -4,6 +4,8 @@ test/store/user/test_underlying.py
 Unit tests for the underlying user store implementations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import mlte.store.error as errors
@@ -12,6 +14,7 @@ from mlte.user.model import BasicUser, UserCreate
 from mlte.user.model_logic import are_users_equal
 
 from .fixture import (  # noqa
+    create_fs_store,
     create_memory_store,
     create_rdbs_store,
     fs_store,
@@ -80,3 +83,20 @@ def test_user(store_fixture_name: str, request: pytest.FixtureRequest) -> None:
         handle.delete_user(test_user.username)
         with pytest.raises(errors.ErrorNotFound):
             handle.read_user(test_user.username)
+
+
+def test_fs_concurrent_create(tmp_path) -> None:
+    """Stores sharing a folder, as backend workers do, create a user only once."""
+    user = get_test_user()
+
+    def create(_: int) -> bool:
+        store = create_fs_store(tmp_path)
+        try:
+            store.session().create_user(user)
+            return True
+        except errors.ErrorAlreadyExists:
+            return False
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        created = list(executor.map(create, range(4)))
+    assert created.count(True) == 1
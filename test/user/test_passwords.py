@@ -5,6 +5,8 @@ Test the authentication operations
 """
 
 
+import pytest
+
 from mlte.user import passwords
 
 
@@ -16,3 +18,27 @@ def test_hash_verification() -> None:
     verification_success = passwords.verify_password(password, hashed_pass)
 
     assert verification_success
+
+
+def test_work_factor() -> None:
+    """New hashes use the configured work factor, and old ones still verify."""
+    password = "secret"
+    old_hash = passwords.hash_password(password)
+
+    passwords.set_work_factor(passwords.MIN_WORK_FACTOR)
+    try:
+        new_hash = passwords.hash_password(password)
+        assert new_hash.split("$")[2] == f"{passwords.MIN_WORK_FACTOR:02}"
+        assert passwords.verify_password(password, new_hash)
+        assert passwords.verify_password(password, old_hash)
+    finally:
+        passwords.set_work_factor(passwords.DEFAULT_WORK_FACTOR)
+
+
+def test_work_factor_range() -> None:
+    """Work factors that bcrypt does not support are rejected."""
+    with pytest.raises(ValueError):
+        passwords.set_work_factor(passwords.MIN_WORK_FACTOR - 1)
+    with pytest.raises(ValueError):
+        passwords.set_work_factor(passwords.MAX_WORK_FACTOR + 1)
+    assert passwords.get_work_factor() == passwords.DEFAULT_WORK_FACTOR
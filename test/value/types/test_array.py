@@ -6,6 +6,7 @@ Unit tests for Array.
 
 from __future__ import annotations
 
+import typing
 from typing import Tuple
 
 import pytest
@@ -13,6 +14,7 @@ import pytest
 from mlte.context.context import Context
 from mlte.evidence.metadata import EvidenceMetadata, Identifier
 from mlte.measurement import Measurement
+from mlte.store.artifact.blob import ARRAY_BLOB_THRESHOLD
 from mlte.store.artifact.store import ArtifactStore
 from mlte.value.types.array import Array
 from test.store.artifact.fixture import store_with_context  # noqa
@@ -85,6 +87,25 @@ def test_save_load(
     assert loaded == o
 
 
+def test_save_load_large(
+    store_with_context: Tuple[ArtifactStore, Context]  # noqa
+) -> None:
+    """Large arrays are stored out of line, and fetched on first access."""
+    store, ctx = store_with_context
+
+    m = EvidenceMetadata(
+        measurement_type="typename", identifier=Identifier(name="id")
+    )
+    o = Array(m, list(range(ARRAY_BLOB_THRESHOLD)))
+    o.save_with(ctx, store)
+
+    loaded = typing.cast(
+        Array, Array.load_with("id.value", context=ctx, store=store)
+    )
+    assert loaded._array is None
+    assert loaded == o
+
+
 def test_get_as_real():
     m = EvidenceMetadata(
         measurement_type="typename", identifier=Identifier(name="id")
@@ -0,0 +1,121 @@
+"""
+tools/fs_codec_benchmark.py
+
+A tool for comparing the codecs of the file system artifact store.
+
+For each available codec, writes and reads back the complete test fixture
+artifacts, and reports the write and read latency and the size on disk.
+
+Run it as a module from the repository root, as the standard library's test
+package otherwise shadows the repository's:
+
+    python -m tools.fs_codec_benchmark
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from mlte.artifact.model import ArtifactModel
+from mlte.context.model import ModelCreate, VersionCreate
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.fs import LocalFileSystemStore
+from mlte.store.base import StoreURI, StoreURIPrefix
+from mlte.store.common.fs import CODECS
+from test.fixture.artifact import ArtifactFactory, artifact_types
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+MODEL_ID = "model"
+VERSION_ID = "version"
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare file system store codecs."
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=50,
+        help="The number of copies of each fixture artifact to store.",
+    )
+    return parser.parse_args()
+
+
+def fixture_artifacts(copies: int) -> List[ArtifactModel]:
+    """Build copies of a complete artifact of each type."""
+    return [
+        ArtifactFactory.make(type, f"{type.value}{i}", complete=True)
+        for type in artifact_types()
+        for i in range(copies)
+    ]
+
+
+def benchmark(codec: str, artifacts: List[ArtifactModel]) -> None:
+    """Write and read back the artifacts with a codec, and print the results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalFileSystemStore(
+            StoreURI.from_string(
+                f"{StoreURIPrefix.LOCAL_FILESYSTEM[1]}{tmp}?codec={codec}"
+            )
+        )
+        handle = store.session()
+        with ManagedArtifactSession(handle):
+            handle.create_model(ModelCreate(identifier=MODEL_ID))
+            handle.create_version(
+                MODEL_ID, VersionCreate(identifier=VERSION_ID)
+            )
+
+            start = time.perf_counter()
+            with handle.group_commit():
+                for artifact in artifacts:
+                    handle.write_artifact(MODEL_ID, VERSION_ID, artifact)
+            write_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            read = handle.read_artifacts(
+                MODEL_ID, VERSION_ID, limit=len(artifacts)
+            )
+            read_time = time.perf_counter() - start
+            assert len(read) == len(artifacts), "Artifacts were lost."
+
+        size = sum(
+            path.stat().st_size
+            for path in Path(tmp).rglob("*")
+            if path.is_file() and not path.name.startswith(".")
+        )
+
+    print(
+        f"{codec:<14}"
+        f"{write_time * 1000 / len(artifacts):>12.3f}"
+        f"{read_time * 1000 / len(artifacts):>12.3f}"
+        f"{size / 1024:>12.1f}"
+    )
+
+
+def main() -> int:
+    args = parse_arguments()
+    artifacts = fixture_artifacts(args.copies)
+
+    print(f"{'codec':<14}{'write (ms)':>12}{'read (ms)':>12}{'disk (KiB)':>12}")
+    for name, codec in CODECS.items():
+        try:
+            codec.check()
+        except RuntimeError as e:
+            print(f"{name:<14}skipped: {e}")
+            continue
+        benchmark(name, artifacts)
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
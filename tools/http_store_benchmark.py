@@ -0,0 +1,152 @@
+"""
+tools/http_store_benchmark.py
+
+A tool for comparing the synchronous and asynchronous HTTP artifact stores.
+
+Both stores talk to an in-process backend, the same stand-in used by the test
+suite, so the numbers reflect client and API overhead rather than a network.
+Writes and reads back fixture artifacts one request at a time with the
+synchronous store, and with bounded concurrency with the asynchronous store,
+and reports the time per artifact.
+
+Run it as a module from the repository root, as the standard library's test
+package otherwise shadows the repository's:
+
+    python -m tools.http_store_benchmark
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List
+
+from mlte.artifact.model import ArtifactModel
+from mlte.store.artifact.store import ManagedArtifactSession
+from mlte.store.artifact.underlying.http import (
+    AsyncHttpArtifactStore,
+    HttpArtifactStore,
+)
+from mlte.store.base import StoreURI
+from test.backend.fixture.http import (
+    TEST_BASE_URL,
+    setup_API_and_async_client,
+    setup_API_and_test_client,
+)
+from test.fixture.artifact import ArtifactFactory, artifact_types
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+MODEL_ID = "model"
+VERSION_ID = "version"
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare the synchronous and asynchronous HTTP stores."
+    )
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=20,
+        help="The number of copies of each fixture artifact to store.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="The bound on requests in flight for the asynchronous store.",
+    )
+    return parser.parse_args()
+
+
+def fixture_artifacts(copies: int) -> List[ArtifactModel]:
+    """Build copies of a complete artifact of each type."""
+    return [
+        ArtifactFactory.make(type, f"{type.value}{i}", complete=True)
+        for type in artifact_types()
+        for i in range(copies)
+    ]
+
+
+def report(name: str, count: int, write_time: float, read_time: float):
+    """Print the time per artifact of a run."""
+    print(
+        f"{name:<14}"
+        f"{write_time * 1000 / count:>12.3f}"
+        f"{read_time * 1000 / count:>12.3f}"
+    )
+
+
+def benchmark_sync(artifacts: List[ArtifactModel]) -> None:
+    """Write and read back the artifacts one at a time, with the sync store."""
+    store = HttpArtifactStore(
+        StoreURI.from_string(TEST_BASE_URL), setup_API_and_test_client()
+    )
+    with ManagedArtifactSession(store.session()) as handle:
+        start = time.perf_counter()
+        for i, artifact in enumerate(artifacts):
+            handle.write_artifact(
+                MODEL_ID, VERSION_ID, artifact, parents=(i == 0)
+            )
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for artifact in artifacts:
+            handle.read_artifact(
+                MODEL_ID, VERSION_ID, artifact.header.identifier
+            )
+        read_time = time.perf_counter() - start
+    report("sync", len(artifacts), write_time, read_time)
+
+
+async def benchmark_async(
+    artifacts: List[ArtifactModel], concurrency: int
+) -> None:
+    """Write and read back the artifacts concurrently, with the async store."""
+    store = AsyncHttpArtifactStore(
+        StoreURI.from_string(TEST_BASE_URL), setup_API_and_async_client()
+    )
+    async with store.session() as handle:
+        start = time.perf_counter()
+        written = await handle.gather_write(
+            MODEL_ID,
+            VERSION_ID,
+            artifacts,
+            parents=True,
+            concurrency=concurrency,
+        )
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        read = await handle.gather_read(
+            MODEL_ID,
+            VERSION_ID,
+            [artifact.header.identifier for artifact in artifacts],
+            concurrency=concurrency,
+        )
+        read_time = time.perf_counter() - start
+        assert all(
+            isinstance(result, ArtifactModel) for result in written + read
+        ), "Artifacts were lost."
+    await store.close()
+    report(f"async ({concurrency})", len(artifacts), write_time, read_time)
+
+
+def main() -> int:
+    args = parse_arguments()
+    artifacts = fixture_artifacts(args.copies)
+
+    print(f"{'client':<14}{'write (ms)':>12}{'read (ms)':>12}")
+    benchmark_sync(artifacts)
+    asyncio.run(benchmark_async(artifacts, args.concurrency))
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
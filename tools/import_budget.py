@@ -0,0 +1,122 @@
+"""
+tools/import_budget.py
+
+A tool for checking the import time of MLTE entry points against a budget.
+
+Each entry point is imported in a fresh interpreter with `python -X
+importtime`, and its cumulative import time, the best of a few runs, is
+compared with its budget. Entry points must also not load the heavy
+dependencies that only some commands and stores need.
+
+To stay within budget, code that needs a heavy dependency imports it where
+it is used: the CLI subcommands import what they run, the store factories
+import each store in the branch that creates it, and the frontend and the
+OpenAI provider import their packages when first called.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+BUDGETS: Dict[str, float] = {
+    "mlte.cli.cli": 0.75,
+    "mlte.session": 0.75,
+}
+"""The import time budget of each entry point, in seconds."""
+
+HEAVY_PACKAGES = [
+    "fastapi",
+    "httpx",
+    "openai",
+    "psycopg2",
+    "requests",
+    "sqlalchemy",
+    "sqlalchemy_utils",
+    "starlette",
+    "uvicorn",
+]
+"""Packages that entry points load only when a command or store needs them."""
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(
+        description="Check the import time of MLTE entry points."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of times each entry point is imported.",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="A factor applied to all budgets, for slower machines.",
+    )
+    return parser.parse_args()
+
+
+def import_time(module: str) -> float:
+    """Get the cumulative import time of a module, in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: <self us> | <cumulative us> | <name>", and the
+    # module itself is reported after everything it imports.
+    for line in reversed(result.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1_000_000
+    raise RuntimeError(f"No import time reported for {module}.")
+
+
+def loaded_heavy_packages(module: str) -> List[str]:
+    """Get the heavy packages that importing a module loads."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, {module}; print(*sys.modules, sep='\\n')",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = {name.split(".")[0] for name in result.stdout.splitlines()}
+    return sorted(loaded.intersection(HEAVY_PACKAGES))
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    failed = False
+    print(f"{'module':<20}{'time (s)':>10}{'budget (s)':>12}")
+    for module, budget in BUDGETS.items():
+        budget *= args.scale
+        elapsed = min(import_time(module) for _ in range(args.repeat))
+        print(f"{module:<20}{elapsed:>10.3f}{budget:>12.3f}")
+        if elapsed > budget:
+            print(f"  over budget by {elapsed - budget:.3f} s")
+            failed = True
+
+        heavy = loaded_heavy_packages(module)
+        if len(heavy) > 0:
+            print(f"  loads {', '.join(heavy)}")
+            failed = True
+    return EXIT_FAILURE if failed else EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
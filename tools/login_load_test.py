@@ -0,0 +1,151 @@
+"""
+tools/login_load_test.py
+
+A load test of the latency of unrelated requests while logins are in flight.
+
+Logs in repeatedly from several concurrent clients, and meanwhile requests
+the health check endpoint one request at a time, and reports the latency
+percentiles of the health checks, with and without the logins. The backend
+runs in-process, on the same event loop as the clients, so a login that
+blocks the event loop delays every other request.
+
+Run it as a module from the repository root, as the standard library's test
+package otherwise shadows the repository's:
+
+    python -m tools.login_load_test
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+
+from mlte.backend.core.config import settings
+from mlte.backend.state import state
+from mlte.user import passwords
+from test.backend.fixture.api import (
+    TEST_API_PASS,
+    TEST_API_USER,
+    setup_api_with_mem_stores,
+)
+from test.backend.fixture.http import TEST_BASE_URL
+
+# Script exit codes
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse commandline arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure request latency while logins are in flight."
+    )
+    parser.add_argument(
+        "--logins",
+        type=int,
+        default=8,
+        help="The number of clients logging in concurrently.",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=200,
+        help="The number of health checks to time.",
+    )
+    parser.add_argument(
+        "--work-factor",
+        type=int,
+        default=settings.PASSWORD_WORK_FACTOR,
+        help="The bcrypt work factor of the password of the test user.",
+    )
+    return parser.parse_args()
+
+
+def percentile(latencies: List[float], p: float) -> float:
+    """Get a percentile of the latencies, in milliseconds."""
+    return statistics.quantiles(latencies, n=100)[int(p) - 1] * 1000
+
+
+def report(name: str, latencies: List[float], logins: int) -> None:
+    """Print the latency percentiles of a run."""
+    print(
+        f"{name:<14}"
+        f"{percentile(latencies, 50):>10.2f}"
+        f"{percentile(latencies, 99):>10.2f}"
+        f"{max(latencies) * 1000:>10.2f}"
+        f"{logins:>10}"
+    )
+
+
+async def health_checks(client: httpx.AsyncClient, count: int) -> List[float]:
+    """Time health check requests, made one at a time."""
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get(f"{settings.API_PREFIX}/healthz")
+        latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return latencies
+
+
+async def login_until(client: httpx.AsyncClient, done: asyncio.Event) -> int:
+    """Log in repeatedly until the health checks are done."""
+    logins = 0
+    while not done.is_set():
+        response = await client.post(
+            f"{settings.API_PREFIX}/token",
+            data={
+                "grant_type": "password",
+                "username": TEST_API_USER,
+                "password": TEST_API_PASS,
+            },
+        )
+        response.raise_for_status()
+        logins += 1
+    return logins
+
+
+async def benchmark(args: argparse.Namespace) -> None:
+    """Time health checks alone, and then with logins in flight."""
+    app = setup_api_with_mem_stores()
+    async with httpx.AsyncClient(app=app, base_url=TEST_BASE_URL) as client:
+        report("idle", await health_checks(client, args.requests), 0)
+
+        done = asyncio.Event()
+        logins = [
+            asyncio.ensure_future(login_until(client, done))
+            for _ in range(args.logins)
+        ]
+        latencies = await health_checks(client, args.requests)
+        done.set()
+        report(
+            f"logins ({args.logins})",
+            latencies,
+            sum(await asyncio.gather(*logins)),
+        )
+
+
+def main() -> int:
+    args = parse_arguments()
+    passwords.set_work_factor(args.work_factor)
+
+    print(
+        f"work factor {args.work_factor}, "
+        f"{settings.PASSWORD_WORKERS} password workers"
+    )
+    print(
+        f"{'load':<14}{'p50 (ms)':>10}{'p99 (ms)':>10}{'max (ms)':>10}{'logins':>10}"
+    )
+    asyncio.run(benchmark(args))
+    state.password_pool.shutdown()
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())